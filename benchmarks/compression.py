@@ -0,0 +1,82 @@
+"""
+Compares the size of request bodies sent by :class:`YTMusic` with and without compression.
+
+Usage::
+
+    python benchmarks/compression.py [--threshold 512]
+"""
+import argparse
+import json
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from ytmusicapi.helpers import encode_body, initialize_context  # noqa: E402
+
+
+def get_sample_bodies():
+    context = initialize_context()
+    context['context']['client']['hl'] = 'en'
+    video_ids = ['%011d' % i for i in range(200)]
+    set_video_ids = ['56B44F6D10557CC6%04d' % i for i in range(200)]
+    return {
+        'browse (album)': {
+            'browseId': 'MPREb_4pL8gzRtw1p'
+        },
+        'search': {
+            'query': 'oasis wonderwall',
+            'params': 'EgWKAQIIAWoMEA4QChADEAQQCRAF'
+        },
+        'next': {
+            'enablePersistentPlaylistPanel': True,
+            'isAudioOnly': True,
+            'tunerSettingValue': 'AUTOMIX_SETTING_NORMAL',
+            'videoId': 'hpSrLjc5SMs',
+            'playlistId': 'RDAMVMhpSrLjc5SMs'
+        },
+        'playlist/create (200 videoIds)': {
+            'title': 'test',
+            'description': 'test description',
+            'privacyStatus': 'PRIVATE',
+            'videoIds': video_ids
+        },
+        'browse/edit_playlist (add 200)': {
+            'playlistId':
+            'PL6bPxvf5dW5clc3y9wAoslzqUrmkZ5c-u',
+            'actions': [{
+                'action': 'ACTION_ADD_VIDEO',
+                'addedVideoId': video_id,
+                'dedupeOption': 'DEDUPE_OPTION_SKIP'
+            } for video_id in video_ids]
+        },
+        'browse/edit_playlist (remove 200)': {
+            'playlistId':
+            'PL6bPxvf5dW5clc3y9wAoslzqUrmkZ5c-u',
+            'actions': [{
+                'setVideoId': set_video_id,
+                'removedVideoId': video_id,
+                'action': 'ACTION_REMOVE_VIDEO'
+            } for video_id, set_video_id in zip(video_ids, set_video_ids)]
+        },
+    }, context
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--threshold', type=int, default=512)
+    args = parser.parse_args()
+
+    bodies, context = get_sample_bodies()
+    print(f"{'endpoint':<36}{'json=':>10}{'compact':>10}{'sent':>10}{'saved':>10}")
+    for name, body in bodies.items():
+        body.update(context)
+        uncompressed = len(json.dumps(body).encode('utf-8'))
+        compact = len(encode_body(body)[0])
+        sent, compressed = encode_body(body, args.threshold)
+        saved = 1 - len(sent) / uncompressed
+        print(f"{name:<36}{uncompressed:>10}{compact:>10}{len(sent):>10}{saved:>10.0%}"
+              + (' (gzip)' if compressed else ''))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,59 @@
+"""
+Compares the time to decode the recorded response fixtures with each installed JSON decoder,
+against decoding the body to text before parsing it with the standard library.
+
+Usage::
+
+    python benchmarks/decode.py [--repeat 5] [--scale 1] [name ...]
+
+``--scale`` repeats the contents of each response to approximate larger responses,
+such as multi-megabyte playlists.
+"""
+import argparse
+import json
+import sys
+import os
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from fixtures import list_fixtures, load_fixture, load_fixture_bytes  # noqa: E402
+from ytmusicapi.decoder import get_available_decoders  # noqa: E402
+
+
+def decode_text(content):
+    """The previous decode path of ``json.loads(response.text)``."""
+    return json.loads(content.decode('utf-8'))
+
+
+def measure(decode, content, repeat):
+    timer = timeit.Timer(lambda: decode(content))
+    number = timer.autorange()[0]
+    return min(timer.repeat(repeat, number)) / number
+
+
+def scale_fixture(name, scale):
+    if scale == 1:
+        return load_fixture_bytes(name)
+    response = load_fixture(name)
+    return json.dumps([response] * scale).encode('utf-8')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--scale', type=int, default=1)
+    parser.add_argument('names', nargs='*', help='fixtures to decode. Default: all')
+    args = parser.parse_args()
+
+    decoders = dict({'text + json': decode_text}, **get_available_decoders())
+    columns = ''.join(f"{name + ' ms':>16}" for name in decoders)
+    print(f"{'fixture':<24}{'KiB':>8}{columns}{'speedup':>9}")
+    for name in args.names or list_fixtures():
+        content = scale_fixture(name, args.scale)
+        times = [measure(decode, content, args.repeat) for decode in decoders.values()]
+        columns = ''.join(f"{seconds * 1000:>16.3f}" for seconds in times)
+        print(f"{name:<24}{len(content) / 1024:>8.0f}{columns}{times[0] / min(times):>8.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,745 @@
+"""
+Raw API responses used by the benchmarks.
+
+Fixtures are stored gzip-compressed in ``benchmarks/fixtures/<name>.json.gz`` and written by
+``benchmarks/record_fixtures.py``, either recorded from YouTube Music and anonymised, or
+synthesized by the functions in this module in the shape of the real responses.
+"""
+import gzip
+import json
+import os
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), 'fixtures')
+
+MRLIR = 'musicResponsiveListItemRenderer'
+MTRIR = 'musicTwoRowItemRenderer'
+
+#: Response keys which identify the client or session and are removed from recordings
+ANONYMISED_KEYS = {
+    'responseContext', 'trackingParams', 'clickTrackingParams', 'visitorData',
+    'serviceTrackingParams', 'playbackTracking', 'attestation', 'adPlacements', 'playerAds',
+    'loggingContext'
+}
+
+
+def get_fixture_path(name):
+    return os.path.join(FIXTURES_DIR, name + '.json.gz')
+
+
+def list_fixtures():
+    return sorted(f[:-len('.json.gz')] for f in os.listdir(FIXTURES_DIR)
+                  if f.endswith('.json.gz'))
+
+
+def load_fixture_bytes(name) -> bytes:
+    """Raw response body of a fixture, as returned by the server."""
+    with gzip.open(get_fixture_path(name), 'rb') as f:
+        return f.read()
+
+
+def load_fixture(name):
+    return json.loads(load_fixture_bytes(name))
+
+
+def save_fixture(name, response):
+    os.makedirs(FIXTURES_DIR, exist_ok=True)
+    with gzip.GzipFile(get_fixture_path(name), 'wb', mtime=0) as f:
+        f.write(json.dumps(response, separators=(',', ':')).encode('utf-8'))
+
+
+def anonymise(response):
+    """Removes tracking and session data from a response."""
+    if isinstance(response, dict):
+        return {k: anonymise(v) for k, v in response.items() if k not in ANONYMISED_KEYS}
+    if isinstance(response, list):
+        return [anonymise(v) for v in response]
+    return response
+
+
+def runs(*texts):
+    return {'runs': [t if isinstance(t, dict) else {'text': t} for t in texts]}
+
+
+def browse_run(text, browse_id, page_type='MUSIC_PAGE_TYPE_ARTIST'):
+    return {'text': text, 'navigationEndpoint': browse_endpoint(browse_id, page_type)}
+
+
+def browse_endpoint(browse_id, page_type, params=None):
+    endpoint = {
+        'browseEndpoint': {
+            'browseId': browse_id,
+            'browseEndpointContextSupportedConfigs': {
+                'browseEndpointContextMusicConfig': {
+                    'pageType': page_type
+                }
+            }
+        }
+    }
+    if params:
+        endpoint['browseEndpoint']['params'] = params
+    return endpoint
+
+
+def watch_endpoint(video_id, playlist_id=None, video_type='MUSIC_VIDEO_TYPE_ATV'):
+    endpoint = {
+        'watchEndpoint': {
+            'videoId': video_id,
+            'watchEndpointMusicSupportedConfigs': {
+                'watchEndpointMusicConfig': {
+                    'musicVideoType': video_type
+                }
+            }
+        }
+    }
+    if playlist_id:
+        endpoint['watchEndpoint']['playlistId'] = playlist_id
+    return endpoint
+
+
+def thumbnails(i, size=60):
+    return [{
+        'url': 'https://lh3.googleusercontent.com/%d=w%d-h%d' % (i, size, size),
+        'width': size,
+        'height': size
+    }, {
+        'url': 'https://lh3.googleusercontent.com/%d=w%d-h%d' % (i, size * 2, size * 2),
+        'width': size * 2,
+        'height': size * 2
+    }]
+
+
+def thumbnail_renderer(i, key='thumbnail'):
+    return {key: {'musicThumbnailRenderer': {'thumbnail': {'thumbnails': thumbnails(i)}}}}
+
+
+def play_button(video_id, video_type='MUSIC_VIDEO_TYPE_ATV'):
+    return {
+        'musicItemThumbnailOverlayRenderer': {
+            'content': {
+                'musicPlayButtonRenderer': {
+                    'playNavigationEndpoint': watch_endpoint(video_id, video_type=video_type)
+                }
+            }
+        }
+    }
+
+
+def flex_column(*texts):
+    return {'musicResponsiveListItemFlexColumnRenderer': {'text': runs(*texts)}}
+
+
+def fixed_column(text):
+    return {'musicResponsiveListItemFixedColumnRenderer': {'text': runs(text)}}
+
+
+def explicit_badge():
+    return [{
+        'musicInlineBadgeRenderer': {
+            'accessibilityData': {
+                'accessibilityData': {
+                    'label': 'Explicit'
+                }
+            }
+        }
+    }]
+
+
+def toggle_menu_item(i):
+    return {
+        'toggleMenuServiceItemRenderer': {
+            'defaultIcon': {
+                'iconType': 'LIBRARY_ADD'
+            },
+            'defaultServiceEndpoint': {
+                'feedbackEndpoint': {
+                    'feedbackToken': 'AB9zfpK%013dadd' % i
+                }
+            },
+            'toggledServiceEndpoint': {
+                'feedbackEndpoint': {
+                    'feedbackToken': 'AB9zfpK%013drem' % i
+                }
+            }
+        }
+    }
+
+
+def track_menu(i, video_id, playlist_id):
+    radio = {
+        'menuNavigationItemRenderer': {
+            'text': runs('Start radio'),
+            'icon': {
+                'iconType': 'MIX'
+            },
+            'navigationEndpoint': watch_endpoint(video_id, 'RDAMVM' + video_id)
+        }
+    }
+    remove = {
+        'menuServiceItemRenderer': {
+            'serviceEndpoint': {
+                'playlistEditEndpoint': {
+                    'playlistId':
+                    playlist_id,
+                    'actions': [{
+                        'setVideoId': '56B44F6D10557CC6%04d' % i,
+                        'removedVideoId': video_id,
+                        'action': 'ACTION_REMOVE_VIDEO'
+                    }]
+                }
+            }
+        }
+    }
+    return {
+        'menuRenderer': {
+            'items': [radio, toggle_menu_item(i), remove],
+            'topLevelButtons': [{
+                'likeButtonRenderer': {
+                    'likeStatus': 'INDIFFERENT'
+                }
+            }]
+        }
+    }
+
+
+def make_track(i, playlist_id='PL6bPxvf5dW5clc3y9wAoslzqUrmkZ5c-u'):
+    """A track of a playlist as returned in a ``musicPlaylistShelfRenderer``."""
+    video_id = '%011d' % i
+    data = {
+        'flexColumns': [
+            flex_column({
+                'text': 'Track %d' % i,
+                'navigationEndpoint': watch_endpoint(video_id, playlist_id)
+            }),
+            flex_column(browse_run('Artist %d' % (i % 97), 'UC%022d' % (i % 97)), ' & ',
+                        browse_run('Featured %d' % (i % 89), 'UC%022d' % (i % 89 + 100))),
+            flex_column(
+                browse_run('Album %d' % (i % 53), 'MPREb_%011d' % (i % 53),
+                           'MUSIC_PAGE_TYPE_ALBUM'))
+        ],
+        'fixedColumns': [fixed_column('%d:%02d' % (2 + i % 4, i % 60))],
+        'overlay': play_button(video_id),
+        'menu': track_menu(i, video_id, playlist_id),
+    }
+    data.update(thumbnail_renderer(i))
+    if i % 3 == 0:
+        data['badges'] = explicit_badge()
+    return {MRLIR: data}
+
+
+def make_search_item(i, result_type, filtered=False):
+    """A search result of ``result_type`` ('song', 'video', 'album', 'artist' or 'playlist')."""
+    video_id = '%011d' % i
+    artist = browse_run('Artist %d' % i, 'UC%022d' % i)
+    label = [] if filtered else [result_type.capitalize(), ' • ']
+    data = {'flexColumns': [flex_column('%s %d' % (result_type.capitalize(), i))]}
+    data.update(thumbnail_renderer(i))
+    if result_type == 'song':
+        album = browse_run('Album %d' % i, 'MPREb_%011d' % i, 'MUSIC_PAGE_TYPE_ALBUM')
+        data['flexColumns'].append(
+            flex_column(*label, artist, ' • ', album, ' • ', '3:%02d' % (i % 60)))
+        data['overlay'] = play_button(video_id)
+        data['menu'] = {'menuRenderer': {'items': [toggle_menu_item(i)]}}
+        data['badges'] = explicit_badge()
+    elif result_type == 'video':
+        data['flexColumns'].append(
+            flex_column(*label, artist, ' • ', '%dM views' % (i % 9 + 1), ' • ',
+                        '4:%02d' % (i % 60)))
+        data['overlay'] = play_button(video_id, 'MUSIC_VIDEO_TYPE_OMV')
+    elif result_type == 'album':
+        data['flexColumns'].append(flex_column('Album', ' • ', artist, ' • ', '2019'))
+        data['navigationEndpoint'] = browse_endpoint('MPREb_%011d' % i, 'MUSIC_PAGE_TYPE_ALBUM')
+    elif result_type == 'artist':
+        data['flexColumns'].append(flex_column(*label, '%dM subscribers' % (i % 9 + 1)))
+        data['navigationEndpoint'] = browse_endpoint('UC%022d' % i, 'MUSIC_PAGE_TYPE_ARTIST')
+        data['menu'] = {
+            'menuRenderer': {
+                'items': [{
+                    'menuNavigationItemRenderer': {
+                        'icon': {
+                            'iconType': icon
+                        },
+                        'navigationEndpoint': {
+                            'watchPlaylistEndpoint': {
+                                'playlistId': prefix + '%022d' % i
+                            }
+                        }
+                    }
+                } for icon, prefix in [('MUSIC_SHUFFLE', 'RDAO'), ('MIX', 'RDEM')]]
+            }
+        }
+    elif result_type == 'playlist':
+        data['flexColumns'].append(
+            flex_column(*label, 'Author %d' % i, ' • ', '%d songs' % (i % 200 + 1)))
+        data['navigationEndpoint'] = browse_endpoint('VLPL%030d' % i, 'MUSIC_PAGE_TYPE_PLAYLIST')
+    return {MRLIR: data}
+
+
+def make_search(query='oasis', items_per_shelf=20, result_type=None):
+    """A search response, unfiltered or filtered by ``result_type``."""
+    if result_type:
+        shelves = [(result_type.capitalize() + 's', result_type)]
+    else:
+        shelves = [('Songs', 'song'), ('Videos', 'video'), ('Albums', 'album'),
+                   ('Artists', 'artist'), ('Playlists', 'playlist')]
+    contents = [{
+        'musicShelfRenderer': {
+            'title': runs(title),
+            'contents': [
+                make_search_item(i, kind, bool(result_type))
+                for i in range(n * items_per_shelf, (n + 1) * items_per_shelf)
+            ]
+        }
+    } for n, (title, kind) in enumerate(shelves)]
+    if result_type:
+        contents[0]['musicShelfRenderer']['continuations'] = [{
+            'nextContinuationData': {
+                'continuation': 'EqgDEgZvYXNpcxqdA0VnV0tBUUlJQVd%s' % query
+            }
+        }]
+    return {
+        'contents': {
+            'tabbedSearchResultsRenderer': {
+                'tabs': [{
+                    'tabRenderer': {
+                        'title': 'YT Music',
+                        'selected': True,
+                        'content': {
+                            'sectionListRenderer': {
+                                'contents': contents
+                            }
+                        }
+                    }
+                }]
+            }
+        }
+    }
+
+
+def detail_header(title, subtitle, second_subtitle, i=0, buttons=None):
+    header = {
+        'title': runs(title),
+        'subtitle': runs(*subtitle),
+        'secondSubtitle': runs(*second_subtitle),
+        'thumbnail': {
+            'croppedSquareThumbnailRenderer': {
+                'thumbnail': {
+                    'thumbnails': thumbnails(i, 226)
+                }
+            }
+        },
+        'description': runs('Description of %s' % title),
+        'menu': {
+            'menuRenderer': {
+                'topLevelButtons': buttons or []
+            }
+        }
+    }
+    return {'musicDetailHeaderRenderer': header}
+
+
+def continuations(token):
+    return [{'nextContinuationData': {'continuation': token}}]
+
+
+def single_column_tab(contents, section_continuation=None):
+    section_list = {'contents': contents}
+    if section_continuation:
+        section_list['continuations'] = continuations(section_continuation)
+    return {
+        'singleColumnBrowseResultsRenderer': {
+            'tabs': [{
+                'tabRenderer': {
+                    'content': {
+                        'sectionListRenderer': section_list
+                    }
+                }
+            }]
+        }
+    }
+
+
+def make_playlist(playlist_id='PL6bPxvf5dW5clc3y9wAoslzqUrmkZ5c-u', track_count=100,
+                  total=1000, continuation='playlist-page-1'):
+    """First page of a playlist: the header and the first ``track_count`` tracks."""
+    shelf = {
+        'playlistId': playlist_id,
+        'contents': [make_track(i, playlist_id) for i in range(track_count)]
+    }
+    if continuation:
+        shelf['continuations'] = continuations(continuation)
+    return {
+        'header':
+        detail_header('Playlist %s' % playlist_id,
+                      ['Playlist', ' • ',
+                       browse_run('Author', 'UC%022d' % 0), ' • ', '2021'],
+                      ['%d songs' % total, ' • ', '60+ hours']),
+        'contents':
+        single_column_tab([{
+            'musicPlaylistShelfRenderer': shelf
+        }], 'playlist-related')
+    }
+
+
+def make_playlist_continuation(playlist_id='PL6bPxvf5dW5clc3y9wAoslzqUrmkZ5c-u', start=100,
+                               track_count=100, continuation='playlist-page-2'):
+    """A continuation page of a playlist with ``track_count`` more tracks."""
+    shelf = {'contents': [make_track(i, playlist_id) for i in range(start, start + track_count)]}
+    if continuation:
+        shelf['continuations'] = continuations(continuation)
+    return {'continuationContents': {'musicPlaylistShelfContinuation': shelf}}
+
+
+def two_row_item(i, title, subtitle, endpoint):
+    data = {
+        'title': runs({'text': title, 'navigationEndpoint': endpoint}),
+        'subtitle': runs(*subtitle),
+        'navigationEndpoint': endpoint
+    }
+    data.update(thumbnail_renderer(i, 'thumbnailRenderer'))
+    return {MTRIR: data}
+
+
+def make_album_item(i, kind='Album'):
+    return two_row_item(i, 'Album %d' % i, [kind, ' • ', '20%02d' % (i % 23)],
+                        browse_endpoint('MPREb_%011d' % i, 'MUSIC_PAGE_TYPE_ALBUM'))
+
+
+def make_playlist_item(i):
+    return two_row_item(
+        i, 'Playlist %d' % i,
+        ['Author %d' % i, ' • ', '%d songs' % (i % 200 + 1)],
+        browse_endpoint('VLPL%030d' % i, 'MUSIC_PAGE_TYPE_PLAYLIST'))
+
+
+def make_artist_item(i):
+    return two_row_item(i, 'Artist %d' % i, ['%dM subscribers' % (i % 9 + 1)],
+                        browse_endpoint('UC%022d' % i, 'MUSIC_PAGE_TYPE_ARTIST'))
+
+
+def make_video_item(i):
+    video_id = '%011d' % i
+    return two_row_item(
+        i, 'Video %d' % i,
+        [browse_run('Artist %d' % i, 'UC%022d' % i), ' • ', '%dM views' % (i % 9 + 1)],
+        watch_endpoint(video_id, 'PL%030d' % i, 'MUSIC_VIDEO_TYPE_OMV'))
+
+
+def make_song_item(i):
+    video_id = '%011d' % i
+    return two_row_item(i, 'Song %d' % i, [
+        'Song', ' • ',
+        browse_run('Artist %d' % i, 'UC%022d' % i), ' • ',
+        browse_run('Album %d' % i, 'MPREb_%011d' % i, 'MUSIC_PAGE_TYPE_ALBUM')
+    ], watch_endpoint(video_id, 'RDAMVM' + video_id))
+
+
+def make_quick_pick(i):
+    video_id = '%011d' % i
+    data = {
+        'flexColumns': [
+            flex_column({
+                'text': 'Quick pick %d' % i,
+                'navigationEndpoint': watch_endpoint(video_id)
+            }),
+            flex_column(browse_run('Artist %d' % i, 'UC%022d' % i)),
+            flex_column(
+                browse_run('Album %d' % i, 'MPREb_%011d' % i, 'MUSIC_PAGE_TYPE_ALBUM'))
+        ]
+    }
+    data.update(thumbnail_renderer(i))
+    return {MRLIR: data}
+
+
+def carousel(title, contents, browse_id=None, params=None):
+    title_run = {'text': title}
+    if browse_id:
+        title_run['navigationEndpoint'] = browse_endpoint(browse_id, 'MUSIC_PAGE_TYPE_ARTIST',
+                                                          params)
+    return {
+        'musicCarouselShelfRenderer': {
+            'header': {
+                'musicCarouselShelfBasicHeaderRenderer': {
+                    'title': {
+                        'runs': [title_run]
+                    }
+                }
+            },
+            'contents': contents
+        }
+    }
+
+
+def make_album(browse_id='MPREb_4pL8gzRtw1p', track_count=19):
+    """An album page with its tracks and other versions."""
+    buttons = [{
+        'buttonRenderer': {
+            'navigationEndpoint': {
+                'watchPlaylistEndpoint': {
+                    'playlistId': 'OLAK5uy_%033d' % 0
+                }
+            }
+        }
+    }, {
+        'buttonRenderer': {
+            'defaultServiceEndpoint': {
+                'likeEndpoint': {
+                    'status': 'LIKE'
+                }
+            }
+        }
+    }]
+    tracks = []
+    for i in range(track_count):
+        video_id = '%011d' % i
+        data = {
+            'flexColumns': [
+                flex_column({
+                    'text': 'Track %d' % i,
+                    'navigationEndpoint': watch_endpoint(video_id)
+                }), {
+                    'musicResponsiveListItemFlexColumnRenderer': {
+                        'text': {}
+                    }
+                }
+            ],
+            'fixedColumns': [fixed_column('%d:%02d' % (2 + i % 4, i % 60))],
+            'overlay': play_button(video_id),
+            'menu': track_menu(i, video_id, 'OLAK5uy_%033d' % 0)
+        }
+        tracks.append({MRLIR: data})
+    return {
+        'header':
+        detail_header('Album %s' % browse_id,
+                      ['Album', ' • ',
+                       browse_run('Artist', 'UC%022d' % 0), ' • ', '2017'],
+                      ['%d songs' % track_count, ' • ', '1 hour, 17 minutes'],
+                      buttons=buttons),
+        'contents':
+        single_column_tab([{
+            'musicShelfRenderer': {
+                'contents': tracks
+            }
+        }, carousel('Other versions', [make_album_item(i) for i in range(5)])])
+    }
+
+
+def make_artist(channel_id='UCmMUZbaYdNH0bEd1PAlAqsA', items_per_carousel=10):
+    """An artist page with songs, albums, singles, videos, playlists and related artists."""
+    n = items_per_carousel
+    header = {
+        'title': runs('Artist %s' % channel_id),
+        'subscriptionButton': {
+            'subscribeButtonRenderer': {
+                'channelId': channel_id,
+                'subscribed': False,
+                'subscriberCountText': runs('1.2M')
+            }
+        },
+        'playButton': {
+            'buttonRenderer': {
+                'navigationEndpoint': {
+                    'watchPlaylistEndpoint': {
+                        'playlistId': 'RDAO' + channel_id
+                    }
+                }
+            }
+        },
+        'startRadioButton': {
+            'buttonRenderer': {
+                'navigationEndpoint': {
+                    'watchPlaylistEndpoint': {
+                        'playlistId': 'RDEM' + channel_id
+                    }
+                }
+            }
+        }
+    }
+    header.update(thumbnail_renderer(0))
+    songs = {
+        'musicShelfRenderer': {
+            'title': runs(browse_run('Songs', 'VLOLAK5uy_%033d' % 1, 'MUSIC_PAGE_TYPE_PLAYLIST')),
+            'contents': [make_track(i, 'OLAK5uy_%033d' % 1) for i in range(5)]
+        }
+    }
+    return {
+        'header': {
+            'musicImmersiveHeaderRenderer': header
+        },
+        'contents':
+        single_column_tab([
+            songs,
+            carousel('Albums', [make_album_item(i) for i in range(n)], channel_id, 'albums'),
+            carousel('Singles', [make_album_item(i, 'Single') for i in range(n, 2 * n)],
+                     channel_id, 'singles'),
+            carousel('Videos', [make_video_item(i) for i in range(n)], 'VLPL%030d' % 0),
+            carousel('Playlists', [make_playlist_item(i) for i in range(n)], channel_id,
+                     'playlists'),
+            carousel('Fans might also like', [make_artist_item(i) for i in range(n)]),
+            {
+                'musicDescriptionShelfRenderer': {
+                    'header': runs('About'),
+                    'subheader': runs('123,456,789 views'),
+                    'description': runs('Description of %s' % channel_id)
+                }
+            }
+        ])
+    }
+
+
+def make_artist_albums(count=100):
+    """The grid of an artist's albums returned for the ``params`` of :py:func:`get_artist`."""
+    return {
+        'contents':
+        single_column_tab([{
+            'gridRenderer': {
+                'items': [make_album_item(i) for i in range(count)]
+            }
+        }])
+    }
+
+
+def make_home(rows=6, items_per_row=10):
+    """The home page: carousels of mixed content and a shelf of quick picks."""
+    n = items_per_row
+    kinds = [make_album_item, make_playlist_item, make_artist_item, make_song_item]
+    contents = [carousel('Quick picks', [make_quick_pick(i) for i in range(20)])]
+    for row in range(rows - 1):
+        make_item = kinds[row % len(kinds)]
+        contents.append(
+            carousel('Row %d' % row, [make_item(i) for i in range(row * n, (row + 1) * n)]))
+    return {'contents': single_column_tab(contents, 'home-page-1')}
+
+
+def make_watch_track(i, playlist_id):
+    video_id = '%011d' % i
+    return {
+        'playlistPanelVideoRenderer': {
+            'videoId': video_id,
+            'title': runs('Track %d' % i),
+            'longBylineText':
+            runs(browse_run('Artist %d' % i, 'UC%022d' % i), ' • ',
+                 browse_run('Album %d' % i, 'MPREb_%011d' % i, 'MUSIC_PAGE_TYPE_ALBUM'), ' • ',
+                 '2019'),
+            'lengthText': runs('3:%02d' % (i % 60)),
+            'thumbnail': {
+                'thumbnails': thumbnails(i)
+            },
+            'navigationEndpoint': watch_endpoint(video_id, playlist_id),
+            'menu': {
+                'menuRenderer': {
+                    'items': [toggle_menu_item(i)]
+                }
+            }
+        }
+    }
+
+
+def make_watch_playlist(video_id='hpSrLjc5SMs', track_count=50):
+    """The ``next`` response with a radio of ``track_count`` tracks."""
+    playlist_id = 'RDAMVM' + video_id
+    tabs = [{
+        'tabRenderer': {
+            'content': {
+                'musicQueueRenderer': {
+                    'content': {
+                        'playlistPanelRenderer': {
+                            'contents':
+                            [make_watch_track(i, playlist_id) for i in range(track_count)],
+                            'continuations': [{
+                                'nextRadioContinuationData': {
+                                    'continuation': 'watch-page-1'
+                                }
+                            }]
+                        }
+                    }
+                }
+            }
+        }
+    }, {
+        'tabRenderer': {
+            'endpoint': {
+                'browseEndpoint': {
+                    'browseId': 'MPLYt_%011d' % 0
+                }
+            }
+        }
+    }, {
+        'tabRenderer': {
+            'endpoint': {
+                'browseEndpoint': {
+                    'browseId': 'MPTRt_%011d' % 0
+                }
+            }
+        }
+    }]
+    return {
+        'contents': {
+            'singleColumnMusicWatchNextResultsRenderer': {
+                'tabbedRenderer': {
+                    'watchNextTabbedResultsRenderer': {
+                        'tabs': tabs
+                    }
+                }
+            }
+        }
+    }
+
+
+def make_player(video_id='hpSrLjc5SMs'):
+    """The ``player`` response of :py:func:`get_song`."""
+    formats = [{
+        'itag': itag,
+        'url': 'https://rr1---sn-h0jelnez.c.youtube.com/videoplayback?itag=%d&id=%s' %
+        (itag, video_id),
+        'mimeType': mime,
+        'bitrate': bitrate,
+        'contentLength': str(bitrate * 32),
+        'approxDurationMs': '245000',
+        'audioQuality': 'AUDIO_QUALITY_MEDIUM'
+    } for itag, mime, bitrate in [(140, 'audio/mp4; codecs="mp4a.40.2"', 131007),
+                                  (251, 'audio/webm; codecs="opus"', 141591),
+                                  (18, 'video/mp4; codecs="avc1.42001E, mp4a.40.2"', 360289)]]
+    return {
+        'playabilityStatus': {
+            'status': 'OK',
+            'playableInEmbed': True
+        },
+        'streamingData': {
+            'expiresInSeconds': '21540',
+            'formats': formats[2:],
+            'adaptiveFormats': formats[:2]
+        },
+        'videoDetails': {
+            'videoId': video_id,
+            'title': 'Track %s' % video_id,
+            'lengthSeconds': '245',
+            'channelId': 'UC%022d' % 0,
+            'thumbnail': {
+                'thumbnails': thumbnails(0, 544)
+            },
+            'author': 'Artist',
+            'musicVideoType': 'MUSIC_VIDEO_TYPE_ATV'
+        },
+        'microformat': {
+            'microformatDataRenderer': {
+                'urlCanonical': 'https://music.youtube.com/watch?v=' + video_id,
+                'title': 'Track %s - YouTube Music' % video_id,
+                'tags': ['Artist', 'Track', 'Album']
+            }
+        }
+    }
+
+
+#: Synthetic fixtures by name
+SYNTHETIC = {
+    'search': make_search,
+    'search_songs': lambda: make_search(result_type='song'),
+    'playlist': make_playlist,
+    'playlist_continuation': make_playlist_continuation,
+    'album': make_album,
+    'artist': make_artist,
+    'artist_albums': make_artist_albums,
+    'home': make_home,
+    'watch': make_watch_playlist,
+    'player': make_player,
+}
@@ -0,0 +1,110 @@
+"""
+Times importing ytmusicapi and its lightweight modules in fresh interpreters with
+``python -X importtime``, reporting the cumulative import time and the number of modules loaded.
+
+Usage::
+
+    python benchmarks/importtime.py [--repeat 5] [--top 10] [--save results.json]
+                                    [--compare results.json] [--tolerance 0.2] [module ...]
+
+With ``--top``, also lists the slowest imports of each module by their own time.
+With ``--compare``, exits with status 1 if an import became slower than in the saved results
+by more than the tolerance.
+"""
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+MODULES = [
+    'ytmusicapi',
+    'ytmusicapi.parsers.search_params',
+    'ytmusicapi.parsers.browsing',
+    'ytmusicapi.navigation',
+    'ytmusicapi.ytmusic',
+]
+
+LINE = re.compile(r'import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)')
+
+
+def import_once(module):
+    """
+    Imports `module` in a new interpreter and returns the modules loaded by the import,
+    excluding those loaded at interpreter startup, as tuples of name, own time and
+    cumulative time in microseconds. The last one is `module` itself.
+    """
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import ' + module],
+                            cwd=ROOT,
+                            capture_output=True,
+                            text=True)
+    if result.returncode != 0:
+        raise Exception("Importing " + module + " failed:\n" + result.stderr)
+    lines = LINE.findall(result.stderr)
+    # modules imported by another one are listed before it and indented deeper
+    start = len(lines) - 1
+    while start > 0 and len(lines[start - 1][2]) > len(lines[-1][2]):
+        start -= 1
+    return [(name, int(own), int(cumulative)) for own, cumulative, _, name in lines[start:]]
+
+
+def measure(module, repeat):
+    """Fastest of `repeat` imports, as returned by :py:func:`import_once`."""
+    runs = [import_once(module) for _ in range(repeat)]
+    return min(runs, key=lambda imports: imports[-1][2])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--top',
+                        type=int,
+                        default=0,
+                        help='number of slowest imports to list per module. Default: 0')
+    parser.add_argument('--save', help='write the results to a JSON file')
+    parser.add_argument('--compare', help='compare with results saved by --save')
+    parser.add_argument('--tolerance',
+                        type=float,
+                        default=0.2,
+                        help='allowed slowdown when comparing. Default: 0.2')
+    parser.add_argument('modules',
+                        nargs='*',
+                        help='modules to import. Default: ' + ', '.join(MODULES))
+    args = parser.parse_args()
+
+    baseline = {}
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+
+    results = {}
+    regressions = []
+    print(f"{'module':<38}{'ms':>9}{'modules':>9}{'change':>9}")
+    for module in args.modules or MODULES:
+        imports = measure(module, args.repeat)
+        seconds = imports[-1][2] / 1e6
+        results[module] = {'time': seconds, 'modules': len(imports)}
+
+        change = ''
+        if module in baseline:
+            ratio = seconds / baseline[module]['time'] - 1
+            change = f"{ratio:+.0%}"
+            if ratio > args.tolerance:
+                regressions.append(module)
+        print(f"{module:<38}{seconds * 1000:>9.1f}{len(imports):>9}{change:>9}")
+        for name, own, _ in sorted(imports, key=lambda i: i[1], reverse=True)[:args.top]:
+            print(f"    {name:<34}{own / 1000:>9.1f}")
+
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump(results, f, indent=2)
+    if regressions:
+        print("\nSlower than " + args.compare + ": " + ', '.join(regressions))
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
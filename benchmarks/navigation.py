@@ -0,0 +1,123 @@
+"""
+Measures the time spent navigating responses with precomputed :class:`NavPath` paths
+compared to concatenating plain lists for every item, and the time to parse one track
+of a large playlist.
+
+Usage::
+
+    python benchmarks/navigation.py [--tracks 5000] [--repeat 5] [--revision REV]
+
+With ``--revision``, the time per track is also measured with the parsers of a git revision,
+for example the one before a change to the parsers, and both times are compared.
+"""
+import argparse
+import importlib
+import io
+import os
+import subprocess
+import sys
+import tarfile
+import tempfile
+import timeit
+
+from fixtures import make_track
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+
+def get_paths(n):
+    """
+    Paths navigated for every track, as concatenations of plain lists, which is how they
+    were built before :class:`NavPath`, and as precomputed paths.
+
+    :param n: The module ``ytmusicapi.navigation``
+    """
+    menu_items, video_type = list(n.MENU_ITEMS), list(n.NAVIGATION_VIDEO_TYPE)
+    play_button, feedback_token = list(n.PLAY_BUTTON), list(n.FEEDBACK_TOKEN)
+    thumbnails, badge_label = list(n.THUMBNAILS), list(n.BADGE_LABEL)
+    return {
+        'MENU_VIDEO_TYPE':
+        (lambda: menu_items + [0, 'menuNavigationItemRenderer', 'navigationEndpoint'] + video_type,
+         n.MENU_VIDEO_TYPE),
+        'PLAY_BUTTON_VIDEO_ID':
+        (lambda: play_button + ['playNavigationEndpoint', 'watchEndpoint', 'videoId'],
+         n.PLAY_BUTTON_VIDEO_ID),
+        'LIBRARY_ADD_TOKEN':
+        (lambda: ['defaultServiceEndpoint'] + feedback_token, n.LIBRARY_ADD_TOKEN),
+        'THUMBNAILS': (lambda: thumbnails, n.THUMBNAILS),
+        'BADGE_LABEL': (lambda: badge_label, n.BADGE_LABEL),
+    }
+
+
+def measure(func, number, repeat):
+    """Nanoseconds per call of `func`."""
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number * 1e9
+
+
+def time_parsing(tracks, repeat):
+    """Seconds per track spent by ``parse_playlist_items`` on `tracks`."""
+    from ytmusicapi.parsers.playlists import parse_playlist_items
+
+    seconds = min(timeit.repeat(lambda: parse_playlist_items(tracks), number=1, repeat=repeat))
+    return seconds / len(tracks)
+
+
+def time_revision(revision, args):
+    """Runs :py:func:`time_parsing` on the parsers of a git revision in a new interpreter."""
+    archive = subprocess.run(['git', 'archive', revision, 'ytmusicapi'],
+                             cwd=ROOT,
+                             capture_output=True,
+                             check=True).stdout
+    with tempfile.TemporaryDirectory() as directory:
+        with tarfile.open(fileobj=io.BytesIO(archive)) as tar:
+            tar.extractall(directory)
+        # only the parsers are imported, so the package's own __init__ isn't needed
+        open(os.path.join(directory, 'ytmusicapi', '__init__.py'), 'w').close()
+        command = [sys.executable, __file__, '--parse-only', '--root', directory]
+        command += ['--tracks', str(args.tracks), '--repeat', str(args.repeat)]
+        result = subprocess.run(command, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise Exception("Parsing at " + revision + " failed:\n" + result.stderr)
+    return float(result.stdout)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--tracks', type=int, default=5000)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--revision', help='git revision to compare the time per track with')
+    parser.add_argument('--root', default=ROOT, help=argparse.SUPPRESS)
+    parser.add_argument('--parse-only', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    sys.path.insert(0, args.root)
+    tracks = [make_track(i) for i in range(args.tracks)]
+    if args.parse_only:
+        print(time_parsing(tracks, args.repeat))
+        return
+
+    n = importlib.import_module('ytmusicapi.navigation')
+    data = tracks[0][n.MRLIR]
+    toggle_menu = data['menu']['menuRenderer']['items'][1]['toggleMenuServiceItemRenderer']
+    number = 100000
+
+    print(f"{'path':<24}{'list (ns)':>12}{'precomputed (ns)':>18}{'speedup':>10}")
+    for name, (concatenate, path) in get_paths(n).items():
+        root = toggle_menu if name == 'LIBRARY_ADD_TOKEN' else data
+        assert n.nav(root, concatenate()) == n.nav(root, path)
+        # both paths are returned by a function, so that only building them differs
+        precompute = lambda: path  # noqa: E731
+        walked = measure(lambda: n.nav(root, concatenate(), True), number, args.repeat)
+        precomputed = measure(lambda: n.nav(root, precompute(), True), number, args.repeat)
+        print(f"{name:<24}{walked:>12.0f}{precomputed:>18.0f}{walked / precomputed:>9.1f}x")
+
+    per_track = time_parsing(tracks, args.repeat)
+    print(f"\nparse_playlist_items: {per_track * 1e6:.2f} us per track ({args.tracks} tracks)")
+    if args.revision:
+        before = time_revision(args.revision, args)
+        print(f"at {args.revision}: {before * 1e6:.2f} us per track, "
+              f"change in the working tree: {per_track / before - 1:+.0%}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,180 @@
+"""
+Times the response parsers in isolation on the recorded response fixtures,
+reporting parsed items per second and peak memory per parser. No network access is needed.
+
+Usage::
+
+    python benchmarks/parsers.py [--repeat 5] [--save results.json] [--compare results.json]
+                                 [--tolerance 0.2] [name ...]
+
+With ``--compare``, exits with status 1 if a parser became slower than in the saved results
+by more than the tolerance.
+"""
+import argparse
+import json
+import sys
+import os
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from fixtures import load_fixture, load_fixture_bytes  # noqa: E402
+from ytmusicapi.navigation import *  # noqa: E402
+from ytmusicapi.parsers.albums import parse_album_header  # noqa: E402
+from ytmusicapi.languages import get_parser  # noqa: E402
+from ytmusicapi.parsers.library import parse_albums  # noqa: E402
+from ytmusicapi.parsers.playlists import parse_playlist_items  # noqa: E402
+from ytmusicapi.parsers.watch import parse_watch_playlist  # noqa: E402
+
+
+def search_shelves(response):
+    results = response['contents']['tabbedSearchResultsRenderer']['tabs'][0]['tabRenderer'][
+        'content']
+    return [(nav(res, MUSIC_SHELF + TITLE_TEXT, True), res['musicShelfRenderer']['contents'])
+            for res in nav(results, SECTION_LIST) if 'musicShelfRenderer' in res]
+
+
+def parse_search(parser, result_type=None):
+    def parse(shelves):
+        results = []
+        for category, contents in shelves:
+            results.extend(parser.parse_search_results(contents, result_type, category))
+        return results
+
+    return parse
+
+
+def parse_album(results):
+    response, tracks = results
+    album = parse_album_header(response)
+    album['tracks'] = parse_playlist_items(tracks)
+    return album['tracks']
+
+
+def parse_artist(parser):
+    def parse(results):
+        artist = parser.parse_artist_contents(results)
+        return [item for category in artist.values() for item in category['results']]
+
+    return parse
+
+
+def parse_home(parser):
+    def parse(rows):
+        return [item for row in parser.parse_mixed_content(rows) for item in row['contents']]
+
+    return parse
+
+
+def get_benchmarks():
+    """
+    Returns the benchmarks by name as tuples of fixture name, a function extracting
+    the parser input from the response as the mixins do, and the parse function.
+    """
+    parser = get_parser('en')
+    playlist_shelf = SINGLE_COLUMN_TAB + SECTION_LIST_ITEM + ['musicPlaylistShelfRenderer']
+    watch_playlist = [
+        'contents', 'singleColumnMusicWatchNextResultsRenderer', 'tabbedRenderer',
+        'watchNextTabbedResultsRenderer'
+    ] + TAB_CONTENT + ['musicQueueRenderer', 'content', 'playlistPanelRenderer', 'contents']
+    return {
+        'parse_search_results': ('search', search_shelves, parse_search(parser)),
+        'parse_search_results (songs)': ('search_songs', search_shelves,
+                                         parse_search(parser, 'song')),
+        'parse_playlist_items':
+        ('playlist', lambda r: nav(r, playlist_shelf)['contents'], parse_playlist_items),
+        'parse_playlist_items (continuation)':
+        ('playlist_continuation',
+         lambda r: r['continuationContents']['musicPlaylistShelfContinuation']['contents'],
+         parse_playlist_items),
+        'parse_album_header + tracks':
+        ('album', lambda r:
+         (r, nav(r, SINGLE_COLUMN_TAB + SECTION_LIST_ITEM + MUSIC_SHELF)['contents']),
+         parse_album),
+        'parse_artist_contents': ('artist', lambda r: nav(r, SINGLE_COLUMN_TAB + SECTION_LIST),
+                                  parse_artist(parser)),
+        'parse_albums':
+        ('artist_albums', lambda r: nav(r, SINGLE_COLUMN_TAB + SECTION_LIST_ITEM + GRID_ITEMS),
+         parse_albums),
+        'parse_mixed_content': ('home', lambda r: nav(r, SINGLE_COLUMN_TAB + SECTION_LIST),
+                                parse_home(parser)),
+        'parse_watch_playlist': ('watch', lambda r: nav(r, watch_playlist), parse_watch_playlist),
+    }
+
+
+def measure(func, arg, repeat, min_time=0.2):
+    """Best time of one call over `repeat` rounds, each running for at least `min_time`."""
+    best = float('inf')
+    for _ in range(repeat):
+        number = 0
+        start = time.perf_counter()
+        while True:
+            func(arg)
+            number += 1
+            elapsed = time.perf_counter() - start
+            if elapsed >= min_time:
+                break
+        best = min(best, elapsed / number)
+    return best
+
+
+def measure_peak_memory(func, arg):
+    tracemalloc.start()
+    try:
+        func(arg)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--save', help='write the results to a JSON file')
+    parser.add_argument('--compare', help='compare with results saved by --save')
+    parser.add_argument('--tolerance',
+                        type=float,
+                        default=0.2,
+                        help='allowed slowdown when comparing. Default: 0.2')
+    parser.add_argument('names', nargs='*', help='benchmarks to run. Default: all')
+    args = parser.parse_args()
+
+    baseline = {}
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+
+    results = {}
+    regressions = []
+    print(f"{'parser':<38}{'items':>7}{'decode ms':>11}{'parse ms':>10}{'items/s':>11}"
+          f"{'peak KiB':>10}{'change':>9}")
+    for name, (fixture, extract, parse) in get_benchmarks().items():
+        if args.names and name not in args.names:
+            continue
+        raw = load_fixture_bytes(fixture)
+        decode = measure(json.loads, raw, args.repeat)
+        contents = extract(load_fixture(fixture))
+        items = len(parse(contents))
+        seconds = measure(parse, contents, args.repeat)
+        peak = measure_peak_memory(parse, contents)
+        results[name] = {'items': items, 'decode': decode, 'parse': seconds, 'peak': peak}
+
+        change = ''
+        if name in baseline:
+            ratio = seconds / baseline[name]['parse'] - 1
+            change = f"{ratio:+.0%}"
+            if ratio > args.tolerance:
+                regressions.append(name)
+        print(f"{name:<38}{items:>7}{decode * 1000:>11.2f}{seconds * 1000:>10.2f}"
+              f"{items / seconds:>11.0f}{peak / 1024:>10.0f}{change:>9}")
+
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump(results, f, indent=2)
+    if regressions:
+        print("\nSlower than " + args.compare + ": " + ', '.join(regressions))
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
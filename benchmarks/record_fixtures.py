@@ -0,0 +1,85 @@
+"""
+Writes the raw response fixtures used by the benchmarks to ``benchmarks/fixtures``.
+
+Responses are recorded from YouTube Music without authentication and anonymised,
+or synthesized in the shape of the real responses with ``--synthetic``.
+
+Usage::
+
+    python benchmarks/record_fixtures.py [--synthetic] [name ...]
+"""
+import argparse
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from fixtures import SYNTHETIC, anonymise, save_fixture  # noqa: E402
+
+sample_album = "MPREb_4pL8gzRtw1p"  # Eminem - Revival
+sample_artist = "UCmMUZbaYdNH0bEd1PAlAqsA"  # Oasis
+sample_video = "hpSrLjc5SMs"  # Oasis - Wonderwall
+sample_playlist = "PL6bPxvf5dW5clc3y9wAoslzqUrmkZ5c-u"  # very large playlist
+
+
+def get_albums_params(ytmusic):
+    albums = ytmusic.get_artist(sample_artist)['albums']
+    ytmusic.get_artist_albums(albums['browseId'], albums['params'])
+
+
+#: Calls which send the recorded requests, and the index of the request to keep for each fixture
+RECORDINGS = {
+    'search': (lambda ytmusic: ytmusic.search('oasis'), 0),
+    'search_songs': (lambda ytmusic: ytmusic.search('oasis', filter='songs'), 0),
+    'playlist': (lambda ytmusic: ytmusic.get_playlist(sample_playlist, limit=200), 0),
+    'playlist_continuation': (lambda ytmusic: ytmusic.get_playlist(sample_playlist, limit=200),
+                              1),
+    'album': (lambda ytmusic: ytmusic.get_album(sample_album), 0),
+    'artist': (lambda ytmusic: ytmusic.get_artist(sample_artist), 0),
+    'artist_albums': (get_albums_params, 1),
+    'home': (lambda ytmusic: ytmusic.get_home(), 0),
+    'watch': (lambda ytmusic: ytmusic.get_watch_playlist(sample_video), 0),
+    'player': (lambda ytmusic: ytmusic.get_song(sample_video), 0),
+}
+
+
+def record(ytmusic, name):
+    responses = []
+    send_request = ytmusic._send_request
+
+    def recording_send_request(*args, **kwargs):
+        response = send_request(*args, **kwargs)
+        responses.append(response)
+        return response
+
+    ytmusic._send_request = recording_send_request
+    try:
+        call, index = RECORDINGS[name]
+        call(ytmusic)
+    finally:
+        ytmusic._send_request = send_request
+    return anonymise(responses[index])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--synthetic', action='store_true',
+                        help='synthesize responses instead of recording them')
+    parser.add_argument('names', nargs='*', help='fixtures to write. Default: all')
+    args = parser.parse_args()
+
+    names = args.names or list(SYNTHETIC)
+    if args.synthetic:
+        for name in names:
+            save_fixture(name, SYNTHETIC[name]())
+            print("synthesized " + name)
+        return
+
+    from ytmusicapi import YTMusic
+    ytmusic = YTMusic()
+    for name in names:
+        save_fixture(name, record(ytmusic, name))
+        print("recorded " + name)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,101 @@
+"""
+Measures end-to-end throughput and pagination latency of :class:`YTMusic`
+against the local replay server, without network access.
+
+Usage::
+
+    python benchmarks/replay.py [--calls 200] [--concurrency 8] [--latency 0.02] [--jitter 0]
+                                [--error-rate 0] [--pages 10]
+"""
+import argparse
+import sys
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from replay_server import ReplayServer  # noqa: E402
+from ytmusicapi import YTMusic  # noqa: E402
+
+sample_video = "hpSrLjc5SMs"
+sample_playlist = "PL6bPxvf5dW5clc3y9wAoslzqUrmkZ5c-u"
+
+SCENARIOS = {
+    'search': lambda ytmusic: ytmusic.search('oasis', filter='songs'),
+    'get_watch_playlist': lambda ytmusic: ytmusic.get_watch_playlist(sample_video),
+    'get_song': lambda ytmusic: ytmusic.get_song(sample_video),
+    'get_playlist (first page)': lambda ytmusic: ytmusic.get_playlist(sample_playlist),
+}
+
+
+def run_scenario(server, call, calls, concurrency):
+    """Runs `calls` calls from `concurrency` threads, each with its own client."""
+    local = threading.local()
+
+    def timed_call(_):
+        if not hasattr(local, 'ytmusic'):
+            local.ytmusic = YTMusic(base_url=server.url)
+        start = time.perf_counter()
+        try:
+            call(local.ytmusic)
+            return time.perf_counter() - start, None
+        except Exception as e:
+            return time.perf_counter() - start, e
+
+    served = sum(server.served.values())
+    start = time.perf_counter()
+    with ThreadPoolExecutor(concurrency) as executor:
+        results = list(executor.map(timed_call, range(calls)))
+    elapsed = time.perf_counter() - start
+    requests = sum(server.served.values()) - served
+    latencies = sorted(latency for latency, error in results if error is None)
+    errors = sum(error is not None for _, error in results)
+    return elapsed, requests, latencies, errors
+
+
+def percentile(values, p):
+    return values[min(len(values) - 1, int(len(values) * p))] if values else float('nan')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--calls', type=int, default=200)
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--latency', type=float, default=0.02)
+    parser.add_argument('--jitter', type=float, default=0)
+    parser.add_argument('--error-rate', type=float, default=0)
+    parser.add_argument('--pages', type=int, default=10)
+    args = parser.parse_args()
+
+    server = ReplayServer(latency=args.latency, jitter=args.jitter, error_rate=args.error_rate,
+                          pages=args.pages, seed=0).start()
+    try:
+        print(f"{'scenario':<28}{'calls/s':>9}{'requests/s':>12}{'p50 ms':>9}{'p95 ms':>9}"
+              f"{'errors':>8}")
+        for name, call in SCENARIOS.items():
+            elapsed, requests, latencies, errors = run_scenario(server, call, args.calls,
+                                                                args.concurrency)
+            print(f"{name:<28}{args.calls / elapsed:>9.1f}{requests / elapsed:>12.1f}"
+                  f"{percentile(latencies, 0.5) * 1000:>9.1f}"
+                  f"{percentile(latencies, 0.95) * 1000:>9.1f}{errors:>8}")
+
+        print()
+        for prefetch in [False, True]:
+            ytmusic = YTMusic(base_url=server.url, prefetch_continuations=prefetch)
+            start = time.perf_counter()
+            tracks = ytmusic.iter_playlist_tracks(sample_playlist)
+            next(tracks)
+            first = time.perf_counter() - start
+            count = 1 + sum(1 for _ in tracks)
+            elapsed = time.perf_counter() - start
+            print(f"pagination{' (prefetch)' if prefetch else '':<11}: {count} tracks "
+                  f"in {args.pages} pages in {elapsed * 1000:.0f} ms, "
+                  f"{elapsed / args.pages * 1000:.1f} ms per page, "
+                  f"first track after {first * 1000:.1f} ms")
+    finally:
+        server.stop()
+
+
+if __name__ == '__main__':
+    main()
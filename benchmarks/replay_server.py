@@ -0,0 +1,231 @@
+"""
+Local stand-in for YouTube Music which replays the response fixtures,
+for testing the full client stack without network access.
+
+Playlists are served as a chain of continuation pages. Latency and errors can be injected.
+Point :class:`YTMusic` at the server with its ``base_url`` parameter::
+
+    ytmusic = YTMusic(base_url='http://127.0.0.1:8080')
+
+Usage::
+
+    python benchmarks/replay_server.py [--port 8080] [--latency 0.05] [--jitter 0.02]
+                                       [--error-rate 0.01] [--error-status 500] [--pages 10]
+"""
+import argparse
+import gzip
+import json
+import random
+import sys
+import os
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from fixtures import load_fixture, load_fixture_bytes  # noqa: E402
+from ytmusicapi.constants import YTM_API_PATH  # noqa: E402
+
+HOME_PAGE = ('<html><head><script>ytcfg.set({"VISITOR_DATA": "CgtSZXBsYXlTZXJ2ZXI%3D"});'
+             '</script></head><body></body></html>').encode('utf-8')
+
+# browseId prefixes and the fixture served for them
+BROWSE_FIXTURES = [('FEmusic_home', 'home'), ('VL', 'playlist'), ('MPREb_', 'album'),
+                   ('UC', 'artist')]
+
+PAGE_TOKEN = 'playlist-page-'
+
+
+def encode(response):
+    return json.dumps(response, separators=(',', ':')).encode('utf-8')
+
+
+def get_error(status, message):
+    return status, encode({'error': {'code': status, 'message': message}})
+
+
+def get_playlist_pages(pages):
+    """
+    Builds the first page of the playlist fixture and `pages` - 1 continuation pages,
+    each linking to the next one.
+    """
+    first = load_fixture('playlist')
+    shelf = first['contents']['singleColumnBrowseResultsRenderer']['tabs'][0]['tabRenderer'][
+        'content']['sectionListRenderer']['contents'][0]['musicPlaylistShelfRenderer']
+    continuation = load_fixture('playlist_continuation')
+    continuation_shelf = continuation['continuationContents']['musicPlaylistShelfContinuation']
+    track_count = len(shelf['contents']) + (pages - 1) * len(continuation_shelf['contents'])
+    header = first['header']['musicDetailHeaderRenderer']
+    header['secondSubtitle']['runs'][0]['text'] = '%d songs' % track_count
+
+    responses = []
+    chain = [(first, shelf)] + [(continuation, continuation_shelf)] * (pages - 1)
+    for page, (response, page_shelf) in enumerate(chain):
+        if page < pages - 1:
+            page_shelf['continuations'] = [{
+                'nextContinuationData': {
+                    'continuation': PAGE_TOKEN + str(page + 1)
+                }
+            }]
+        else:
+            page_shelf.pop('continuations', None)
+        responses.append(encode(response))
+    return responses
+
+
+class ReplayServer(ThreadingHTTPServer):
+    """
+    HTTP server replaying the response fixtures for requests to ``/youtubei/v1/*``.
+
+    Counts the responses served per fixture in :py:attr:`served`.
+    """
+    daemon_threads = True
+
+    def __init__(self, address=('127.0.0.1', 0), latency: float = 0, jitter: float = 0,
+                 error_rate: float = 0, error_status: int = 500, pages: int = 10,
+                 seed: int = None):
+        """
+        :param address: Host and port to listen on. Default: a free port on localhost
+        :param latency: Seconds to wait before sending each response. Default: 0
+        :param jitter: Maximum random seconds added to the latency. Default: 0
+        :param error_rate: Share of API requests answered with `error_status`. Default: 0
+        :param error_status: HTTP status of injected errors. Default: 500
+        :param pages: Number of pages of the playlist, including the first. Default: 10
+        :param seed: Optional. Seed for jitter and error injection.
+        """
+        super().__init__(address, ReplayHandler)
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.responses = {
+            name: load_fixture_bytes(name)
+            for name in ['search', 'search_songs', 'album', 'artist', 'artist_albums', 'home',
+                         'watch', 'player']
+        }
+        self.playlist_pages = get_playlist_pages(pages)
+        self.served = Counter()
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return 'http://%s:%d' % (host, port)
+
+    def start(self):
+        """Serve requests from a background thread."""
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+        if self._thread:
+            self._thread.join()
+
+    def get_delay(self) -> float:
+        with self._lock:
+            return self.latency + self._random.uniform(0, self.jitter)
+
+    def should_fail(self) -> bool:
+        with self._lock:
+            return self._random.random() < self.error_rate
+
+    def get_response(self, endpoint, query, body):
+        """Selects the response for an API request. Returns the status and the response body."""
+        token = query.get('ctoken', query.get('continuation', [None]))[0]
+        if token:
+            if token.startswith(PAGE_TOKEN) and token[len(PAGE_TOKEN):].isdigit():
+                page = int(token[len(PAGE_TOKEN):])
+                if 0 < page < len(self.playlist_pages):
+                    return self.serve('playlist_continuation', self.playlist_pages[page])
+            return get_error(404, 'Unknown continuation ' + token)
+
+        if endpoint == 'search':
+            return self.serve('search_songs' if body.get('params') else 'search')
+        if endpoint == 'next':
+            return self.serve('watch')
+        if endpoint == 'player':
+            return self.serve('player')
+        if endpoint == 'browse':
+            browse_id = body.get('browseId', '')
+            for prefix, name in BROWSE_FIXTURES:
+                if browse_id.startswith(prefix):
+                    if name == 'playlist':
+                        return self.serve(name, self.playlist_pages[0])
+                    if name == 'artist' and body.get('params'):
+                        name = 'artist_albums'
+                    return self.serve(name)
+        return get_error(404, 'No fixture for ' + endpoint)
+
+    def serve(self, name, content=None):
+        with self._lock:
+            self.served[name] += 1
+        return 200, content if content is not None else self.responses[name]
+
+
+class ReplayHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        if urlsplit(self.path).path == '/':
+            self.send(200, HOME_PAGE, 'text/html; charset=utf-8')
+        else:
+            self.send(*get_error(404, 'Not found'))
+
+    def do_POST(self):
+        url = urlsplit(self.path)
+        data = self.rfile.read(int(self.headers.get('content-length', 0)))
+        if not url.path.startswith(YTM_API_PATH):
+            return self.send(*get_error(404, 'Not found'))
+        if self.headers.get('content-encoding') == 'gzip':
+            data = gzip.decompress(data)
+        try:
+            body = json.loads(data) if data else {}
+        except ValueError:
+            return self.send(*get_error(400, 'Invalid JSON body'))
+
+        time.sleep(self.server.get_delay())
+        if self.server.should_fail():
+            return self.send(*get_error(self.server.error_status, 'Injected error'))
+        endpoint = url.path[len(YTM_API_PATH):]
+        self.send(*self.server.get_response(endpoint, parse_qs(url.query), body))
+
+    def send(self, status, content, content_type='application/json; charset=utf-8'):
+        self.send_response(status)
+        self.send_header('content-type', content_type)
+        self.send_header('content-length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--latency', type=float, default=0)
+    parser.add_argument('--jitter', type=float, default=0)
+    parser.add_argument('--error-rate', type=float, default=0)
+    parser.add_argument('--error-status', type=int, default=500)
+    parser.add_argument('--pages', type=int, default=10)
+    args = parser.parse_args()
+
+    server = ReplayServer((args.host, args.port), args.latency, args.jitter, args.error_rate,
+                          args.error_status, args.pages)
+    print("Replaying fixtures on " + server.url)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
@@ -1,10 +1,26 @@
+import asyncio
 import unittest
 import unittest.mock
 import configparser
+import requests
+import os
+import subprocess
+import tempfile
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 import sys
 sys.path.insert(0, '..')
 from ytmusicapi.ytmusic import YTMusic  # noqa: E402
+from ytmusicapi.async_ytmusic import AsyncYTMusic  # noqa: E402
+from ytmusicapi.bootstrap import BootstrapCache  # noqa: E402
+from ytmusicapi.constants import YTM_DOMAIN  # noqa: E402
+from ytmusicapi.cache import MemoryCache, SQLiteCache  # noqa: E402
+from ytmusicapi.instrumentation import CallEvent, RequestEvent  # noqa: E402
+from ytmusicapi.exceptions import YTMusicServerError  # noqa: E402
+from ytmusicapi.retry import RetryPolicy  # noqa: E402
+from ytmusicapi.ratelimit import RateLimiter  # noqa: E402
+from ytmusicapi.signature import SignatureTimestampCache  # noqa: E402
 
 config = configparser.RawConfigParser()
 config.read('./test.cfg', 'utf-8')
@@ -24,6 +40,41 @@ class TestYTMusic(unittest.TestCase):
     def test_init(self):
         self.assertRaises(Exception, YTMusic, "{}")
 
+    def test_lazy(self):
+        yt_lazy = YTMusic(lazy=True, requests_session=False)
+        with unittest.mock.patch('requests.api.request') as request:
+            YTMusic(lazy=True, requests_session=False)
+            request.assert_not_called()
+        for language in ['xx', '', '..', 'en/../de']:
+            self.assertRaises(Exception, YTMusic, language=language, lazy=True)
+        self.assertGreater(len(yt_lazy.search("oasis")), 10)
+        self.assertIsNotNone(yt_lazy.visitor_id)
+        with unittest.mock.patch.object(YTMusic, '_send_get_request') as send_get_request:
+            yt_visitor = YTMusic(visitor_id=yt_lazy.visitor_id)
+            send_get_request.assert_not_called()
+        self.assertEqual(yt_visitor.visitor_id, yt_lazy.visitor_id)
+
+    def test_lazy_imports(self):
+        code = "import sys, ytmusicapi.parsers.search_params; print('requests' in sys.modules)"
+        result = subprocess.run([sys.executable, '-c', code],
+                                cwd='..',
+                                capture_output=True,
+                                text=True)
+        self.assertEqual(result.stdout.strip(), 'False')
+        import ytmusicapi
+        self.assertIs(ytmusicapi.YTMusic, YTMusic)
+
+    def test_parser_registry(self):
+        yt_de = YTMusic(language='de')
+        self.assertIs(YTMusic(language='de').parser, yt_de.parser)
+        self.assertIsNot(self.yt.parser, yt_de.parser)
+        with ThreadPoolExecutor(4) as executor:
+            artists = list(
+                executor.map(lambda yt: yt.get_artist("MPLAUCmMUZbaYdNH0bEd1PAlAqsA"),
+                             [self.yt, yt_de] * 4))
+        for artist in artists:
+            self.assertGreaterEqual(len(artist['albums']['results']), 1)
+
     def test_setup(self):
         headers = YTMusic.setup(config['auth']['headers_file'], config['auth']['headers_raw'])
         self.assertGreaterEqual(len(headers), 2)
@@ -32,6 +83,161 @@ class TestYTMusic(unittest.TestCase):
             headers = YTMusic.setup(config['auth']['headers_file'])
             self.assertGreaterEqual(len(headers), 2)
 
+    def test_async(self):
+        async def run():
+            async with AsyncYTMusic() as yt_async:
+                return await asyncio.gather(yt_async.search("oasis", filter="songs"),
+                                            yt_async.get_album(sample_album))
+
+        search, album = asyncio.run(run())
+        self.assertGreater(len(search), 10)
+        self.assertGreaterEqual(len(album['tracks']), 9)
+
+    def test_async_threads(self):
+        async def run():
+            async with AsyncYTMusic() as yt_async:
+                await yt_async.get_album(sample_album)
+                threads = threading.active_count()
+                albums = await asyncio.gather(*[yt_async.get_album(sample_album)] * 20)
+                self.assertEqual(threading.active_count(), threads)
+                fetched = [album async for _, album in yt_async.iter_albums([sample_album] * 3)]
+                return albums + fetched
+
+        albums = asyncio.run(run())
+        self.assertEqual(len(albums), 23)
+        self.assertTrue(all(len(album['tracks']) >= 9 for album in albums))
+
+    def test_cache(self):
+        yt_cached = YTMusic(cache=MemoryCache())
+        album = yt_cached.get_album(sample_album)
+        self.assertEqual(yt_cached.get_album(sample_album), album)
+        self.assertEqual(yt_cached.cache.hits, 1)
+        yt_cached.search("oasis")
+        self.assertEqual(yt_cached.cache.misses, 1)
+        yt_auth_cached = YTMusic(config['auth']['headers_file'], cache=MemoryCache())
+        yt_auth_cached.get_playlist(sample_playlist)
+        yt_auth_cached.get_playlist(sample_playlist)
+        yt_auth_cached.get_album(sample_album)
+        yt_auth_cached.get_album(sample_album)
+        self.assertEqual(yt_auth_cached.cache.hits, 0)
+
+    def test_bootstrap_cache(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'bootstrap.json')
+            yt_first = YTMusic(bootstrap_cache=BootstrapCache(path))
+            with unittest.mock.patch.object(YTMusic, '_load_bootstrap') as load_bootstrap:
+                yt_restarted = YTMusic(bootstrap_cache=BootstrapCache(path))
+                load_bootstrap.assert_not_called()
+        self.assertEqual(yt_restarted.visitor_id, yt_first.visitor_id)
+        self.assertEqual(yt_restarted.context, yt_first.context)
+        self.assertGreater(len(yt_restarted.search("oasis")), 10)
+        with unittest.mock.patch.object(YTMusic, '_refresh_bootstrap') as refresh_bootstrap:
+            self.assertRaises(Exception, yt_restarted.get_album, "MPREb_invalid")
+            refresh_bootstrap.assert_not_called()
+
+    def test_sqlite_cache(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'cache.sqlite')
+            yt_cached = YTMusic(cache=SQLiteCache(path))
+            playlist = yt_cached.get_playlist(sample_playlist, limit=200)
+            yt_restarted = YTMusic(cache=SQLiteCache(path))
+            self.assertEqual(yt_restarted.get_playlist(sample_playlist, limit=200), playlist)
+            self.assertEqual(yt_restarted.cache.misses, 0)
+
+    def test_session_options(self):
+        self.assertRaises(requests.exceptions.Timeout,
+                          YTMusic,
+                          read_timeout=0.001,
+                          bootstrap_cache=BootstrapCache())
+        yt_closing = YTMusic(pool_maxsize=2, keep_alive=False)
+        self.assertGreater(len(yt_closing.search("oasis")), 10)
+
+    def test_async_session_options(self):
+        async def search(**kwargs):
+            async with AsyncYTMusic(bootstrap_cache=BootstrapCache(), **kwargs) as yt_async:
+                return await yt_async.search("oasis")
+
+        self.assertRaises(requests.exceptions.Timeout, asyncio.run, search(read_timeout=0.001))
+        self.assertGreater(len(asyncio.run(search(pool_maxsize=2, keep_alive=False))), 10)
+        self.assertRaises(Exception, AsyncYTMusic, pool_connections=4)
+
+    def test_retry(self):
+        yt_retry = YTMusic(retry_policy=RetryPolicy(backoff=0))
+        error = requests.Response()
+        error.status_code, error.reason, error._content = 503, 'Service Unavailable', b'{}'
+        post = yt_retry._session.post
+        errors = [error, error]
+        with unittest.mock.patch.object(yt_retry._session, 'post',
+                                        lambda *args, **kwargs: errors.pop()
+                                        if errors else post(*args, **kwargs)):
+            self.assertEqual(yt_retry.get_song(sample_video)['videoDetails']['videoId'],
+                             sample_video)
+            errors = [error] * 3
+            self.assertRaises(YTMusicServerError, yt_retry.get_song, sample_video)
+
+    def test_rate_limiter(self):
+        # identical concurrent requests would share a single request and a single token
+        yt_limited = YTMusic(rate_limiter=RateLimiter({'browse': 2}), coalesce_requests=False)
+        start = time.time()
+        with ThreadPoolExecutor(3) as executor:
+            list(executor.map(yt_limited.get_album, [sample_album] * 3))
+        self.assertGreaterEqual(time.time() - start, 1)
+
+    def test_coalesce_requests(self):
+        events = []
+        yt_observed = YTMusic(observers=[events.append])
+        with ThreadPoolExecutor(4) as executor:
+            albums = list(executor.map(yt_observed.get_album, [sample_album] * 4))
+        self.assertTrue(all(album == albums[0] for album in albums))
+        self.assertTrue(any(getattr(event, 'coalesced', False) for event in events))
+
+    def test_async_coalesce_requests(self):
+        events = []
+
+        async def run():
+            async with AsyncYTMusic(observers=[events.append]) as yt_async:
+                return await asyncio.gather(*[yt_async.get_album(sample_album)] * 4)
+
+        albums = asyncio.run(run())
+        self.assertTrue(all(album == albums[0] for album in albums))
+        album_requests = [e for e in events if getattr(e, 'kind', None) == 'album']
+        self.assertEqual(len(album_requests), 4)
+        self.assertEqual(sum(not e.coalesced for e in album_requests), 1)
+
+    def test_threads(self):
+        with ThreadPoolExecutor(8) as executor:
+            results = list(executor.map(self.yt_auth.get_library_playlists, [25] * 16))
+        self.assertTrue(all(result == results[0] for result in results))
+        self.assertNotIn('Authorization', self.yt_auth.headers)
+
+    def test_prefetch_continuations(self):
+        yt_prefetch = YTMusic(prefetch_continuations=True)
+        tracks = yt_prefetch.get_playlist(sample_playlist, limit=300)['tracks']
+        self.assertEqual(tracks, self.yt.get_playlist(sample_playlist, limit=300)['tracks'])
+        self.assertEqual(list(yt_prefetch.iter_playlist_tracks(sample_playlist, limit=300)),
+                         tracks)
+
+    def test_json_decoder(self):
+        self.assertRaises(Exception, YTMusic, json_decoder='ujson')
+        yt_json = YTMusic(json_decoder='json')
+        self.assertEqual(yt_json.get_album(sample_album), self.yt.get_album(sample_album))
+
+    def test_observers(self):
+        events = []
+        yt_observed = YTMusic(observers=[events.append])
+        yt_observed.get_playlist(sample_playlist, limit=200)
+        call = events[-1]
+        self.assertIsInstance(call, CallEvent)
+        self.assertEqual(call.name, 'get_playlist')
+        requests = [event for event in events if isinstance(event, RequestEvent)]
+        self.assertEqual(call.requests, len(requests))
+        self.assertEqual([event.page for event in requests], list(range(call.pages + 1)))
+        self.assertTrue(all(event.call == 'get_playlist' for event in requests))
+        self.assertEqual(call.bytes_in, sum(event.bytes_in for event in requests))
+        yt_observed.remove_observer(events.append)
+        yt_observed.search("oasis")
+        self.assertEqual(events[-1], call)
+
     ###############
     # BROWSING
     ###############
@@ -69,6 +275,24 @@ class TestYTMusic(unittest.TestCase):
         results = self.yt_auth.search("hip hop", filter='featured_playlists')
         self.assertGreater(len(results), 5)
 
+    def test_search_many(self):
+        queries = ["oasis wonderwall", "blur song 2", "oasis wonderwall"]
+        results = self.yt.search_many(queries, filters=['songs', 'videos', 'fakefilter'])
+        self.assertEqual(len(results), 6)
+        self.assertGreater(len(results[("blur song 2", 'songs')]), 10)
+        self.assertIsInstance(results[("oasis wonderwall", 'fakefilter')], Exception)
+        calls = []
+        yt_observed = YTMusic(observers=[calls.append])
+        yt_observed.search_many(["oasis", "blur"], filters=['songs', 'videos'])
+        calls = [event for event in calls if isinstance(event, CallEvent)]
+        self.assertEqual([call.name for call in calls], ['search_many'])
+        self.assertGreaterEqual(calls[0].requests, 4)
+
+    def test_iter_search(self):
+        results = list(self.yt.iter_search("edm playlist", filter='songs', limit=45))
+        self.assertEqual(len(results), 45)
+        self.assertEqual(results[:20], self.yt.search("edm playlist", filter='songs'))
+
     def test_search_uploads(self):
         self.assertRaises(Exception,
                           self.yt.search,
@@ -112,6 +336,15 @@ class TestYTMusic(unittest.TestCase):
                                             artist['albums']['params'])
         self.assertGreater(len(results), 0)
 
+    def test_get_artists(self):
+        channel_ids = ["UCAeLFBCQS7FvI8PvBrWvSBg", "UCinvalid", "UCmMUZbaYdNH0bEd1PAlAqsA"]
+        artists = self.yt.get_artists(channel_ids, max_workers=4)
+        self.assertIsInstance(artists[1], Exception)
+        albums = self.yt.get_artist_albums(artists[0]['albums']['browseId'],
+                                           artists[0]['albums']['params'])
+        self.assertEqual(artists[0]['albums']['results'], albums)
+        self.assertGreater(len(artists[2]['singles']['results']), 0)
+
     def test_get_artist_singles(self):
         artist = self.yt_auth.get_artist("UCAeLFBCQS7FvI8PvBrWvSBg")
         results = self.yt_auth.get_artist_albums(artist['singles']['browseId'],
@@ -141,6 +374,15 @@ class TestYTMusic(unittest.TestCase):
         results = self.yt.get_album("MPREb_BQZvl3BFGay")
         self.assertEqual(len(results['tracks']), 7)
 
+    def test_get_albums(self):
+        browse_ids = [sample_album, "MPREb_invalid", "MPREb_BQZvl3BFGay"]
+        results = self.yt.get_albums(browse_ids, max_workers=2)
+        self.assertEqual(results[0]['title'], 'Revival')
+        self.assertIsInstance(results[1], Exception)
+        self.assertEqual(len(results[2]['tracks']), 7)
+        results = dict(self.yt.iter_albums(iter(browse_ids)))
+        self.assertEqual(set(results), set(browse_ids))
+
     def test_get_song(self):
         song = self.yt_auth.get_song(config['uploads']['private_upload_id'])  # private upload
         self.assertEqual(len(song), 5)
@@ -162,9 +404,36 @@ class TestYTMusic(unittest.TestCase):
         self.assertIsNone(playlist["lyrics"])
         self.assertRaises(Exception, self.yt.get_lyrics, playlist["lyrics"])
 
+    def test_async_shared_loads(self):
+        events = []
+        bootstrap_cache, signature_cache = BootstrapCache(), SignatureTimestampCache()
+
+        async def run():
+            clients = [
+                AsyncYTMusic(observers=[events.append],
+                             bootstrap_cache=bootstrap_cache,
+                             signature_cache=signature_cache) for _ in range(4)
+            ]
+            songs = await asyncio.gather(*[c.get_song(sample_video) for c in clients] * 5)
+            for client in clients:
+                await client.close()
+            return songs
+
+        songs = asyncio.run(run())
+        self.assertEqual(len(songs), 20)
+        urls = [event.endpoint for event in events if event.method == 'GET']
+        # the start page is loaded once for the visitor id and once for the URL of base.js
+        self.assertEqual(urls.count(YTM_DOMAIN), 2)
+        self.assertEqual(len([url for url in urls if url.endswith('base.js')]), 1)
+
     def test_get_signatureTimestamp(self):
         signatureTimestamp = self.yt.get_signatureTimestamp()
         self.assertIsNotNone(signatureTimestamp)
+        with unittest.mock.patch.object(YTMusic, '_send_get_request') as send_get_request:
+            self.assertEqual(self.yt.get_signatureTimestamp(), signatureTimestamp)
+            song = self.yt.get_song(sample_video)
+            send_get_request.assert_not_called()
+        self.assertEqual(song['videoDetails']['videoId'], sample_video)
 
     def test_set_tasteprofile(self):
         self.assertRaises(Exception, self.yt.set_tasteprofile, "not an artist")
@@ -241,6 +510,14 @@ class TestYTMusic(unittest.TestCase):
         songs = self.yt_auth.get_library_songs(order='a_to_z')
         self.assertGreaterEqual(len(songs), 25)
 
+    def test_iter_library(self):
+        songs = list(self.yt_auth.iter_library_songs(limit=40))
+        self.assertEqual(songs, self.yt_auth.get_library_songs(40)[:40])
+        albums = list(self.yt_auth.iter_library_albums(limit=30))
+        self.assertGreater(len(albums), 25)
+        artists = list(self.yt_auth.iter_library_artists(limit=30))
+        self.assertGreater(len(artists), 25)
+
     def test_get_library_albums(self):
         albums = self.yt_auth.get_library_albums(100)
         self.assertGreater(len(albums), 50)
@@ -277,6 +554,11 @@ class TestYTMusic(unittest.TestCase):
         songs = self.yt_auth.get_history()
         self.assertGreater(len(songs), 0)
 
+    def test_iter_history(self):
+        self.assertRaises(Exception, self.yt.iter_history)
+        songs = self.yt_auth.iter_history()
+        self.assertIn('played', next(songs))
+
     @unittest.skip
     def test_remove_history_items(self):
         songs = self.yt_auth.get_history()
@@ -326,6 +608,18 @@ class TestYTMusic(unittest.TestCase):
         self.assertGreater(len(playlist['tracks']), 100)
         self.assertEqual(len(playlist['related']), 10)
 
+    def test_iter_playlist_tracks(self):
+        tracks = self.yt.iter_playlist_tracks(sample_playlist, limit=300)
+        self.assertIsNotNone(next(tracks)['videoId'])
+        self.assertEqual(len(list(tracks)), 299)
+
+        tracks = self.yt.iter_playlist_tracks(sample_playlist, limit=150)
+        first = list(tracks)
+        resumed = self.yt.iter_playlist_tracks(sample_playlist, limit=150, cursor=tracks.cursor)
+        self.assertEqual(first + list(resumed),
+                         list(self.yt.iter_playlist_tracks(sample_playlist, limit=300)))
+        self.assertRaises(Exception, self.yt.iter_playlist_tracks, "PL", cursor=tracks.cursor)
+
     def test_get_owned_playlist(self):
         playlist = self.yt_brand.get_playlist(config['playlists']['own'],
                                               related=True,
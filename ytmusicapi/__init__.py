@@ -1,12 +1,65 @@
-from ytmusicapi.ytmusic import YTMusic
-from importlib.metadata import version, PackageNotFoundError
+import importlib
+from typing import TYPE_CHECKING
 
-try:
-    __version__ = version("ytmusicapi")
-except PackageNotFoundError:
-    # package is not installed
-    pass
+if TYPE_CHECKING:
+    from ytmusicapi.ytmusic import YTMusic
+    from ytmusicapi.async_ytmusic import AsyncYTMusic
+    from ytmusicapi.bootstrap import BootstrapCache
+    from ytmusicapi.cache import ResponseCache, MemoryCache, SQLiteCache
+    from ytmusicapi.continuations import ResumableIterator, save_cursor, load_cursor
+    from ytmusicapi.instrumentation import RequestEvent, CallEvent
+    from ytmusicapi.retry import RetryPolicy
+    from ytmusicapi.ratelimit import RateLimiter
+    from ytmusicapi.signature import SignatureTimestampCache
+    from ytmusicapi.exceptions import (YTMusicError, YTMusicHTTPError, YTMusicClientError,
+                                       YTMusicRateLimitError, YTMusicServerError)
+
+# exported names and their modules, imported on first access so that importing the package
+# or one of its submodules doesn't load requests, the mixins and all parsers
+_exports = {
+    'YTMusic': 'ytmusicapi.ytmusic',
+    'AsyncYTMusic': 'ytmusicapi.async_ytmusic',
+    'BootstrapCache': 'ytmusicapi.bootstrap',
+    'ResponseCache': 'ytmusicapi.cache',
+    'MemoryCache': 'ytmusicapi.cache',
+    'SQLiteCache': 'ytmusicapi.cache',
+    'ResumableIterator': 'ytmusicapi.continuations',
+    'save_cursor': 'ytmusicapi.continuations',
+    'load_cursor': 'ytmusicapi.continuations',
+    'RequestEvent': 'ytmusicapi.instrumentation',
+    'CallEvent': 'ytmusicapi.instrumentation',
+    'RetryPolicy': 'ytmusicapi.retry',
+    'RateLimiter': 'ytmusicapi.ratelimit',
+    'SignatureTimestampCache': 'ytmusicapi.signature',
+    'YTMusicError': 'ytmusicapi.exceptions',
+    'YTMusicHTTPError': 'ytmusicapi.exceptions',
+    'YTMusicClientError': 'ytmusicapi.exceptions',
+    'YTMusicRateLimitError': 'ytmusicapi.exceptions',
+    'YTMusicServerError': 'ytmusicapi.exceptions',
+}
+
+__all__ = list(_exports)
 
 __copyright__ = 'Copyright 2022 sigma67'
 __license__ = 'MIT'
 __title__ = 'ytmusicapi'
+
+
+def __getattr__(name):
+    if name in _exports:
+        value = getattr(importlib.import_module(_exports[name]), name)
+    elif name == '__version__':
+        from importlib.metadata import version, PackageNotFoundError
+        try:
+            value = version("ytmusicapi")
+        except PackageNotFoundError:
+            # package is not installed
+            raise AttributeError(name) from None
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_exports) | {'__version__'})
@@ -0,0 +1,430 @@
+import asyncio
+import time
+from datetime import timedelta
+from itertools import islice
+from typing import AsyncIterator, Dict, Iterable, List, Tuple, Union
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from ytmusicapi.greenlets import spawn, in_call, wait
+from ytmusicapi.ytmusic import YTMusic
+
+
+class _AsyncResponse:
+    """Minimal stand-in for :class:`requests.Response` built from an aiohttp response."""
+    def __init__(self,
+                 status_code: int,
+                 reason: str,
+                 content: bytes,
+                 headers: Dict,
+                 encoding: str,
+                 elapsed: timedelta = None,
+                 connect_time: float = None):
+        self.status_code = status_code
+        self.reason = reason
+        self.content = content
+        self.headers = headers
+        self.encoding = encoding or 'utf-8'
+        #: Time until the response headers arrived, as in requests
+        self.elapsed = elapsed
+        #: Time spent opening a new connection, None if a pooled connection was reused
+        self.connect_time = connect_time
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding, errors='replace')
+
+
+def _create_trace_config():
+    """Records the time spent opening new connections in the ``trace_request_ctx`` dict."""
+    import aiohttp
+
+    async def on_connection_create_start(session, context, params):
+        context.connect_start = time.perf_counter()
+
+    async def on_connection_create_end(session, context, params):
+        if context.trace_request_ctx is not None:
+            context.trace_request_ctx['connect_time'] = (time.perf_counter()
+                                                         - context.connect_start)
+
+    trace_config = aiohttp.TraceConfig()
+    trace_config.on_connection_create_start.append(on_connection_create_start)
+    trace_config.on_connection_create_end.append(on_connection_create_end)
+    return trace_config
+
+
+class _AiohttpSession:
+    """
+    Exposes the part of the requests session API used by :class:`YTMusic`
+    on top of an aiohttp session living on an event loop.
+
+    Called from a greenlet started by :py:func:`spawn`, the blocking methods await the request
+    on the event loop, which serves other calls meanwhile. Called from another thread, such as
+    the one refreshing the signatureTimestamp, they wait for the request to complete on the loop.
+    """
+    def __init__(self,
+                 loop: asyncio.AbstractEventLoop,
+                 connections: int,
+                 connections_per_host: int = None,
+                 connect_timeout: float = 30,
+                 read_timeout: float = 30,
+                 keep_alive: bool = True):
+        self._loop = loop
+        self._connections = connections
+        self._connections_per_host = connections_per_host
+        self._connect_timeout = connect_timeout
+        self._read_timeout = read_timeout
+        self._keep_alive = keep_alive
+        self._session = None
+
+    def request(self, method: str, url: str, **kwargs) -> _AsyncResponse:
+        return self.wait(self._request(method, url, **kwargs))
+
+    def wait(self, coroutine):
+        """Runs `coroutine` on the event loop and blocks the caller until it is done."""
+        if in_call():
+            return wait(coroutine)
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self._loop:
+            coroutine.close()
+            raise Exception("AsyncYTMusic can't send requests from outside its coroutines "
+                            "on the thread of its event loop.")
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop).result()
+
+    def get(self, url: str, **kwargs) -> _AsyncResponse:
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> _AsyncResponse:
+        return self.request('POST', url, **kwargs)
+
+    async def _request(self,
+                       method,
+                       url,
+                       params=None,
+                       data=None,
+                       json=None,
+                       headers=None,
+                       proxies=None,
+                       cookies=None):
+        import aiohttp
+
+        if self._session is None:
+            connector = aiohttp.TCPConnector(limit=self._connections,
+                                             limit_per_host=self._connections_per_host or 0,
+                                             force_close=not self._keep_alive)
+            timeout = aiohttp.ClientTimeout(total=None,
+                                            sock_connect=self._connect_timeout,
+                                            sock_read=self._read_timeout)
+            self._session = aiohttp.ClientSession(connector=connector,
+                                                  timeout=timeout,
+                                                  trace_configs=[_create_trace_config()])
+        proxy = proxies.get(url.split(':', 1)[0]) if proxies else None
+        try:
+            return await self._send(method, url, params, data, json, headers, proxy, cookies)
+        except asyncio.TimeoutError as e:
+            # raised as ServerTimeoutError for both phases before aiohttp 3.10
+            if isinstance(e, getattr(aiohttp, 'ConnectionTimeoutError', ())):
+                raise requests.exceptions.ConnectTimeout(e)
+            raise requests.exceptions.ReadTimeout(e)
+        except aiohttp.ClientConnectionError as e:
+            raise requests.exceptions.ConnectionError(e)
+
+    async def _send(self, method, url, params, data, json, headers, proxy, cookies):
+        trace = {}
+        start = time.perf_counter()
+        async with self._session.request(method,
+                                         url,
+                                         params=params,
+                                         data=data,
+                                         json=json,
+                                         headers=dict(headers) if headers else None,
+                                         proxy=proxy,
+                                         cookies=cookies,
+                                         trace_request_ctx=trace) as response:
+            elapsed = timedelta(seconds=time.perf_counter() - start)
+            content = await response.read()
+            return _AsyncResponse(response.status, response.reason, content,
+                                  CaseInsensitiveDict(response.headers), response.charset, elapsed,
+                                  trace.get('connect_time'))
+
+    async def close(self):
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+
+class _GreenletYTMusic(YTMusic):
+    """:class:`YTMusic` whose calls run in greenlets started by :py:func:`spawn`."""
+    def _sleep(self, seconds: float):
+        self._session.wait(asyncio.sleep(seconds))
+
+
+class AsyncYTMusic:
+    """
+    asyncio version of :class:`YTMusic`.
+
+    Exposes the same methods as :class:`YTMusic` as coroutines, and the ``iter_`` methods
+    as asynchronous iterators. Each call runs the methods and parsers of :class:`YTMusic`
+    in a greenlet on the running event loop, which sends its requests with aiohttp and
+    serves other calls while they are in flight, so many calls can run at once without threads.
+    Requires the ``async`` extra: ``pip install ytmusicapi[async]``.
+
+    Example::
+
+        async with AsyncYTMusic() as ytmusic:
+            albums = await asyncio.gather(*[ytmusic.get_album(b) for b in browseIds])
+
+    An instance must only be used from a single event loop. Parsing runs on the event loop,
+    so large responses delay other tasks for as long as :class:`YTMusic` takes to parse them.
+    """
+    def __init__(self,
+                 auth: str = None,
+                 user: str = None,
+                 proxies: dict = None,
+                 language: str = 'en',
+                 max_concurrency: int = 100,
+                 **kwargs):
+        """
+        Create a new instance to interact with YouTube Music from asyncio code.
+
+        :param auth: Optional. See :py:func:`YTMusic.__init__`
+        :param user: Optional. See :py:func:`YTMusic.__init__`
+        :param proxies: Optional. See :py:func:`YTMusic.__init__`
+        :param language: Optional. See :py:func:`YTMusic.__init__`
+        :param max_concurrency: Maximum number of connections open at the same time.
+            Further requests wait for a free connection. Default: 100
+        :param kwargs: Further keyword arguments passed on to :py:func:`YTMusic.__init__`.
+            `connect_timeout`, `read_timeout` and `keep_alive` apply to the aiohttp session,
+            and `pool_maxsize` limits its connections per host. Default: Only `max_concurrency`.
+            `requests_session`, `pool_connections` and `prefetch_continuations`
+            are not supported
+        """
+        try:
+            import aiohttp  # noqa: F401
+            import greenlet  # noqa: F401
+        except ImportError:
+            raise Exception("AsyncYTMusic requires aiohttp and greenlet. "
+                            "Install them with `pip install ytmusicapi[async]`.")
+        for unsupported in ['requests_session', 'pool_connections', 'prefetch_continuations']:
+            if kwargs.get(unsupported):
+                raise Exception("AsyncYTMusic doesn't support " + unsupported + ".")
+            kwargs.pop(unsupported, None)
+
+        self._session_options = {
+            'connections': max_concurrency,
+            'connections_per_host': kwargs.pop('pool_maxsize', None),
+            'connect_timeout': kwargs.pop('connect_timeout', 30),
+            'read_timeout': kwargs.pop('read_timeout', 30),
+            'keep_alive': kwargs.pop('keep_alive', True),
+        }
+        kwargs.pop('lazy', None)
+        self._kwargs = dict(kwargs, auth=auth, user=user, proxies=proxies, language=language)
+        self._lock = None
+        self._session = None
+        self._ytmusic = None
+
+    async def _client(self) -> YTMusic:
+        if self._ytmusic is None:
+            if self._lock is None:
+                self._lock = asyncio.Lock()
+            async with self._lock:
+                if self._ytmusic is None:
+                    self._session = _AiohttpSession(asyncio.get_running_loop(),
+                                                    **self._session_options)
+                    self._ytmusic = await spawn(_GreenletYTMusic,
+                                                requests_session=self._session,
+                                                **self._kwargs)
+        return self._ytmusic
+
+    async def close(self):
+        """Close the underlying aiohttp session."""
+        if self._session is not None:
+            await self._session.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, execType=None, execValue=None, trackback=None):
+        await self.close()
+
+    async def get_albums(self,
+                         browseIds: List[str],
+                         max_workers: int = 8) -> List[Union[Dict, Exception]]:
+        """
+        Get information and tracks of many albums, fetched concurrently.
+        A failed album does not fail the batch: the exception raised for it
+        is returned in its place.
+
+        :param browseIds: browseIds of the albums
+        :param max_workers: Number of albums fetched at the same time. Default: 8
+        :return: List of albums in the format returned by :py:func:`get_album`
+            or exceptions, in the order of `browseIds`
+        """
+        semaphore = asyncio.Semaphore(max_workers)
+        return await asyncio.gather(
+            *[_limited(semaphore, self.get_album(browseId)) for browseId in browseIds],
+            return_exceptions=True)
+
+    async def iter_albums(
+            self,
+            browseIds: Iterable[str],
+            max_workers: int = 8) -> AsyncIterator[Tuple[str, Union[Dict, Exception]]]:
+        """
+        Like :py:func:`get_albums`, but yields each album as soon as it has been fetched,
+        so results can be processed while the rest of the batch is still in flight.
+        `browseIds` is consumed lazily and may be a generator.
+
+        :param browseIds: browseIds of the albums
+        :param max_workers: Number of albums fetched at the same time. Default: 8
+        :return: Asynchronous iterator of tuples of browseId and album or exception,
+            in the order the albums were fetched
+        """
+        browseIds = iter(browseIds)
+        pending = {}
+        try:
+            while True:
+                for browseId in islice(browseIds, max_workers - len(pending)):
+                    pending[asyncio.ensure_future(self.get_album(browseId))] = browseId
+                if not pending:
+                    return
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    browseId = pending.pop(task)
+                    yield browseId, task.exception() or task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def get_artists(self,
+                          channelIds: List[str],
+                          include_discography: bool = True,
+                          max_workers: int = 8) -> List[Union[Dict, Exception]]:
+        """
+        Get information about many artists, fetched concurrently.
+        With `include_discography`, the full lists of albums and singles are requested as soon as
+        each artist page has arrived. A failed artist does not fail the batch:
+        the exception raised for it is returned in its place.
+
+        :param channelIds: channel ids of the artists
+        :param include_discography: Whether to replace the top albums and singles
+            of each artist with the full lists returned by :py:func:`get_artist_albums`.
+            Default: True
+        :param max_workers: Number of requests sent at the same time. Default: 8
+        :return: List of artists in the format returned by :py:func:`get_artist`
+            or exceptions, in the order of `channelIds`
+        """
+        semaphore = asyncio.Semaphore(max_workers)
+
+        async def get_artist(channelId):
+            artist = await _limited(semaphore, self.get_artist(channelId))
+            if include_discography:
+                categories = [c for c in ['albums', 'singles'] if artist.get(c, {}).get('params')]
+                discographies = await asyncio.gather(*[
+                    _limited(semaphore,
+                             self.get_artist_albums(artist[c]['browseId'], artist[c]['params']))
+                    for c in categories
+                ])
+                for category, discography in zip(categories, discographies):
+                    artist[category]['results'] = discography
+            return artist
+
+        return await asyncio.gather(*[get_artist(channelId) for channelId in channelIds],
+                                    return_exceptions=True)
+
+    async def search_many(
+            self,
+            queries: Iterable[str],
+            filters: List[str] = None,
+            scope: str = None,
+            limit: int = 20,
+            ignore_spelling: bool = False,
+            max_workers: int = 8) -> Dict[Tuple[str, str], Union[List[Dict], Exception]]:
+        """
+        Search YouTube Music for each combination of many queries and filters concurrently.
+        Duplicate combinations are only searched once. A failed search does not fail the batch:
+        the exception raised for it is returned in its place.
+
+        :param queries: Query strings
+        :param filters: Filters to search each query with, see :py:func:`search`.
+            ``None`` in the list stands for the default search. Default: ``[None]``
+        :param scope: Search scope. See :py:func:`search`
+        :param limit: Number of search results to return per search. Default: 20
+        :param ignore_spelling: Whether to ignore YTM spelling suggestions. See :py:func:`search`
+        :param max_workers: Number of searches sent at the same time. Default: 8
+        :return: Dictionary mapping each tuple of query and filter to the list of results
+            returned by :py:func:`search` or to an exception, in the order of the queries
+        """
+        searches = list(
+            dict.fromkeys((query, filter) for query in queries for filter in filters or [None]))
+        semaphore = asyncio.Semaphore(max_workers)
+        searching = [
+            _limited(semaphore, self.search(query, filter, scope, limit, ignore_spelling))
+            for query, filter in searches
+        ]
+        results = await asyncio.gather(*searching, return_exceptions=True)
+        return dict(zip(searches, results))
+
+
+async def _limited(semaphore: asyncio.Semaphore, coroutine):
+    async with semaphore:
+        return await coroutine
+
+
+def _async_method(name):
+    async def method(self, *args, **kwargs):
+        client = await self._client()
+        return await spawn(getattr(client, name), *args, **kwargs)
+
+    method.__name__ = name
+    method.__qualname__ = 'AsyncYTMusic.' + name
+    method.__doc__ = getattr(YTMusic, name).__doc__
+    return method
+
+
+class _AsyncIterator:
+    """Asynchronous iterator over the items of an iterator returned by an ``iter_`` method."""
+    def __init__(self, ytmusic: AsyncYTMusic, name: str, args, kwargs):
+        self._ytmusic = ytmusic
+        self._name = name
+        self._args = args
+        self._kwargs = kwargs
+        self._iterator = None
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self._iterator is None:
+            client = await self._ytmusic._client()
+            self._iterator = await spawn(getattr(client, self._name), *self._args, **self._kwargs)
+        item = await spawn(next, self._iterator, self)
+        if item is self:
+            raise StopAsyncIteration
+        return item
+
+    @property
+    def cursor(self) -> str:
+        """See :py:class:`ResumableIterator`. None before the first item was requested."""
+        return getattr(self._iterator, 'cursor', None)
+
+
+def _async_iterator_method(name):
+    def method(self, *args, **kwargs):
+        return _AsyncIterator(self, name, args, kwargs)
+
+    method.__name__ = name
+    method.__qualname__ = 'AsyncYTMusic.' + name
+    method.__doc__ = getattr(YTMusic, name).__doc__
+    return method
+
+
+for _name in dir(YTMusic):
+    if (not _name.startswith('_') and _name != 'setup' and _name not in vars(AsyncYTMusic)
+            and callable(getattr(YTMusic, _name))):
+        if _name.startswith('iter_'):
+            setattr(AsyncYTMusic, _name, _async_iterator_method(_name))
+        else:
+            setattr(AsyncYTMusic, _name, _async_method(_name))
@@ -0,0 +1,43 @@
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextvars import copy_context
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator, List, Tuple
+
+
+def map_concurrently(func: Callable, items: Iterable,
+                     max_workers: int) -> Iterator[Tuple[int, Any, Any]]:
+    """
+    Calls `func` for each item from a pool of `max_workers` threads.
+
+    Yields the index of each item, the item and its result, or the exception raised for it,
+    in the order the calls finish. At most twice `max_workers` calls are queued at a time,
+    so large batches are consumed lazily. Closing the iterator cancels the queued calls.
+    Calls run in a copy of the caller's context, so that their requests are reported
+    as part of the method call which started them.
+    """
+    items = enumerate(items)
+    pending = {}
+    with ThreadPoolExecutor(max_workers) as executor:
+        try:
+            while True:
+                for index, item in islice(items, 2 * max_workers - len(pending)):
+                    pending[executor.submit(copy_context().run, func, item)] = index, item
+                if not pending:
+                    return
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index, item = pending.pop(future)
+                    error = future.exception()
+                    yield index, item, error if error is not None else future.result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def map_ordered(func: Callable, items: Iterable, max_workers: int) -> List[Any]:
+    """Like :py:func:`map_concurrently`, but returns all results in the order of the items."""
+    items = list(items)
+    results = [None] * len(items)
+    for index, _, result in map_concurrently(func, items, max_workers):
+        results[index] = result
+    return results
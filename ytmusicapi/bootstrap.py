@@ -0,0 +1,151 @@
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+from ytmusicapi.singleflight import SingleFlight
+
+#: Statuses of API errors with which requests sent with an outdated visitor id
+#: or client version fail. Other errors, such as invalid arguments, are not retried
+REJECTED_ERRORS = {'FAILED_PRECONDITION'}
+
+
+def is_rejected(status_code: int, error: Dict) -> bool:
+    """
+    Whether an error response was caused by an outdated visitor id or client version.
+
+    :param status_code: HTTP status of the response
+    :param error: The ``error`` object of the response body
+    """
+    return status_code == 400 and error.get('status') in REJECTED_ERRORS
+
+
+class BootstrapCache:
+    """
+    Stores the visitor id and client version read from the YouTube Music start page,
+    so that new instances don't load the start page again.
+
+    Entries are kept in memory and, if a path is given, in a JSON file which can be shared by
+    the processes on a host. They are loaded again after `max_age` seconds, or when the server
+    rejects a read-only request as sent by an outdated client, which is then sent once more.
+    By default, all instances in a process share a cache.
+
+    Example::
+
+        bootstrap_cache = BootstrapCache('/var/cache/ytmusicapi-bootstrap.json')
+        ytmusic = YTMusic(bootstrap_cache=bootstrap_cache)
+    """
+    def __init__(self,
+                 path: Optional[str] = None,
+                 max_age: float = 24 * 3600,
+                 min_refresh_interval: float = 300):
+        """
+        :param path: Optional. Path of a JSON file to store entries in. It is created
+            if it doesn't exist. Default: Entries are only kept in memory
+        :param max_age: Optional. Seconds after which an entry is loaded again.
+            Default: 24 hours
+        :param min_refresh_interval: Optional. Minimum age in seconds of an entry before it is
+            loaded again because a request with it was rejected, to avoid loading the start page
+            for every failing request. Default: 300
+        """
+        self.path = path
+        self.max_age = max_age
+        self.min_refresh_interval = min_refresh_interval
+        self._entries: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+        self._single_flight = SingleFlight()
+
+    def is_expired(self, entry: Dict) -> bool:
+        return time.time() - entry['created'] >= self.max_age
+
+    def get(self, key: str, load: Callable[[], Dict]) -> Dict:
+        """
+        Returns the entry for `key`, calling `load` to create it if there is none or it expired.
+        Concurrent callers share a single call of `load`.
+
+        :param key: Server and identity the entry is valid for
+        :param load: Function loading the start page and returning a dict
+            with ``visitor_id`` and ``client_version``
+        :return: The entry, with the time it was loaded in ``created``
+        """
+        entry = self._get(key)
+        if entry is None:
+            entry, _ = self._single_flight.do('get:' + key,
+                                              lambda: self._get(key) or self._load(key, load))
+        return entry
+
+    def refresh(self, key: str, load: Callable[[], Dict], rejected: Dict) -> Optional[Dict]:
+        """
+        Replaces the entry for `key` after a request with it was rejected.
+
+        :param rejected: The entry which was rejected
+        :return: The new entry, or None if it is unchanged or the rejected entry
+            is younger than `min_refresh_interval`
+        """
+        def reload():
+            entry = self._get(key)
+            if entry is not None and entry['created'] != rejected['created']:
+                return entry  # already replaced by another thread or process
+            if time.time() - rejected['created'] < self.min_refresh_interval:
+                return None
+            return self._load(key, load)
+
+        entry, _ = self._single_flight.do('refresh:' + key, reload)
+        if entry is None or _values(entry) == _values(rejected):
+            return None
+        return entry
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            if self.path:
+                self._write({})
+
+    def _get(self, key: str) -> Optional[Dict]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if self.path and (entry is None or self.is_expired(entry)):
+                # another process may have stored a newer entry
+                entry = self._read().get(key, entry)
+                if entry is not None:
+                    self._entries[key] = entry
+        return entry if entry is not None and not self.is_expired(entry) else None
+
+    def _load(self, key: str, load: Callable[[], Dict]) -> Dict:
+        entry = dict(load(), created=time.time())
+        with self._lock:
+            self._entries[key] = entry
+            if self.path:
+                entries = self._read()
+                entries[key] = entry
+                self._write(entries)
+        return entry
+
+    def _read(self) -> Dict[str, Dict]:
+        try:
+            with open(self.path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _write(self, entries: Dict[str, Dict]):
+        # write to a temporary file first, so that other processes never read a partial file
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, temp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(entries, f)
+            os.replace(temp_path, self.path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+
+def _values(entry: Dict) -> Dict:
+    return {k: v for k, v in entry.items() if k != 'created'}
+
+
+#: Cache used by instances created without a `bootstrap_cache`
+DEFAULT_BOOTSTRAP_CACHE = BootstrapCache()
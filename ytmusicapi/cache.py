@@ -0,0 +1,224 @@
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from hashlib import sha1
+from typing import Dict, Optional
+from ytmusicapi.constants import YTM_DOMAIN
+
+#: Default time to live in seconds for each kind of cacheable response
+DEFAULT_TTLS = {
+    'album': 24 * 3600,
+    'artist': 6 * 3600,
+    'lyrics': 24 * 3600,
+    'song_related': 3600,
+    'mood_categories': 24 * 3600,
+    'charts': 3600,
+    'playlist': 15 * 60,
+    'home_page': 3600,
+}
+
+# browseId prefixes of read-only browse requests and the kind of response they return
+BROWSE_ID_PREFIXES = [('MPREb_', 'album'), ('UC', 'artist'), ('MPLYt', 'lyrics'),
+                      ('MPTRt', 'song_related'), ('VL', 'playlist')]
+BROWSE_IDS = {'FEmusic_moods_and_genres': 'mood_categories', 'FEmusic_charts': 'charts'}
+
+# context fields which change over time without affecting the response
+VOLATILE_CLIENT_FIELDS = {'clientVersion'}
+
+# kinds of responses which authenticated users change themselves, so that a cached response
+# would be stale after an edit: playlists are edited, album tracks carry the user's
+# likeStatus, which rating songs changes, and artists whether the user is subscribed to them
+USER_EDITABLE_KINDS = {'playlist', 'album', 'artist'}
+
+
+def get_cache_kind(endpoint: str, body: Dict, authenticated: bool = False) -> Optional[str]:
+    """
+    Returns the kind of response for a cacheable request or None if it must not be cached.
+    For GET requests, `endpoint` is the URL and `body` the query parameters.
+    Responses which an authenticated user can change are not cached for them.
+    """
+    if endpoint == YTM_DOMAIN and not body:
+        return 'home_page'
+    if endpoint != 'browse':
+        return None
+    browse_id = body.get('browseId', '')
+    kind = BROWSE_IDS.get(browse_id)
+    if kind is None:
+        kind = next((kind for prefix, kind in BROWSE_ID_PREFIXES if browse_id.startswith(prefix)),
+                    None)
+    if authenticated and kind in USER_EDITABLE_KINDS:
+        return None
+    return kind
+
+
+def get_cache_key(endpoint: str, body: Dict, additionalParams: str = "", identity: str = None):
+    """
+    Builds a cache key from the endpoint and the canonical request body.
+    Volatile context fields are left out, so keys stay valid across client versions.
+    """
+    body = dict(body)
+    context = body.pop('context', {})
+    client = {
+        k: v
+        for k, v in context.get('client', {}).items() if k not in VOLATILE_CLIENT_FIELDS
+    }
+    canonical = json.dumps([additionalParams, body, client,
+                            context.get('user', {}), identity],
+                           sort_keys=True,
+                           separators=(',', ':'))
+    return endpoint + ':' + sha1(canonical.encode('utf-8')).hexdigest()
+
+
+class ResponseCache:
+    """
+    Base class for caches of raw API responses.
+
+    Subclasses implement :py:func:`_get`, :py:func:`_set` and :py:func:`clear`.
+    Hits and misses are counted in :py:attr:`hits` and :py:attr:`misses`.
+    """
+    def __init__(self, ttls: Dict[str, float] = None):
+        """
+        :param ttls: Optional. Time to live in seconds per kind of response,
+            overriding :py:data:`DEFAULT_TTLS`. A falsy value disables caching for that kind.
+        """
+        self.ttls = dict(DEFAULT_TTLS)
+        if ttls:
+            self.ttls.update(ttls)
+        self.hits = 0
+        self.misses = 0
+        self._stats_lock = threading.Lock()
+
+    def get_ttl(self, kind: str) -> Optional[float]:
+        return self.ttls.get(kind)
+
+    def get(self, key: str) -> Optional[bytes]:
+        value = self._get(key)
+        with self._stats_lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return value
+
+    def set(self, key: str, value: bytes, ttl: float):
+        self._set(key, value, ttl)
+
+    def _get(self, key: str) -> Optional[bytes]:
+        raise NotImplementedError
+
+    def _set(self, key: str, value: bytes, ttl: float):
+        raise NotImplementedError
+
+    def clear(self):
+        raise NotImplementedError
+
+
+class MemoryCache(ResponseCache):
+    """
+    In-memory response cache with a size bound and least-recently-used eviction.
+
+    Example::
+
+        ytmusic = YTMusic(cache=MemoryCache(max_bytes=128 * 2**20))
+    """
+    def __init__(self, max_bytes: int = 64 * 2**20, ttls: Dict[str, float] = None):
+        """
+        :param max_bytes: Optional. Maximum total size of cached responses in bytes.
+            Default: 64 MiB
+        :param ttls: Optional. See :py:class:`ResponseCache`
+        """
+        super().__init__(ttls)
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires, value = entry
+            if expires < time.time():
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def _set(self, key, value, ttl):
+        if len(value) > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (time.time() + ttl, value)
+            self.size += len(value)
+            while self.size > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+
+    def _remove(self, key):
+        _, value = self._entries.pop(key)
+        self.size -= len(value)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+
+class SQLiteCache(ResponseCache):
+    """
+    Response cache stored in a single SQLite database file, which can be shared
+    by multiple processes and survives restarts. Responses are stored zlib-compressed.
+
+    Example::
+
+        ytmusic = YTMusic(cache=SQLiteCache('/var/cache/ytmusicapi.sqlite'))
+    """
+    def __init__(self, path: str, ttls: Dict[str, float] = None, timeout: float = 10):
+        """
+        :param path: Path to the database file. It is created if it doesn't exist.
+        :param ttls: Optional. See :py:class:`ResponseCache`
+        :param timeout: Optional. Seconds to wait for a lock held by another process.
+            Default: 10
+        """
+        super().__init__(ttls)
+        self.path = path
+        self.timeout = timeout
+        self._local = threading.local()
+        with self._connection() as connection:
+            connection.execute("CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, "
+                               "expires REAL NOT NULL, value BLOB NOT NULL)")
+
+    def _connection(self) -> sqlite3.Connection:
+        # sqlite3 connections must not be shared between threads
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=self.timeout)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
+
+    def _get(self, key):
+        row = self._connection().execute(
+            "SELECT value FROM responses WHERE key = ? AND expires > ?",
+            (key, time.time())).fetchone()
+        return zlib.decompress(row[0]) if row else None
+
+    def _set(self, key, value, ttl):
+        with self._connection() as connection:
+            connection.execute("INSERT OR REPLACE INTO responses VALUES (?, ?, ?)",
+                               (key, time.time() + ttl, zlib.compress(value)))
+
+    def purge(self):
+        """Delete expired responses from the database."""
+        with self._connection() as connection:
+            connection.execute("DELETE FROM responses WHERE expires <= ?", (time.time(), ))
+
+    def clear(self):
+        with self._connection() as connection:
+            connection.execute("DELETE FROM responses")
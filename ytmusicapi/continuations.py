@@ -1,3 +1,8 @@
+import base64
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
 from ytmusicapi.navigation import nav
 
 
@@ -7,22 +12,156 @@ def get_continuations(results,
                       request_func,
                       parse_func,
                       ctoken_path="",
-                      reloadable=False):
+                      reloadable=False,
+                      prefetch=False,
+                      prefetched=None):
     items = []
-    while 'continuations' in results and (limit is None or len(items) < limit):
-        additionalParams = get_reloadable_continuation_params(results) if reloadable \
-            else get_continuation_params(results, ctoken_path)
-        response = request_func(additionalParams)
+    pages = iter_continuation_pages(results, continuation_type, request_func, parse_func,
+                                    ctoken_path, reloadable, prefetch, prefetched)
+    while limit is None or len(items) < limit:
+        page = next(pages, None)
+        if page is None:
+            break
+        items.extend(page[1])
+
+    return items
+
+
+def iter_continuation_pages(results,
+                            continuation_type,
+                            request_func,
+                            parse_func,
+                            ctoken_path="",
+                            reloadable=False,
+                            prefetch=False,
+                            prefetched=None):
+    """
+    Yields the continuation params used to request each continuation page
+    together with its parsed contents, requesting pages as they are needed.
+
+    With `prefetch`, the next page is requested in the background as soon as its token
+    is known, so it is in flight while the current page is parsed and consumed.
+    `prefetched` is the future of the first page, as returned by :py:func:`prefetch_continuation`.
+    """
+    while 'continuations' in results:
+        additionalParams = get_next_continuation_params(results, ctoken_path, reloadable)
+        if prefetched is not None:
+            response = prefetched.result()
+        else:
+            response = request_func(additionalParams)
         if 'continuationContents' in response:
             results = response['continuationContents'][continuation_type]
         else:
             break
+        prefetched = prefetch_continuation(results, request_func, ctoken_path,
+                                           reloadable) if prefetch else None
         contents = get_continuation_contents(results, parse_func)
         if len(contents) == 0:
             break
-        items.extend(contents)
+        yield additionalParams, contents
 
-    return items
+
+def prefetch_continuation(results, request_func, ctoken_path="", reloadable=False):
+    """
+    Requests the continuation page of `results` in a background thread.
+
+    :return: The future of the response, or None if there are no more pages
+    """
+    if 'continuations' not in results:
+        return None
+    executor = ThreadPoolExecutor(1)
+    try:
+        return executor.submit(copy_context().run, request_func,
+                               get_next_continuation_params(results, ctoken_path, reloadable))
+    finally:
+        executor.shutdown(wait=False)
+
+
+def get_continuation_page(request_func, additionalParams, continuation_type, parse_func):
+    """Requests a single continuation page and returns its raw results and parsed contents."""
+    response = request_func(additionalParams)
+    results = response['continuationContents'][continuation_type]
+    return results, get_continuation_contents(results, parse_func)
+
+
+class ResumableIterator:
+    """
+    Iterator over the items of paginated results, as returned by :py:func:`iter_playlist_tracks`
+    and the other ``iter_`` methods.
+
+    :py:attr:`cursor` is an opaque string identifying the position after the last item returned.
+    Passing it as `cursor` to the method that created the iterator continues the iteration
+    from that position, for example after a crash or when being rate limited.
+    """
+    def __init__(self, pages, endpoint, body, limit=None, position=None, offset=0):
+        self._pages = pages
+        self._endpoint = endpoint
+        self._body = body
+        self._limit = limit
+        self._count = 0
+        self._position = position
+        self._offset = offset
+        self._skip = offset
+        self._page = iter(())
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self._limit is not None and self._count >= self._limit:
+            raise StopIteration
+        item = next(self._page, self)
+        while item is self:
+            self._position, contents = next(self._pages)
+            self._offset = self._skip
+            self._page = iter(contents[self._skip:])
+            self._skip = 0
+            item = next(self._page, self)
+        self._offset += 1
+        self._count += 1
+        return item
+
+    @property
+    def cursor(self) -> str:
+        return encode_cursor(self._endpoint, self._body, self._position, self._offset)
+
+
+def encode_cursor(endpoint, body, position, offset):
+    body = {k: v for k, v in body.items() if k != 'context'}
+    state = [endpoint, body, position, offset]
+    return base64.urlsafe_b64encode(json.dumps(state).encode('utf-8')).decode('ascii')
+
+
+def decode_cursor(cursor, endpoint, body):
+    """
+    Returns the page position and the offset within the page stored in `cursor`.
+    Without a cursor, the position of the first page is returned.
+    """
+    if cursor is None:
+        return None, 0
+    try:
+        cursor_endpoint, cursor_body, position, offset = json.loads(
+            base64.urlsafe_b64decode(cursor.encode('ascii')))
+    except ValueError:
+        raise Exception("Invalid cursor provided.")
+    if cursor_endpoint != endpoint or cursor_body != body:
+        raise Exception("The cursor provided belongs to a different request.")
+    return position, offset
+
+
+def save_cursor(path, cursor):
+    """Atomically write `cursor` to the file at `path`."""
+    with open(path + '.tmp', 'w') as file:
+        file.write(cursor)
+    os.replace(path + '.tmp', path)
+
+
+def load_cursor(path):
+    """Read a cursor written with :py:func:`save_cursor`. Returns None if there is none."""
+    if not os.path.isfile(path):
+        return None
+    with open(path) as file:
+        return file.read()
 
 
 def get_validated_continuations(results,
@@ -59,6 +198,12 @@ def get_continuation_params(results, ctoken_path=''):
     return get_continuation_string(ctoken)
 
 
+def get_next_continuation_params(results, ctoken_path='', reloadable=False):
+    if reloadable:
+        return get_reloadable_continuation_params(results)
+    return get_continuation_params(results, ctoken_path)
+
+
 def get_reloadable_continuation_params(results):
     ctoken = nav(results, ['continuations', 0, 'reloadContinuationData', 'continuation'])
     return get_continuation_string(ctoken)
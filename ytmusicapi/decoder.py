@@ -0,0 +1,46 @@
+import json
+from typing import Any, Callable, Dict, Union
+
+#: Supported JSON decoders in order of preference, by the name of the module providing them
+DECODERS = ['orjson', 'simdjson', 'json']
+
+
+def _import_decoder(name: str) -> Callable[[bytes], Any]:
+    if name == 'orjson':
+        import orjson
+        return orjson.loads
+    if name == 'simdjson':
+        import simdjson
+        return simdjson.loads
+    if name == 'json':
+        return json.loads
+    raise Exception("Invalid JSON decoder provided. Please use one of the following: "
+                    + ', '.join(DECODERS))
+
+
+def get_available_decoders() -> Dict[str, Callable[[bytes], Any]]:
+    """Returns the installed decoders by name, fastest first."""
+    decoders = {}
+    for name in DECODERS:
+        try:
+            decoders[name] = _import_decoder(name)
+        except ImportError:
+            pass
+    return decoders
+
+
+def get_decoder(decoder: Union[str, Callable[[bytes], Any]] = None) -> Callable[[bytes], Any]:
+    """
+    Returns a function parsing JSON from the raw bytes of a response.
+
+    :param decoder: Name of one of the :py:data:`DECODERS`, or a function taking bytes.
+        Default: the fastest installed decoder, falling back to the standard library
+    """
+    if callable(decoder):
+        return decoder
+    if decoder is not None:
+        try:
+            return _import_decoder(decoder)
+        except ImportError:
+            raise Exception("The JSON decoder '%s' is not installed." % decoder)
+    return next(iter(get_available_decoders().values()))
@@ -0,0 +1,42 @@
+from typing import Optional
+
+
+class YTMusicError(Exception):
+    """Base class of the errors raised for failed requests to YouTube Music."""
+
+
+class YTMusicHTTPError(YTMusicError):
+    """Raised when YouTube Music responds with an HTTP error status."""
+    def __init__(self, message: str, status_code: int, reason: str = None,
+                 retry_after: float = None):
+        super().__init__(message)
+        #: HTTP status of the response
+        self.status_code = status_code
+        self.reason = reason
+        #: Seconds to wait before sending the request again, if the server asked for it
+        self.retry_after = retry_after
+
+
+class YTMusicClientError(YTMusicHTTPError):
+    """The request was rejected with a 4xx status other than 429. Sending it again won't help."""
+
+
+class YTMusicRateLimitError(YTMusicHTTPError):
+    """The request was rejected with status 429 because too many requests were sent."""
+
+
+class YTMusicServerError(YTMusicHTTPError):
+    """YouTube Music failed to handle the request and responded with a 5xx status."""
+
+
+def get_http_error(status_code: int, reason: str, error: Optional[str] = None,
+                   retry_after: float = None) -> YTMusicHTTPError:
+    """Returns the exception for a response with an HTTP error status."""
+    message = "Server returned HTTP " + str(status_code) + ": " + reason + ".\n" + (error or "")
+    if status_code == 429:
+        error_class = YTMusicRateLimitError
+    elif status_code >= 500:
+        error_class = YTMusicServerError
+    else:
+        error_class = YTMusicClientError
+    return error_class(message, status_code, reason, retry_after)
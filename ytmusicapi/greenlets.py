@@ -0,0 +1,43 @@
+import sys
+from contextvars import copy_context
+
+
+async def spawn(func, *args, **kwargs):
+    """
+    Calls the blocking function `func` in a new greenlet on the running event loop.
+
+    Whenever `func` needs to wait for I/O, it passes an awaitable to :py:func:`wait`, which
+    switches back here to await it while other tasks run, and then resumes `func` with its
+    result. This lets the synchronous methods and parsers of :class:`YTMusic` run as
+    coroutines without a thread per call. The greenlet runs in a copy of the current context.
+    """
+    import greenlet
+
+    call = greenlet.greenlet(func)
+    call.is_ytmusic_call = True
+    call.gr_context = copy_context()
+    result = call.switch(*args, **kwargs)
+    while not call.dead:
+        try:
+            value = await result
+        except BaseException as e:
+            result = call.throw(e)
+        else:
+            result = call.switch(value)
+    return result
+
+
+def current():
+    """The running greenlet, or None if greenlet was never imported, as without AsyncYTMusic."""
+    greenlet = sys.modules.get('greenlet')
+    return greenlet.getcurrent() if greenlet is not None else None
+
+
+def in_call() -> bool:
+    """Whether the caller runs in a greenlet started by :py:func:`spawn`."""
+    return getattr(current(), 'is_ytmusic_call', False)
+
+
+def wait(awaitable):
+    """Waits for `awaitable` from a function called by :py:func:`spawn` and returns its result."""
+    return current().parent.switch(awaitable)
@@ -1,5 +1,6 @@
 import re
 import json
+import gzip
 from http.cookies import SimpleCookie
 from hashlib import sha1
 import time
@@ -30,14 +31,28 @@ def initialize_context():
     }
 
 
-def get_visitor_id(request_func):
+def encode_body(body, compression_threshold=None):
+    """
+    Serialize a request body to compact JSON, gzip-compressing it
+    if it is at least `compression_threshold` bytes long.
+
+    :return: Tuple of the encoded body and whether it was compressed
+    """
+    data = json.dumps(body, separators=(',', ':')).encode('utf-8')
+    if compression_threshold is not None and len(data) >= compression_threshold:
+        return gzip.compress(data, compresslevel=6), True
+    return data, False
+
+
+def get_ytcfg(request_func):
+    """Returns the client configuration set by the YouTube Music start page."""
     response = request_func(YTM_DOMAIN)
     matches = re.findall(r'ytcfg\.set\s*\(\s*({.+?})\s*\)\s*;', response)
-    visitor_id = ""
-    if len(matches) > 0:
-        ytcfg = json.loads(matches[0])
-        visitor_id = ytcfg.get('VISITOR_DATA')
-    return {'X-Goog-Visitor-Id': visitor_id}
+    return json.loads(matches[0]) if len(matches) > 0 else {}
+
+
+def get_visitor_id(request_func):
+    return {'X-Goog-Visitor-Id': get_ytcfg(request_func).get('VISITOR_DATA', "")}
 
 
 def sapisid_from_cookie(raw_cookie):
@@ -0,0 +1,133 @@
+import threading
+import time
+from contextvars import ContextVar
+from functools import wraps
+from typing import Dict, Optional
+
+# calls batching requests on several threads are updated concurrently
+_lock = threading.Lock()
+
+
+class RequestEvent:
+    """
+    Emitted to observers for each request sent by :class:`YTMusic` or served from its cache.
+    Times are in seconds.
+    """
+    def __init__(self, method: str, endpoint: str, browse_id: str = None, kind: str = None,
+                 call: str = None, page: int = None):
+        #: HTTP method, ``POST`` for API requests
+        self.method = method
+        #: API endpoint, such as ``browse`` or ``search``, or the URL of GET requests
+        self.endpoint = endpoint
+        #: browseId of browse requests
+        self.browse_id = browse_id
+        #: Kind of response as used by the cache, such as ``album`` or ``playlist``
+        self.kind = kind
+        #: Name of the :class:`YTMusic` method which sent the request
+        self.call = call
+        #: 0 for the first request of a call, n for its n-th continuation page
+        self.page = page
+        self.status = None
+        self.cached = False
+        #: True if the response of an identical concurrent request was used
+        self.coalesced = False
+        self.bytes_out = 0
+        self.bytes_in = 0
+        #: Time to establish a new connection, if the session reports it
+        self.connect_time = None
+        #: Time until the response headers arrived
+        self.ttfb = None
+        #: Time until the response body was received
+        self.total_time = None
+        self.decode_time = 0.0
+        #: Number of times the request was sent again after a transient error
+        self.retries = 0
+        #: Time spent waiting for the rate limiter and before retries
+        self.wait_time = 0.0
+
+    def record_response(self, response, total_time: float):
+        self.status = response.status_code
+        self.bytes_in = len(response.content)
+        self.total_time = total_time
+        elapsed = getattr(response, 'elapsed', None)
+        self.ttfb = elapsed.total_seconds() if elapsed is not None else None
+        self.connect_time = getattr(response, 'connect_time', None)
+
+    def as_dict(self) -> Dict:
+        return dict(vars(self), type='request')
+
+
+class CallEvent:
+    """
+    Emitted to observers when a :class:`YTMusic` method returns or raises.
+    Its parse time is the time not spent sending requests, waiting
+    and decoding responses. Methods sending requests concurrently, such as
+    :py:func:`search_many`, report the sum of their requests' times, which can
+    exceed their total time.
+    """
+    def __init__(self, name: str):
+        #: Name of the method
+        self.name = name
+        self.requests = 0
+        #: Number of continuation requests
+        self.pages = 0
+        self.retries = 0
+        self.bytes_in = 0
+        self.request_time = 0.0
+        self.decode_time = 0.0
+        self.wait_time = 0.0
+        self.parse_time = 0.0
+        self.total_time = 0.0
+        self.error = None
+
+    def add(self, request: RequestEvent):
+        with _lock:
+            self.requests += 1
+            self.retries += request.retries
+            self.bytes_in += request.bytes_in
+            self.request_time += request.total_time or 0
+            self.decode_time += request.decode_time
+            self.wait_time += request.wait_time
+
+    def add_page(self) -> int:
+        """Counts a continuation request and returns its page number."""
+        with _lock:
+            self.pages += 1
+            return self.pages
+
+    def as_dict(self) -> Dict:
+        return dict(vars(self), type='call', error=repr(self.error) if self.error else None)
+
+
+# the instance and the call in progress in the current context. Background requests
+# run in a copy of the context of the call which started them
+_current_call = ContextVar('current_call', default=(None, None))
+
+
+def get_current_call(ytmusic) -> Optional[CallEvent]:
+    owner, call = _current_call.get()
+    return call if owner is ytmusic else None
+
+
+def observed(method):
+    """Emits a :class:`CallEvent` for the outermost observed method called in each context."""
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if not self._observers or get_current_call(self) is not None:
+            return method(self, *args, **kwargs)
+        call = CallEvent(method.__name__)
+        token = _current_call.set((self, call))
+        start = time.perf_counter()
+        try:
+            return method(self, *args, **kwargs)
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            _current_call.reset(token)
+            call.total_time = time.perf_counter() - start
+            call.parse_time = max(
+                0.0, call.total_time - call.request_time - call.decode_time - call.wait_time)
+            self._notify(call)
+
+    return wrapper
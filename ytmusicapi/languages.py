@@ -0,0 +1,45 @@
+import gettext
+import os
+import threading
+from functools import lru_cache
+from typing import Dict, List, Tuple
+
+from ytmusicapi.parsers.browsing import Parser
+
+LOCALE_DIR = os.path.join(os.path.abspath(os.path.dirname(__file__)), 'locales')
+
+# parsers are stateless apart from their translations, so one per language is shared
+_parsers: Dict[str, Parser] = {}
+_lock = threading.Lock()
+
+
+@lru_cache(maxsize=None)
+def _get_locales() -> Tuple[str, ...]:
+    # the locales shipped with the package don't change at runtime
+    return tuple(sorted(next(os.walk(LOCALE_DIR))[1]))
+
+
+def get_supported_languages() -> List[str]:
+    return list(_get_locales())
+
+
+def is_supported_language(language: str) -> bool:
+    # compared by name, so that paths such as '..' or 'en/../de' are rejected
+    return language in _get_locales()
+
+
+def get_parser(language: str) -> Parser:
+    """
+    Returns the parser for `language`, loading its translations on first use.
+    The same parser is returned to all callers and threads asking for the same language.
+    """
+    parser = _parsers.get(language)
+    if parser is None:
+        with _lock:
+            parser = _parsers.get(language)
+            if parser is None:
+                translation = gettext.translation('base',
+                                                  localedir=LOCALE_DIR,
+                                                  languages=[language])
+                parser = _parsers[language] = Parser(translation)
+    return parser
@@ -108,7 +108,8 @@ class BrowsingMixin:
 
         :param videoId: Video id
         :param signatureTimestamp: Provide the current YouTube signatureTimestamp.
-            If not provided a default value will be used, which might result in invalid streaming URLs
+            If not provided, the cached value of :py:func:`get_signatureTimestamp` is used,
+            or a default value if it can't be loaded, which might result in invalid streaming URLs
         :return: Dictionary with song metadata.
 
         Example::
@@ -275,7 +276,10 @@ class BrowsingMixin:
         """
         endpoint = 'player'
         if not signatureTimestamp:
-            signatureTimestamp = get_datestamp() - 1
+            try:
+                signatureTimestamp = self.get_signatureTimestamp()
+            except Exception:
+                signatureTimestamp = get_datestamp() - 1
 
         params = {
             "playbackContext": {
@@ -417,13 +421,20 @@ class BrowsingMixin:
         """
         Fetch the `base.js` script from YouTube Music and parse out the
         `signatureTimestamp` for use with :py:func:`get_song`.
+        Timestamps are cached per script in the instance's :py:class:`SignatureTimestampCache`,
+        so the script is only fetched when a new one is released.
 
         :param url: Optional. Provide the URL of the `base.js` script. If this
-            isn't specified a call will be made to :py:func:`get_basejs_url`.
+            isn't specified a call will be made to :py:func:`get_basejs_url`,
+            at most once per `ttl` of the cache.
         :return: `signatureTimestamp` string
         """
         if url is None:
-            url = self.get_basejs_url()
+            return self.signature_cache.get(self.base_url, self.get_basejs_url,
+                                            self._load_signatureTimestamp)
+        return self.signature_cache.get_timestamp(url, self._load_signatureTimestamp)
+
+    def _load_signatureTimestamp(self, url: str) -> int:
         response = self._send_get_request(url=url)
         match = re.search(r"signatureTimestamp[:=](\d+)", response)
         raise_match_signature(match)
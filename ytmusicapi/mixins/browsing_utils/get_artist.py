@@ -1,3 +1,6 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextvars import copy_context
+from typing import Union
 from _get_artist import _get_artist_info
 from ytmusicapi.parsers.library import parse_albums
 from ytmusicapi.parsers.browsing import *
@@ -115,4 +118,54 @@ class BrowsingArtist:
         response, results = _browsing_results(self, 'browse', {"browseId": channelId, "params": params}, SINGLE_COLUMN_TAB + SECTION_LIST_ITEM + GRID_ITEMS)
         albums = parse_albums(results)
 
-        return albums
\ No newline at end of file
+        return albums
+
+    def get_artists(self,
+                    channelIds: List[str],
+                    include_discography: bool = True,
+                    max_workers: int = 8) -> List[Union[Dict, Exception]]:
+        """
+        Get information about many artists, fetched concurrently.
+        With `include_discography`, the full lists of albums and singles are requested as soon as
+        each artist page has arrived, sharing the pool with the remaining artist pages.
+        A failed artist does not fail the batch: the exception raised for it
+        is returned in its place.
+
+        :param channelIds: channel ids of the artists
+        :param include_discography: Whether to replace the top albums and singles
+            of each artist with the full lists returned by :py:func:`get_artist_albums`.
+            Default: True
+        :param max_workers: Number of requests sent at the same time. Should not exceed
+            the `pool_maxsize` of the instance. Default: 8
+        :return: List of artists in the format returned by :py:func:`get_artist`
+            or exceptions, in the order of `channelIds`
+        """
+        channelIds = list(channelIds)
+        artists = [None] * len(channelIds)
+        with ThreadPoolExecutor(max_workers) as executor:
+            pages = {
+                executor.submit(copy_context().run, self.get_artist, channelId): i
+                for i, channelId in enumerate(channelIds)
+            }
+            discographies = {}
+            for future in as_completed(pages):
+                i = pages[future]
+                artists[i] = future.exception() or future.result()
+                if not include_discography or isinstance(artists[i], Exception):
+                    continue
+                for category in ['albums', 'singles']:
+                    if artists[i].get(category, {}).get('params'):
+                        discography = executor.submit(copy_context().run,
+                                                      self.get_artist_albums,
+                                                      artists[i][category]['browseId'],
+                                                      artists[i][category]['params'])
+                        discographies[discography] = i, category
+
+            for future in as_completed(discographies):
+                i, category = discographies[future]
+                if future.exception() is not None:
+                    artists[i] = future.exception()
+                elif not isinstance(artists[i], Exception):
+                    artists[i][category]['results'] = future.result()
+
+        return artists
@@ -1,5 +1,7 @@
+from typing import Dict, Iterable, Iterator, List, Tuple, Union
 from ytmusicapi.parsers.browsing import *
 from ytmusicapi.helpers import YTM_DOMAIN, sum_total_duration
+from ytmusicapi.batch import map_concurrently, map_ordered
 from browsing_utils import _browsing_results, api_return_none
 from ytmusicapi.parsers.albums import parse_album_header
 from ytmusicapi.parsers.playlists import parse_playlist_items
@@ -91,4 +93,34 @@ class BrowsingSong:
             album['tracks'][i]['album'] = album['title']
             album['tracks'][i]['artists'] = album['artists']
 
-        return album
\ No newline at end of file
+        return album
+
+    def get_albums(self, browseIds: List[str],
+                   max_workers: int = 8) -> List[Union[Dict, Exception]]:
+        """
+        Get information and tracks of many albums, fetched concurrently.
+        A failed album does not fail the batch: the exception raised for it
+        is returned in its place.
+
+        :param browseIds: browseIds of the albums
+        :param max_workers: Number of albums fetched at the same time. Should not exceed
+            the `pool_maxsize` of the instance. Default: 8
+        :return: List of albums in the format returned by :py:func:`get_album`
+            or exceptions, in the order of `browseIds`
+        """
+        return map_ordered(self.get_album, browseIds, max_workers)
+
+    def iter_albums(self, browseIds: Iterable[str],
+                    max_workers: int = 8) -> Iterator[Tuple[str, Union[Dict, Exception]]]:
+        """
+        Like :py:func:`get_albums`, but yields each album as soon as it has been fetched,
+        so results can be processed while the rest of the batch is still in flight.
+        `browseIds` is consumed lazily and may be a generator.
+
+        :param browseIds: browseIds of the albums
+        :param max_workers: Number of albums fetched at the same time. Default: 8
+        :return: Iterator of tuples of browseId and album or exception, in the order
+            the albums were fetched
+        """
+        for _, browseId, album in map_concurrently(self.get_album, browseIds, max_workers):
+            yield browseId, album
@@ -9,4 +9,4 @@ def if_continuation(self, endpoint, body, limit, items, results):
         remaining_limit = None if limit is None else (limit - len(items))
         items.extend(
             get_continuations(results, 'musicShelfContinuation', remaining_limit, request_func,
-                                parse_func))    
\ No newline at end of file
+                                parse_func, prefetch=self.prefetch_continuations))    
\ No newline at end of file
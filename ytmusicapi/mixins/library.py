@@ -1,3 +1,4 @@
+from typing import Iterator
 from ytmusicapi.continuations import *
 from ._utils import *
 from ytmusicapi.parsers.browsing import *
@@ -157,6 +158,95 @@ class LibraryMixin:
             response,
             lambda additionalParams: self._send_request(endpoint, body, additionalParams), limit)
 
+    def iter_library_songs(self,
+                           limit: int = None,
+                           order: str = None,
+                           cursor: str = None) -> ResumableIterator:
+        """
+        Iterates over the songs in the user's library. Further pages are only requested
+        when the songs of the previous page have been consumed, so memory use stays constant.
+
+        :param limit: Number of songs to return. `None` returns all songs. Default: None
+        :param order: Order of songs to return. Allowed values: 'a_to_z', 'z_to_a', 'recently_added'. Default: Default order.
+        :param cursor: Optional. The ``cursor`` of a previous iterator with the same order
+            to continue after the last song it returned. See :py:func:`iter_playlist_tracks`
+        :return: :py:class:`ResumableIterator` over songs. Same format as :py:func:`get_playlist`
+        """
+        # the first item is the shuffle button
+        return self._iter_library('FEmusic_liked_videos', MUSIC_SHELF, parse_playlist_items, limit,
+                                  order, cursor, skip=1)
+
+    def iter_library_albums(self,
+                            limit: int = None,
+                            order: str = None,
+                            cursor: str = None) -> ResumableIterator:
+        """
+        Iterates over the albums in the user's library, requesting further pages as they are needed.
+
+        :param limit: Number of albums to return. `None` returns all albums. Default: None
+        :param order: Order of albums to return. Allowed values: 'a_to_z', 'z_to_a', 'recently_added'. Default: Default order.
+        :param cursor: Optional. The ``cursor`` of a previous iterator with the same order
+            to continue after the last album it returned. See :py:func:`iter_playlist_tracks`
+        :return: :py:class:`ResumableIterator` over albums. Same format as :py:func:`get_library_albums`
+        """
+        return self._iter_library('FEmusic_liked_albums', GRID, parse_albums, limit, order, cursor)
+
+    def iter_library_artists(self,
+                             limit: int = None,
+                             order: str = None,
+                             cursor: str = None) -> ResumableIterator:
+        """
+        Iterates over the artists of the songs in the user's library,
+        requesting further pages as they are needed.
+
+        :param limit: Number of artists to return. `None` returns all artists. Default: None
+        :param order: Order of artists to return. Allowed values: 'a_to_z', 'z_to_a', 'recently_added'. Default: Default order.
+        :param cursor: Optional. The ``cursor`` of a previous iterator with the same order
+            to continue after the last artist it returned. See :py:func:`iter_playlist_tracks`
+        :return: :py:class:`ResumableIterator` over artists. Same format as :py:func:`get_library_artists`
+        """
+        return self._iter_library('FEmusic_library_corpus_track_artists', MUSIC_SHELF,
+                                  parse_artists, limit, order, cursor)
+
+    def _iter_library(self, browseId, renderer, parse_func, limit, order, cursor, skip=0):
+        self._check_auth()
+        body = {'browseId': browseId}
+        validate_order_parameter(order)
+        if order is not None:
+            body["params"] = prepare_order_params(order)
+        endpoint = 'browse'
+        position, offset = decode_cursor(cursor, endpoint, body)
+        pages = self._iter_library_pages(endpoint, body, renderer, parse_func, skip, position)
+        return ResumableIterator(pages, endpoint, body, limit, position, offset)
+
+    def _iter_library_pages(self, endpoint, body, renderer, parse_func, skip, additionalParams):
+        continuation_type = 'gridContinuation' if renderer == GRID else 'musicShelfContinuation'
+        request_func = lambda additionalParams: self._send_request(endpoint, body, additionalParams)
+        if additionalParams is None:
+            response = self._send_request(endpoint, body)
+            results = get_library_contents(response, renderer)
+            if results is None:
+                return
+            contents = results['items'] if renderer == GRID else results['contents']
+            prefetched = None
+            if self.prefetch_continuations:
+                prefetched = prefetch_continuation(results, request_func)
+            yield None, parse_func(contents[skip:])
+        else:
+            results, contents = get_continuation_page(request_func, additionalParams,
+                                                      continuation_type, parse_func)
+            prefetched = None
+            if self.prefetch_continuations:
+                prefetched = prefetch_continuation(results, request_func)
+            yield additionalParams, contents
+
+        yield from iter_continuation_pages(results,
+                                           continuation_type,
+                                           request_func,
+                                           parse_func,
+                                           prefetch=self.prefetch_continuations,
+                                           prefetched=prefetched)
+
     def get_liked_songs(self, limit: int = 100) -> Dict:
         """
         Gets playlist items for the 'Liked Songs' playlist
@@ -174,24 +264,33 @@ class LibraryMixin:
           The additional property ``played`` indicates when the playlistItem was played
           The additional property ``feedbackToken`` can be used to remove items with :py:func:`remove_history_items`
         """
+        return list(self.iter_history())
+
+    def iter_history(self) -> Iterator[Dict]:
+        """
+        Iterates over your play history in reverse chronological order.
+        Items are yielded as soon as their section of the history has been parsed.
+
+        :return: Iterator over playlistItems, see :py:func:`get_history`
+        """
         self._check_auth()
+        return self._iter_history_items()
+
+    def _iter_history_items(self) -> Iterator[Dict]:
         body = {'browseId': 'FEmusic_history'}
         endpoint = 'browse'
         response = self._send_request(endpoint, body)
         results = nav(response, SINGLE_COLUMN_TAB + SECTION_LIST)
-        songs = []
+        menu_entries = [[-1] + MENU_SERVICE + FEEDBACK_TOKEN]
         for content in results:
             data = nav(content, MUSIC_SHELF + ['contents'], True)
             if not data:
                 error = nav(content, ['musicNotifierShelfRenderer'] + TITLE, True)
                 raise Exception(error)
-            menu_entries = [[-1] + MENU_SERVICE + FEEDBACK_TOKEN]
-            songlist = parse_playlist_items(data, menu_entries)
-            for song in songlist:
-                song['played'] = nav(content['musicShelfRenderer'], TITLE_TEXT)
-            songs.extend(songlist)
-
-        return songs
+            played = nav(content['musicShelfRenderer'], TITLE_TEXT)
+            for song in parse_playlist_items(data, menu_entries):
+                song['played'] = played
+                yield song
 
     def remove_history_items(self, feedbackTokens: List[str]) -> Dict:  # pragma: no cover
         """
@@ -136,6 +136,11 @@ class PlaylistsMixin:
         playlist['trackCount'] = song_count
 
         request_func = lambda additionalParams: self._send_request(endpoint, body, additionalParams)
+        prefetched = None
+        if self.prefetch_continuations and (limit is None
+                                            or limit > len(results.get('contents', []))):
+            # requested before the first page of tracks is parsed
+            prefetched = prefetch_continuation(results, request_func)
 
         # suggestions and related are missing e.g. on liked songs
         section_list = nav(response, SINGLE_COLUMN_TAB + ['sectionListRenderer'])
@@ -175,11 +180,74 @@ class PlaylistsMixin:
                 playlist['tracks'].extend(
                     get_continuations(results, 'musicPlaylistShelfContinuation',
                                       songs_to_get - len(playlist['tracks']), request_func,
-                                      parse_func))
+                                      parse_func, prefetch=self.prefetch_continuations,
+                                      prefetched=prefetched))
 
         playlist['duration_seconds'] = sum_total_duration(playlist)
         return playlist
 
+    def iter_playlist_tracks(self,
+                             playlistId: str,
+                             limit: int = None,
+                             cursor: str = None) -> ResumableIterator:
+        """
+        Iterates over the tracks of a playlist. Each page of tracks is requested only when
+        the tracks of the previous page have been consumed, so tracks can be processed as soon as
+        the first page arrives and memory use stays constant for very large playlists.
+
+        :param playlistId: Playlist id
+        :param limit: How many tracks to return. `None` returns all tracks. Default: None
+        :param cursor: Optional. The ``cursor`` of a previous iterator over the same playlist.
+            Iteration continues after the last track returned by that iterator.
+        :return: :py:class:`ResumableIterator` over playlistItem dictionaries in the format
+            of the ``tracks`` returned by :py:func:`get_playlist`
+
+        Example::
+
+            tracks = ytmusic.iter_playlist_tracks(playlistId)
+            for track in tracks:
+                process(track)
+                save_cursor('checkpoint', tracks.cursor)
+
+            # after a failure
+            tracks = ytmusic.iter_playlist_tracks(playlistId, cursor=load_cursor('checkpoint'))
+        """
+        browseId = "VL" + playlistId if not playlistId.startswith("VL") else playlistId
+        body = {'browseId': browseId}
+        endpoint = 'browse'
+        position, offset = decode_cursor(cursor, endpoint, body)
+        return ResumableIterator(self._iter_playlist_pages(endpoint, body, position), endpoint,
+                                 body, limit, position, offset)
+
+    def _iter_playlist_pages(self, endpoint, body, additionalParams=None):
+        continuation_type = 'musicPlaylistShelfContinuation'
+        request_func = lambda additionalParams: self._send_request(endpoint, body, additionalParams)
+        parse_func = lambda contents: parse_playlist_items(contents)
+        if additionalParams is None:
+            response = self._send_request(endpoint, body)
+            results = nav(response,
+                          SINGLE_COLUMN_TAB + SECTION_LIST_ITEM + ['musicPlaylistShelfRenderer'])
+            if 'contents' not in results:
+                return
+            prefetched = None
+            if self.prefetch_continuations:
+                prefetched = prefetch_continuation(results, request_func)
+            yield None, parse_playlist_items(results['contents'])
+        else:
+            results, contents = get_continuation_page(request_func, additionalParams,
+                                                      continuation_type, parse_func)
+            prefetched = None
+            if self.prefetch_continuations:
+                prefetched = prefetch_continuation(results, request_func)
+            yield additionalParams, contents
+
+        yield from iter_continuation_pages(results,
+                                           continuation_type,
+                                           request_func,
+                                           parse_func,
+                                           prefetch=self.prefetch_continuations,
+                                           prefetched=prefetched)
+
     def create_playlist(self,
                         title: str,
                         description: str,
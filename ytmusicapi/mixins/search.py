@@ -1,9 +1,9 @@
-from typing import List, Dict
+from typing import List, Dict, Iterable, Tuple, Union
+from ytmusicapi.batch import map_ordered
 from ytmusicapi.navigation import *
-from ytmusicapi.continuations import get_continuations
+from ytmusicapi.continuations import *
 from ytmusicapi.parsers.search_params import *
-from raise_utils import filter_exception, scope_exception, set_exception
-from get_library_utils import if_continuation
+from raise_utils import filter_exception, scope_exception, set_exception, scopes
 
 class SearchMixin:
     def __init__(self):
@@ -126,7 +126,6 @@ class SearchMixin:
         """
         body = {'query': query}
         endpoint = 'search'
-        search_results = []
         filter_exception(filter)
         scope_exception(scope)
         set_exception(scope, filter)
@@ -135,14 +134,93 @@ class SearchMixin:
         if params:
             body['params'] = params
 
+        pages = self._iter_search_pages(endpoint, body, filter, scope, limit=limit)
+        return [result for _, results in pages for result in results]
+
+    def search_many(self,
+                    queries: Iterable[str],
+                    filters: List[str] = None,
+                    scope: str = None,
+                    limit: int = 20,
+                    ignore_spelling: bool = False,
+                    max_workers: int = 8) -> Dict[Tuple[str, str], Union[List[Dict], Exception]]:
+        """
+        Search YouTube Music for each combination of many queries and filters concurrently.
+        Duplicate combinations are only searched once. A failed search does not fail the batch:
+        the exception raised for it is returned in its place.
+
+        Example::
+
+            results = ytmusic.search_many(['Oasis Wonderwall', 'Blur Song 2'],
+                                          filters=['songs', 'videos'])
+            songs = results[('Oasis Wonderwall', 'songs')]
+
+        :param queries: Query strings
+        :param filters: Filters to search each query with, see :py:func:`search`.
+            ``None`` in the list stands for the default search. Default: ``[None]``
+        :param scope: Search scope. See :py:func:`search`
+        :param limit: Number of search results to return per search. Default: 20
+        :param ignore_spelling: Whether to ignore YTM spelling suggestions. See :py:func:`search`
+        :param max_workers: Number of searches sent at the same time. Should not exceed
+            the `pool_maxsize` of the instance. Default: 8
+        :return: Dictionary mapping each tuple of query and filter to the list of results
+            returned by :py:func:`search` or to an exception, in the order of the queries
+        """
+        searches = list(dict.fromkeys((query, filter) for query in queries
+                                      for filter in filters or [None]))
+        results = map_ordered(
+            lambda search: self.search(search[0], search[1], scope, limit, ignore_spelling),
+            searches, max_workers)
+        return dict(zip(searches, results))
+
+    def iter_search(self,
+                    query: str,
+                    filter: str = None,
+                    scope: str = None,
+                    limit: int = None,
+                    ignore_spelling: bool = False,
+                    cursor: str = None) -> ResumableIterator:
+        """
+        Iterates over search results. Further pages of results are only requested
+        when the results of the previous page have been consumed.
+
+        :param query: Query string, i.e. 'Oasis Wonderwall'
+        :param filter: Filter for item types. See :py:func:`search`
+        :param scope: Search scope. See :py:func:`search`
+        :param limit: Number of search results to return. `None` returns all results. Default: None
+        :param ignore_spelling: Whether to ignore YTM spelling suggestions. See :py:func:`search`
+        :param cursor: Optional. The ``cursor`` of a previous iterator for the same search to
+            continue after the last result it returned. See :py:func:`iter_playlist_tracks`
+        :return: :py:class:`ResumableIterator` over search results in the format of :py:func:`search`
+        """
+        body = {'query': query}
+        endpoint = 'search'
+        filter_exception(filter)
+        scope_exception(scope)
+        set_exception(scope, filter)
+
+        params = get_search_params(filter, scope, ignore_spelling)
+        if params:
+            body['params'] = params
+
+        position, offset = decode_cursor(cursor, endpoint, body)
+        pages = self._iter_search_pages(endpoint, body, filter, scope, position)
+        return ResumableIterator(pages, endpoint, body, limit, position, offset)
+
+    def _iter_search_pages(self, endpoint, body, filter, scope, position=None, limit=None):
+        """
+        Yields the position and the parsed results of each page of a search.
+        The first page of each result shelf is always included, its continuation pages
+        only until `limit` results have been yielded.
+        """
         response = self._send_request(endpoint, body)
 
         # no results
         if 'contents' not in response:
-            return search_results
+            return
 
         if 'tabbedSearchResultsRenderer' in response['contents']:
-            tab_index = 0 if not scope or filter else self.scopes.index(scope) + 1
+            tab_index = 0 if not scope or filter else scopes.index(scope) + 1
             results = response['contents']['tabbedSearchResultsRenderer']['tabs'][tab_index][
                 'tabRenderer']['content']
         else:
@@ -152,26 +230,45 @@ class SearchMixin:
 
         # no results
         if len(results) == 1 and 'itemSectionRenderer' in results:
-            return search_results
+            return
 
         # set filter for parser
         if filter and 'playlists' in filter:
             filter = 'playlists'
-        elif scope == self.scopes[1]:
-            filter = self.scopes[1]
-
-        for res in results:
-            if 'musicShelfRenderer' in res:
-                results = res['musicShelfRenderer']['contents']
-                original_filter = filter
-                category = nav(res, MUSIC_SHELF + TITLE_TEXT, True)
-                if not filter and scope == self.scopes[0]:
-                    filter = category
-
-                type = filter[:-1].lower() if filter else None
-                search_results.extend(self.parser.parse_search_results(results, type, category))
-                filter = original_filter
-
-                if_continuation(endpoint, body, limit, search_results, results)
+        elif scope == scopes[1]:
+            filter = scopes[1]
 
-        return search_results
+        # a position consists of the index of the result shelf
+        # and the continuation params of the page within the shelf
+        shelf_index, additionalParams = position or (0, None)
+        count = 0
+        continuation_type = 'musicShelfContinuation'
+        request_func = lambda additionalParams: self._send_request(endpoint, body, additionalParams)
+        for i, res in enumerate(results):
+            if 'musicShelfRenderer' not in res or i < shelf_index:
+                continue
+            category = nav(res, MUSIC_SHELF + TITLE_TEXT, True)
+            shelf_filter = category if not filter and scope == scopes[0] else filter
+            type = shelf_filter[:-1].lower() if shelf_filter else None
+            parse_func = lambda contents: self.parser.parse_search_results(
+                contents, type, category)
+            shelf = res['musicShelfRenderer']
+            if i == shelf_index and additionalParams is not None:
+                shelf, contents = get_continuation_page(request_func, additionalParams,
+                                                        continuation_type, parse_func)
+                yield [i, additionalParams], contents
+            else:
+                contents = parse_func(shelf['contents'])
+                yield [i, None], contents
+            count += len(contents)
+            pages = iter_continuation_pages(shelf,
+                                            continuation_type,
+                                            request_func,
+                                            parse_func,
+                                            prefetch=self.prefetch_continuations)
+            while limit is None or count < limit:
+                page = next(pages, None)
+                if page is None:
+                    break
+                count += len(page[1])
+                yield [i, page[0]], page[1]
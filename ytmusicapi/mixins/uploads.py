@@ -20,7 +20,7 @@ class UploadsMixin:
         check_path(filepath)
         support_exception(filepath)
 
-        headers = self.headers.copy()
+        headers = self._prepare_headers()
         upload_url = "https://upload.youtube.com/upload/usermusic/http?authuser=%s" % headers[
             'x-goog-authuser']
         filesize = os.path.getsize(filepath)
@@ -30,12 +30,15 @@ class UploadsMixin:
         headers['X-Goog-Upload-Command'] = 'start'
         headers['X-Goog-Upload-Header-Content-Length'] = str(filesize)
         headers['X-Goog-Upload-Protocol'] = 'resumable'
-        response = requests.post(upload_url, data=body, headers=headers, proxies=self.proxies)
+        response = self._session.post(upload_url, data=body, headers=headers, proxies=self.proxies)
         headers['X-Goog-Upload-Command'] = 'upload, finalize'
         headers['X-Goog-Upload-Offset'] = '0'
         upload_url = response.headers['X-Goog-Upload-URL']
         with open(filepath, 'rb') as file:
-            response = requests.post(upload_url, data=file, headers=headers, proxies=self.proxies)
+            response = self._session.post(upload_url,
+                                          data=file,
+                                          headers=headers,
+                                          proxies=self.proxies)
 
         if response.status_code == 200:
             return 'STATUS_SUCCEEDED'
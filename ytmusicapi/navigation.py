@@ -1,66 +1,106 @@
+class NavPath(list):
+    """
+    A navigation path for :py:func:`nav` which is concatenated once, when it is defined.
+
+    Built from one or more path sequences, which are concatenated::
+
+        MENU_ITEMS = NavPath(MENU, ['items'])
+
+    Adding a path and a list returns a plain list, as fast as adding two lists,
+    so paths can still be combined ad hoc. Paths used for every item of a response
+    should be defined once as a :py:class:`NavPath`, so that they aren't concatenated
+    again for each item.
+    """
+    def __init__(self, *paths):
+        super().__init__(k for items in paths for k in items)
+
+
 # commonly used navigation paths
-CONTENT = ['contents', 0]
-RUN_TEXT = ['runs', 0, 'text']
-TAB_CONTENT = ['tabs', 0, 'tabRenderer', 'content']
-SINGLE_COLUMN_TAB = ['contents', 'singleColumnBrowseResultsRenderer'] + TAB_CONTENT
-SECTION_LIST = ['sectionListRenderer', 'contents']
-SECTION_LIST_ITEM = ['sectionListRenderer'] + CONTENT
-ITEM_SECTION = ['itemSectionRenderer'] + CONTENT
-MUSIC_SHELF = ['musicShelfRenderer']
-GRID = ['gridRenderer']
-GRID_ITEMS = GRID + ['items']
-MENU = ['menu', 'menuRenderer']
-MENU_ITEMS = MENU + ['items']
-MENU_LIKE_STATUS = MENU + ['topLevelButtons', 0, 'likeButtonRenderer', 'likeStatus']
-MENU_SERVICE = ['menuServiceItemRenderer', 'serviceEndpoint']
+CONTENT = NavPath(['contents', 0])
+RUN_TEXT = NavPath(['runs', 0, 'text'])
+TAB_CONTENT = NavPath(['tabs', 0, 'tabRenderer', 'content'])
+SINGLE_COLUMN_TAB = NavPath(['contents', 'singleColumnBrowseResultsRenderer'], TAB_CONTENT)
+SECTION_LIST = NavPath(['sectionListRenderer', 'contents'])
+SECTION_LIST_ITEM = NavPath(['sectionListRenderer'], CONTENT)
+ITEM_SECTION = NavPath(['itemSectionRenderer'], CONTENT)
+MUSIC_SHELF = NavPath(['musicShelfRenderer'])
+GRID = NavPath(['gridRenderer'])
+GRID_ITEMS = NavPath(GRID, ['items'])
+MENU = NavPath(['menu', 'menuRenderer'])
+MENU_ITEMS = NavPath(MENU, ['items'])
+MENU_LIKE_STATUS = NavPath(MENU, ['topLevelButtons', 0, 'likeButtonRenderer', 'likeStatus'])
+MENU_SERVICE = NavPath(['menuServiceItemRenderer', 'serviceEndpoint'])
 TOGGLE_MENU = 'toggleMenuServiceItemRenderer'
-PLAY_BUTTON = [
-    'overlay', 'musicItemThumbnailOverlayRenderer', 'content', 'musicPlayButtonRenderer'
-]
-NAVIGATION_BROWSE = ['navigationEndpoint', 'browseEndpoint']
-NAVIGATION_BROWSE_ID = NAVIGATION_BROWSE + ['browseId']
-PAGE_TYPE = [
-    'browseEndpointContextSupportedConfigs', 'browseEndpointContextMusicConfig', 'pageType'
-]
-NAVIGATION_VIDEO_ID = ['navigationEndpoint', 'watchEndpoint', 'videoId']
-NAVIGATION_PLAYLIST_ID = ['navigationEndpoint', 'watchEndpoint', 'playlistId']
-NAVIGATION_WATCH_PLAYLIST_ID = ['navigationEndpoint', 'watchPlaylistEndpoint', 'playlistId']
-NAVIGATION_VIDEO_TYPE = [
+PLAY_BUTTON = NavPath(
+    ['overlay', 'musicItemThumbnailOverlayRenderer', 'content', 'musicPlayButtonRenderer'])
+NAVIGATION_BROWSE = NavPath(['navigationEndpoint', 'browseEndpoint'])
+NAVIGATION_BROWSE_ID = NavPath(NAVIGATION_BROWSE, ['browseId'])
+PAGE_TYPE = NavPath(
+    ['browseEndpointContextSupportedConfigs', 'browseEndpointContextMusicConfig', 'pageType'])
+NAVIGATION_VIDEO_ID = NavPath(['navigationEndpoint', 'watchEndpoint', 'videoId'])
+NAVIGATION_PLAYLIST_ID = NavPath(['navigationEndpoint', 'watchEndpoint', 'playlistId'])
+NAVIGATION_WATCH_PLAYLIST_ID = NavPath(
+    ['navigationEndpoint', 'watchPlaylistEndpoint', 'playlistId'])
+NAVIGATION_VIDEO_TYPE = NavPath([
     'watchEndpoint', 'watchEndpointMusicSupportedConfigs', 'watchEndpointMusicConfig',
     'musicVideoType'
-]
-HEADER_DETAIL = ['header', 'musicDetailHeaderRenderer']
-DESCRIPTION_SHELF = ['musicDescriptionShelfRenderer']
-DESCRIPTION = ['description'] + RUN_TEXT
-CAROUSEL = ['musicCarouselShelfRenderer']
-IMMERSIVE_CAROUSEL = ['musicImmersiveCarouselShelfRenderer']
-CAROUSEL_CONTENTS = CAROUSEL + ['contents']
-CAROUSEL_TITLE = ['header', 'musicCarouselShelfBasicHeaderRenderer', 'title', 'runs', 0]
-FRAMEWORK_MUTATIONS = ['frameworkUpdates', 'entityBatchUpdate', 'mutations']
-TITLE = ['title', 'runs', 0]
-TITLE_TEXT = ['title'] + RUN_TEXT
-TEXT_RUNS = ['text', 'runs']
-TEXT_RUN = TEXT_RUNS + [0]
-TEXT_RUN_TEXT = TEXT_RUN + ['text']
-SUBTITLE = ['subtitle'] + RUN_TEXT
-SUBTITLE2 = ['subtitle', 'runs', 2, 'text']
-SUBTITLE3 = ['subtitle', 'runs', 4, 'text']
-THUMBNAIL = ['thumbnail', 'thumbnails']
-THUMBNAILS = ['thumbnail', 'musicThumbnailRenderer'] + THUMBNAIL
-THUMBNAIL_RENDERER = ['thumbnailRenderer', 'musicThumbnailRenderer'] + THUMBNAIL
-THUMBNAIL_CROPPED = ['thumbnail', 'croppedSquareThumbnailRenderer'] + THUMBNAIL
-FEEDBACK_TOKEN = ['feedbackEndpoint', 'feedbackToken']
-BADGE_PATH = [0, 'musicInlineBadgeRenderer', 'accessibilityData', 'accessibilityData', 'label']
-BADGE_LABEL = ['badges'] + BADGE_PATH
-SUBTITLE_BADGE_LABEL = ['subtitleBadges'] + BADGE_PATH
-CATEGORY_TITLE = ['musicNavigationButtonRenderer', 'buttonText'] + RUN_TEXT
-CATEGORY_PARAMS = ['musicNavigationButtonRenderer', 'clickCommand', 'browseEndpoint', 'params']
+])
+HEADER_DETAIL = NavPath(['header', 'musicDetailHeaderRenderer'])
+DESCRIPTION_SHELF = NavPath(['musicDescriptionShelfRenderer'])
+DESCRIPTION = NavPath(['description'], RUN_TEXT)
+CAROUSEL = NavPath(['musicCarouselShelfRenderer'])
+IMMERSIVE_CAROUSEL = NavPath(['musicImmersiveCarouselShelfRenderer'])
+CAROUSEL_CONTENTS = NavPath(CAROUSEL, ['contents'])
+CAROUSEL_TITLE = NavPath(['header', 'musicCarouselShelfBasicHeaderRenderer', 'title', 'runs', 0])
+FRAMEWORK_MUTATIONS = NavPath(['frameworkUpdates', 'entityBatchUpdate', 'mutations'])
+TITLE = NavPath(['title', 'runs', 0])
+TITLE_TEXT = NavPath(['title'], RUN_TEXT)
+TEXT_RUNS = NavPath(['text', 'runs'])
+TEXT_RUN = NavPath(TEXT_RUNS, [0])
+TEXT_RUN_TEXT = NavPath(TEXT_RUN, ['text'])
+SUBTITLE = NavPath(['subtitle'], RUN_TEXT)
+SUBTITLE2 = NavPath(['subtitle', 'runs', 2, 'text'])
+SUBTITLE3 = NavPath(['subtitle', 'runs', 4, 'text'])
+THUMBNAIL = NavPath(['thumbnail', 'thumbnails'])
+THUMBNAILS = NavPath(['thumbnail', 'musicThumbnailRenderer'], THUMBNAIL)
+THUMBNAIL_RENDERER = NavPath(['thumbnailRenderer', 'musicThumbnailRenderer'], THUMBNAIL)
+THUMBNAIL_CROPPED = NavPath(['thumbnail', 'croppedSquareThumbnailRenderer'], THUMBNAIL)
+FEEDBACK_TOKEN = NavPath(['feedbackEndpoint', 'feedbackToken'])
+BADGE_PATH = NavPath(
+    [0, 'musicInlineBadgeRenderer', 'accessibilityData', 'accessibilityData', 'label'])
+BADGE_LABEL = NavPath(['badges'], BADGE_PATH)
+SUBTITLE_BADGE_LABEL = NavPath(['subtitleBadges'], BADGE_PATH)
+CATEGORY_TITLE = NavPath(['musicNavigationButtonRenderer', 'buttonText'], RUN_TEXT)
+CATEGORY_PARAMS = NavPath(
+    ['musicNavigationButtonRenderer', 'clickCommand', 'browseEndpoint', 'params'])
 MRLIR = 'musicResponsiveListItemRenderer'
 MTRIR = 'musicTwoRowItemRenderer'
-TASTE_PROFILE_ITEMS = ["contents", "tastebuilderRenderer", "contents"]
-TASTE_PROFILE_ARTIST = ["title", "runs"]
-SECTION_LIST_CONTINUATION = ['continuationContents', 'sectionListContinuation']
-MENU_PLAYLIST_ID = MENU_ITEMS + [0, 'menuNavigationItemRenderer'] + NAVIGATION_WATCH_PLAYLIST_ID
+TASTE_PROFILE_ITEMS = NavPath(["contents", "tastebuilderRenderer", "contents"])
+TASTE_PROFILE_ARTIST = NavPath(["title", "runs"])
+SECTION_LIST_CONTINUATION = NavPath(['continuationContents', 'sectionListContinuation'])
+MENU_PLAYLIST_ID = NavPath(MENU_ITEMS, [0, 'menuNavigationItemRenderer'],
+                           NAVIGATION_WATCH_PLAYLIST_ID)
+
+# paths used by parsers for every item of a response
+TITLE_BROWSE_ID = NavPath(TITLE, NAVIGATION_BROWSE_ID)
+TITLE_PAGE_TYPE = NavPath(TITLE, NAVIGATION_BROWSE, PAGE_TYPE)
+TEXT_RUN_VIDEO_ID = NavPath(TEXT_RUN, NAVIGATION_VIDEO_ID)
+TEXT_RUN_PLAYLIST_ID = NavPath(TEXT_RUN, NAVIGATION_PLAYLIST_ID)
+TEXT_RUN_BROWSE_ID = NavPath(TEXT_RUN, NAVIGATION_BROWSE_ID)
+TEXT_RUNS_LAST_TEXT = NavPath(TEXT_RUNS, [-1, 'text'])
+PLAY_BUTTON_VIDEO_TYPE = NavPath(PLAY_BUTTON, NAVIGATION_VIDEO_TYPE)
+PLAY_BUTTON_VIDEO_ID = NavPath(PLAY_BUTTON, ['playNavigationEndpoint', 'watchEndpoint', 'videoId'])
+PLAY_ENDPOINT_VIDEO_TYPE = NavPath(PLAY_BUTTON, ['playNavigationEndpoint'], NAVIGATION_VIDEO_TYPE)
+ENDPOINT_VIDEO_TYPE = NavPath(['navigationEndpoint'], NAVIGATION_VIDEO_TYPE)
+MENU_VIDEO_TYPE = NavPath(MENU_ITEMS, [0, 'menuNavigationItemRenderer', 'navigationEndpoint'],
+                          NAVIGATION_VIDEO_TYPE)
+FIRST_MENU_SERVICE = NavPath(MENU_ITEMS, [0], MENU_SERVICE)
+LENGTH_TEXT = NavPath(['lengthText'], RUN_TEXT)
+ICON_TYPE = NavPath(['icon', 'iconType'])
+LIBRARY_ADD_TOKEN = NavPath(['defaultServiceEndpoint'], FEEDBACK_TOKEN)
+LIBRARY_REMOVE_TOKEN = NavPath(['toggledServiceEndpoint'], FEEDBACK_TOKEN)
+CUSTOM_INDEX_COLUMN_TEXT = NavPath(['customIndexColumn', 'musicCustomIndexColumnRenderer'],
+                                   TEXT_RUN_TEXT)
 
 
 def nav(root, items, none_if_absent=False):
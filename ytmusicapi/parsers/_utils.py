@@ -1,3 +1,4 @@
+from contextvars import ContextVar
 from functools import wraps
 
 from ytmusicapi.navigation import *
@@ -6,7 +7,7 @@ from ytmusicapi.navigation import *
 def parse_menu_playlists(data, result):
     watch_menu = find_objects_by_key(nav(data, MENU_ITEMS), 'menuNavigationItemRenderer')
     for item in [_x['menuNavigationItemRenderer'] for _x in watch_menu]:
-        icon = nav(item, ['icon', 'iconType'])
+        icon = nav(item, ICON_TYPE)
         if icon == 'MUSIC_SHUFFLE':
             watch_key = 'shuffleId'
         elif icon == 'MIX':
@@ -14,9 +15,9 @@ def parse_menu_playlists(data, result):
         else:
             continue
 
-        watch_id = nav(item, ['navigationEndpoint', 'watchPlaylistEndpoint', 'playlistId'], True)
+        watch_id = nav(item, NAVIGATION_WATCH_PLAYLIST_ID, True)
         if not watch_id:
-            watch_id = nav(item, ['navigationEndpoint', 'watchEndpoint', 'playlistId'], True)
+            watch_id = nav(item, NAVIGATION_PLAYLIST_ID, True)
         if watch_id:
             result[watch_key] = watch_id
 
@@ -31,20 +32,21 @@ def get_item_text(item, index, run_index=0, none_if_absent=False):
 
 
 def get_flex_column_item(item, index):
-    if len(item['flexColumns']) <= index or \
-            'text' not in item['flexColumns'][index]['musicResponsiveListItemFlexColumnRenderer'] or \
-            'runs' not in item['flexColumns'][index]['musicResponsiveListItemFlexColumnRenderer']['text']:
+    if len(item['flexColumns']) <= index:
+        return None
+    column = item['flexColumns'][index]['musicResponsiveListItemFlexColumnRenderer']
+    if 'text' not in column or 'runs' not in column['text']:
         return None
 
-    return item['flexColumns'][index]['musicResponsiveListItemFlexColumnRenderer']
+    return column
 
 
 def get_fixed_column_item(item, index):
-    if 'text' not in item['fixedColumns'][index]['musicResponsiveListItemFixedColumnRenderer'] or \
-            'runs' not in item['fixedColumns'][index]['musicResponsiveListItemFixedColumnRenderer']['text']:
+    column = item['fixedColumns'][index]['musicResponsiveListItemFixedColumnRenderer']
+    if 'text' not in column or 'runs' not in column['text']:
         return None
 
-    return item['fixedColumns'][index]['musicResponsiveListItemFixedColumnRenderer']
+    return column
 
 
 def get_browse_id(item, index):
@@ -71,10 +73,23 @@ def parse_duration(duration):
     return seconds
 
 
+# gettext function of the parser whose i18n method is running in the current context
+_translate = ContextVar('translate', default=None)
+
+
+def _(message):
+    """Translates `message` to the language of the parser method being called."""
+    translate = _translate.get()
+    return translate(message) if translate is not None else message
+
+
 def i18n(method):
     @wraps(method)
     def _impl(self, *method_args, **method_kwargs):
-        method.__globals__['_'] = self.lang.gettext
-        return method(self, *method_args, **method_kwargs)
+        token = _translate.set(self.lang.gettext)
+        try:
+            return method(self, *method_args, **method_kwargs)
+        finally:
+            _translate.reset(token)
 
     return _impl
@@ -1,6 +1,7 @@
 from typing import List, Dict
 from .songs import *
 from ._utils import *
+from ._utils import _
 
 
 class Parser:
@@ -24,7 +25,7 @@ class Parser:
                     data = nav(result, [MTRIR], True)
                     content = None
                     if data:
-                        page_type = nav(data, TITLE + NAVIGATION_BROWSE + PAGE_TYPE, True)
+                        page_type = nav(data, TITLE_PAGE_TYPE, True)
                         if page_type is None:  # song or watch_playlist
                             if nav(data, NAVIGATION_WATCH_PLAYLIST_ID, True) is not None:
                                 content = parse_watch_playlist(data)
@@ -99,13 +100,13 @@ class Parser:
 
             elif resultType == 'video':
                 search_result['views'] = None
-                search_result['videoType'] = nav(data, PLAY_BUTTON + NAVIGATION_VIDEO_TYPE, True)
+                search_result['videoType'] = nav(data, PLAY_BUTTON_VIDEO_TYPE, True)
 
             elif resultType == 'upload':
                 browse_id = nav(data, NAVIGATION_BROWSE_ID, True)
                 if not browse_id:  # song result
                     flex_items = [
-                        nav(get_flex_column_item(data, i), ['text', 'runs'], True)
+                        nav(get_flex_column_item(data, i), TEXT_RUNS, True)
                         for i in range(2)
                     ]
                     if flex_items[0]:
@@ -133,11 +134,8 @@ class Parser:
                         search_result['resultType'] = 'album'
 
             if resultType in ['song', 'video']:
-                search_result['videoId'] = nav(
-                    data, PLAY_BUTTON + ['playNavigationEndpoint', 'watchEndpoint', 'videoId'],
-                    True)
-                search_result['videoType'] = nav(
-                    data, PLAY_BUTTON + ['playNavigationEndpoint'] + NAVIGATION_VIDEO_TYPE, True)
+                search_result['videoId'] = nav(data, PLAY_BUTTON_VIDEO_ID, True)
+                search_result['videoType'] = nav(data, PLAY_ENDPOINT_VIDEO_TYPE, True)
 
             if resultType in ['song', 'video', 'album']:
                 search_result['duration'] = None
@@ -204,7 +202,7 @@ def parse_album(result):
     return {
         'title': nav(result, TITLE_TEXT),
         'year': nav(result, SUBTITLE2, True),
-        'browseId': nav(result, TITLE + NAVIGATION_BROWSE_ID),
+        'browseId': nav(result, TITLE_BROWSE_ID),
         'thumbnails': nav(result, THUMBNAIL_RENDERER),
         'isExplicit': nav(result, SUBTITLE_BADGE_LABEL, True) is not None
     }
@@ -214,7 +212,7 @@ def parse_single(result):
     return {
         'title': nav(result, TITLE_TEXT),
         'year': nav(result, SUBTITLE, True),
-        'browseId': nav(result, TITLE + NAVIGATION_BROWSE_ID),
+        'browseId': nav(result, TITLE_BROWSE_ID),
         'thumbnails': nav(result, THUMBNAIL_RENDERER)
     }
 
@@ -234,7 +232,7 @@ def parse_song_flat(data):
     columns = [get_flex_column_item(data, i) for i in range(0, len(data['flexColumns']))]
     song = {
         'title': nav(columns[0], TEXT_RUN_TEXT),
-        'videoId': nav(columns[0], TEXT_RUN + NAVIGATION_VIDEO_ID, True),
+        'videoId': nav(columns[0], TEXT_RUN_VIDEO_ID, True),
         'artists': parse_song_artists(data, 1),
         'thumbnails': nav(data, THUMBNAILS),
         'isExplicit': nav(data, BADGE_LABEL, True) is not None
@@ -243,10 +241,10 @@ def parse_song_flat(data):
             columns[2], TEXT_RUN):
         song['album'] = {
             'name': nav(columns[2], TEXT_RUN_TEXT),
-            'id': nav(columns[2], TEXT_RUN + NAVIGATION_BROWSE_ID)
+            'id': nav(columns[2], TEXT_RUN_BROWSE_ID)
         }
     else:
-        song['views'] = nav(columns[1], ['text', 'runs', -1, 'text']).split(' ')[0]
+        song['views'] = nav(columns[1], TEXT_RUNS_LAST_TEXT).split(' ')[0]
 
     return song
 
@@ -267,7 +265,7 @@ def parse_video(result):
 def parse_playlist(data):
     playlist = {
         'title': nav(data, TITLE_TEXT),
-        'playlistId': nav(data, TITLE + NAVIGATION_BROWSE_ID)[2:],
+        'playlistId': nav(data, TITLE_BROWSE_ID)[2:],
         'thumbnails': nav(data, THUMBNAIL_RENDERER)
     }
     subtitle = data['subtitle']
@@ -286,7 +284,7 @@ def parse_related_artist(data):
         subscribers = subscribers.split(' ')[0]
     return {
         'title': nav(data, TITLE_TEXT),
-        'browseId': nav(data, TITLE + NAVIGATION_BROWSE_ID),
+        'browseId': nav(data, TITLE_BROWSE_ID),
         'subscribers': subscribers,
         'thumbnails': nav(data, THUMBNAIL_RENDERER),
     }
@@ -32,8 +32,8 @@ def parse_chart_trending(data):
     views = None if index == len(artists) else artists.pop()['name'].split(' ')[0]
     return {
         'title': nav(flex_0, TEXT_RUN_TEXT),
-        'videoId': nav(flex_0, TEXT_RUN + NAVIGATION_VIDEO_ID, True),
-        'playlistId': nav(flex_0, TEXT_RUN + NAVIGATION_PLAYLIST_ID, True),
+        'videoId': nav(flex_0, TEXT_RUN_VIDEO_ID, True),
+        'playlistId': nav(flex_0, TEXT_RUN_PLAYLIST_ID, True),
         'artists': artists,
         'thumbnails': nav(data, THUMBNAILS),
         'views': views
@@ -43,7 +43,7 @@ def parse_chart_trending(data):
 def parse_ranking(data):
     return {
         'rank':
-        nav(data, ['customIndexColumn', 'musicCustomIndexColumnRenderer'] + TEXT_RUN_TEXT),
+        nav(data, CUSTOM_INDEX_COLUMN_TEXT),
         'trend':
         TRENDS[nav(data,
                    ['customIndexColumn', 'musicCustomIndexColumnRenderer', 'icon', 'iconType'])]
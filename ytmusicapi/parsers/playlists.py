@@ -5,6 +5,7 @@ from ._utils import *
 
 def parse_playlist_items(results, menu_entries: List[List] = None):
     songs = []
+    menu_paths = [(entry[-1], NavPath(MENU_ITEMS, entry)) for entry in menu_entries or []]
     count = 1
     for result in results:
         count += 1
@@ -32,10 +33,10 @@ def parse_playlist_items(results, menu_entries: List[List] = None):
                         feedback_tokens = parse_song_menu_tokens(item)
 
             # if item is not playable, the videoId was retrieved above
-            if nav(data, PLAY_BUTTON, none_if_absent=True) != None:
-                if 'playNavigationEndpoint' in nav(data, PLAY_BUTTON):
-                    videoId = nav(data,
-                                  PLAY_BUTTON)['playNavigationEndpoint']['watchEndpoint']['videoId']
+            play_button = nav(data, PLAY_BUTTON, none_if_absent=True)
+            if play_button != None:
+                if 'playNavigationEndpoint' in play_button:
+                    videoId = play_button['playNavigationEndpoint']['watchEndpoint']['videoId']
 
                     if 'menu' in data:
                         like = nav(data, MENU_LIKE_STATUS, True)
@@ -50,10 +51,11 @@ def parse_playlist_items(results, menu_entries: List[List] = None):
 
             duration = None
             if 'fixedColumns' in data:
-                if 'simpleText' in get_fixed_column_item(data, 0)['text']:
-                    duration = get_fixed_column_item(data, 0)['text']['simpleText']
+                duration_text = get_fixed_column_item(data, 0)['text']
+                if 'simpleText' in duration_text:
+                    duration = duration_text['simpleText']
                 else:
-                    duration = get_fixed_column_item(data, 0)['text']['runs'][0]['text']
+                    duration = duration_text['runs'][0]['text']
 
             thumbnails = None
             if 'thumbnail' in data:
@@ -66,7 +68,7 @@ def parse_playlist_items(results, menu_entries: List[List] = None):
 
             isExplicit = nav(data, BADGE_LABEL, True) is not None
 
-            videoType = nav(data, MENU_ITEMS + [0, 'menuNavigationItemRenderer', 'navigationEndpoint'] + NAVIGATION_VIDEO_TYPE, True)
+            videoType = nav(data, MENU_VIDEO_TYPE, True)
 
             song = {
                 'videoId': videoId,
@@ -87,9 +89,8 @@ def parse_playlist_items(results, menu_entries: List[List] = None):
             if feedback_tokens:
                 song['feedbackTokens'] = feedback_tokens
 
-            if menu_entries:
-                for menu_entry in menu_entries:
-                    song[menu_entry[-1]] = nav(data, MENU_ITEMS + menu_entry)
+            for key, path in menu_paths:
+                song[key] = nav(data, path)
 
             songs.append(song)
 
@@ -65,8 +65,8 @@ def parse_song_album(data, index):
 def parse_song_menu_tokens(item):
     toggle_menu = item[TOGGLE_MENU]
     service_type = toggle_menu['defaultIcon']['iconType']
-    library_add_token = nav(toggle_menu, ['defaultServiceEndpoint'] + FEEDBACK_TOKEN, True)
-    library_remove_token = nav(toggle_menu, ['toggledServiceEndpoint'] + FEEDBACK_TOKEN, True)
+    library_add_token = nav(toggle_menu, LIBRARY_ADD_TOKEN, True)
+    library_remove_token = nav(toggle_menu, LIBRARY_REMOVE_TOKEN, True)
 
     if service_type == "LIBRARY_REMOVE":  # swap if already in library
         library_add_token, library_remove_token = library_remove_token, library_add_token
@@ -12,8 +12,7 @@ def parse_uploaded_items(results):
             'confirmDialogEndpoint']['content']['confirmDialogRenderer']['confirmButton'][
                 'buttonRenderer']['command']['musicDeletePrivatelyOwnedEntityCommand']['entityId']
 
-        videoId = nav(data, MENU_ITEMS + [0]
-                      + MENU_SERVICE)['queueAddEndpoint']['queueTarget']['videoId']
+        videoId = nav(data, FIRST_MENU_SERVICE)['queueAddEndpoint']['queueTarget']['videoId']
 
         title = get_item_text(data, 0)
         like = nav(data, MENU_LIKE_STATUS)
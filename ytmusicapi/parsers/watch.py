@@ -30,11 +30,11 @@ def parse_watch_track(data):
     track = {
         'videoId': data['videoId'],
         'title': nav(data, TITLE_TEXT),
-        'length': nav(data, ['lengthText', 'runs', 0, 'text'], True),
+        'length': nav(data, LENGTH_TEXT, True),
         'thumbnail': nav(data, THUMBNAIL),
         'feedbackTokens': feedback_tokens,
         'likeStatus': like_status,
-        'videoType': nav(data, ['navigationEndpoint'] + NAVIGATION_VIDEO_TYPE, True)
+        'videoType': nav(data, ENDPOINT_VIDEO_TYPE, True)
     }
     track.update(song_info)
     return track
@@ -0,0 +1,97 @@
+import threading
+import time
+from typing import Dict, Optional, Union
+
+#: Endpoint classes limited separately, by endpoint. Other endpoints change data and are ``edit``
+ENDPOINT_CLASSES = {
+    'browse': 'browse',
+    'search': 'search',
+    'music/get_search_suggestions': 'search',
+    'next': 'next',
+    'music/get_queue': 'next',
+    'player': 'player',
+}
+
+
+def get_endpoint_class(endpoint: str) -> str:
+    return ENDPOINT_CLASSES.get(endpoint, 'edit')
+
+
+class TokenBucket:
+    """
+    Allows `rate` requests per second on average and bursts of up to `burst` requests.
+    Safe to use from multiple threads, which are served in the order they arrive.
+    """
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Takes a token and returns the seconds to wait until it may be used."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            return max(0.0, -self._tokens / self.rate)
+
+    def acquire(self) -> float:
+        """Blocks until a request may be sent. Returns the seconds waited."""
+        delay = self.reserve()
+        if delay:
+            time.sleep(delay)
+        return delay
+
+
+class RateLimiter:
+    """
+    Limits the rate of requests sent with a token bucket per endpoint class:
+    ``browse``, ``search``, ``next``, ``player`` and ``edit`` for requests changing data.
+
+    A single limiter can be shared by several :class:`YTMusic` instances to limit
+    their combined rate. :class:`YTMusic` waits on the thread sending the request,
+    :class:`AsyncYTMusic` with :py:func:`asyncio.sleep`, so the event loop is never blocked.
+
+    Example::
+
+        limiter = RateLimiter({'browse': 10, 'search': 2, 'edit': 0.5}, burst=5)
+        ytmusic = YTMusic(rate_limiter=limiter)
+    """
+    def __init__(self, rates: Union[float, Dict[str, float]], burst: int = 1):
+        """
+        :param rates: Requests per second allowed for each endpoint class, or for each class
+            if a single number is given. Classes without a rate are not limited.
+        :param burst: Number of requests which may be sent at once after a pause. Default: 1
+        """
+        if not isinstance(rates, dict):
+            rates = dict.fromkeys(set(ENDPOINT_CLASSES.values()) | {'edit'}, rates)
+        self.buckets = {
+            endpoint_class: TokenBucket(rate, burst)
+            for endpoint_class, rate in rates.items()
+        }
+
+    def get_bucket(self, endpoint: str) -> Optional[TokenBucket]:
+        return self.buckets.get(get_endpoint_class(endpoint))
+
+    def reserve(self, endpoint: str) -> float:
+        """
+        Takes a token for a request to `endpoint` without waiting for it.
+
+        :param endpoint: API endpoint such as ``browse``
+        :return: Seconds to wait before sending the request
+        """
+        bucket = self.get_bucket(endpoint)
+        return bucket.reserve() if bucket is not None else 0.0
+
+    def acquire(self, endpoint: str) -> float:
+        """
+        Blocks until a request to `endpoint` may be sent.
+
+        :param endpoint: API endpoint such as ``browse``
+        :return: Seconds waited
+        """
+        bucket = self.get_bucket(endpoint)
+        return bucket.acquire() if bucket is not None else 0.0
@@ -0,0 +1,92 @@
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import Iterable, Optional
+
+import requests
+
+#: Endpoints which only read data and are therefore safe to send again
+IDEMPOTENT_ENDPOINTS = {
+    'browse', 'search', 'next', 'player', 'music/get_queue', 'music/get_search_suggestions'
+}
+
+#: HTTP statuses of transient errors
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+def get_retry_after(response) -> Optional[float]:
+    """Returns the seconds to wait given by the Retry-After header of a response, if any."""
+    value = response.headers.get('Retry-After') if response.headers else None
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class RetryPolicy:
+    """
+    Decides whether and when a failed request is sent again.
+
+    Requests failing with a transient HTTP status or a connection error are retried after
+    an exponentially growing delay with full jitter, or after the delay given by the server
+    in a Retry-After header.
+    """
+    def __init__(self,
+                 max_attempts: int = 3,
+                 backoff: float = 0.5,
+                 max_backoff: float = 30,
+                 max_retry_after: float = 60,
+                 statuses: Iterable[int] = RETRY_STATUSES,
+                 idempotent_only: bool = True,
+                 exceptions: tuple = (requests.exceptions.ConnectionError,
+                                      requests.exceptions.Timeout)):
+        """
+        :param max_attempts: Maximum number of times a request is sent. 1 disables retries.
+            Default: 3
+        :param backoff: Maximum delay in seconds before the first retry.
+            It doubles with each further retry. Default: 0.5
+        :param max_backoff: Upper limit of the delay in seconds. Default: 30
+        :param max_retry_after: Longest delay in seconds requested by the server with
+            Retry-After which is waited for. Requests asking for longer delays fail immediately.
+            Default: 60
+        :param statuses: HTTP statuses to retry. Default: 429, 500, 502, 503 and 504
+        :param idempotent_only: Only retry requests to the read-only
+            :py:data:`IDEMPOTENT_ENDPOINTS` and GET requests, so that library changes
+            are never applied twice. Default: True
+        :param exceptions: Exceptions raised by the session on which to retry.
+            Default: connection errors and timeouts
+        """
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.max_retry_after = max_retry_after
+        self.statuses = set(statuses)
+        self.idempotent_only = idempotent_only
+        self.exceptions = exceptions
+
+    def is_idempotent(self, endpoint: str) -> bool:
+        return endpoint in IDEMPOTENT_ENDPOINTS
+
+    def get_delay(self, attempt: int, idempotent: bool, response=None) -> Optional[float]:
+        """
+        Returns the seconds to wait before sending a request again, or None to give up.
+
+        :param attempt: Number of times the request has been sent
+        :param idempotent: Whether the request is safe to send again
+        :param response: The error response, or None if the request raised an exception
+        """
+        if attempt >= self.max_attempts or (self.idempotent_only and not idempotent):
+            return None
+        if response is not None:
+            if response.status_code not in self.statuses:
+                return None
+            retry_after = get_retry_after(response)
+            if retry_after is not None:
+                return retry_after if retry_after <= self.max_retry_after else None
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2**(attempt - 1)))
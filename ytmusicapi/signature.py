@@ -0,0 +1,122 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Tuple
+
+from ytmusicapi.singleflight import SingleFlight
+
+
+class SignatureTimestampCache:
+    """
+    Stores the signatureTimestamp of the YouTube Music player script ``base.js``, which
+    :py:func:`get_song` sends to receive valid streaming URLs.
+
+    The timestamp is stored per URL of the script, which changes when a new player is
+    released. The URL of the current script is looked up again once it is older than `ttl`.
+    By default, all instances in a process share a cache.
+
+    Example::
+
+        ytmusic = YTMusic(signature_cache=SignatureTimestampCache(ttl=6 * 3600))
+    """
+    def __init__(self, ttl: float = 3600, refresh_in_background: bool = True, max_urls: int = 8):
+        """
+        :param ttl: Optional. Seconds after which the URL of the current ``base.js``
+            is looked up again. Default: 3600
+        :param refresh_in_background: Optional. Whether to keep using an expired URL
+            and its timestamp while a background thread looks up the current ones,
+            so that only the first call waits for them. Default: True
+        :param max_urls: Optional. Number of timestamps of ``base.js`` URLs to keep. Default: 8
+        """
+        self.ttl = ttl
+        self.refresh_in_background = refresh_in_background
+        self.max_urls = max_urls
+        self._urls: Dict[str, Tuple[str, float]] = {}
+        self._timestamps: OrderedDict = OrderedDict()
+        self._refreshing = set()
+        self._lock = threading.Lock()
+        self._single_flight = SingleFlight()
+
+    def get(self, key: str, get_url: Callable[[], str],
+            get_timestamp: Callable[[str], int]) -> int:
+        """
+        Returns the signatureTimestamp of the current ``base.js``.
+
+        :param key: Server the script is loaded from
+        :param get_url: Function returning the URL of the current ``base.js``
+        :param get_timestamp: Function returning the timestamp of the ``base.js`` at a URL
+        """
+        with self._lock:
+            entry = self._urls.get(key)
+        if entry is None:
+            url = self._load_url(key, get_url)
+        else:
+            url, updated = entry
+            if time.monotonic() - updated >= self.ttl:
+                if self.refresh_in_background:
+                    self._refresh_in_background(key, url, get_url, get_timestamp)
+                else:
+                    url = self._load_url(key, get_url)
+        return self.get_timestamp(url, get_timestamp)
+
+    def get_timestamp(self, url: str, get_timestamp: Callable[[str], int]) -> int:
+        """Returns the signatureTimestamp of the ``base.js`` at `url`, loading it if unknown."""
+        with self._lock:
+            timestamp = self._timestamps.get(url)
+            if timestamp is not None:
+                self._timestamps.move_to_end(url)
+                return timestamp
+
+        def load():
+            timestamp = get_timestamp(url)
+            with self._lock:
+                self._timestamps[url] = timestamp
+                while len(self._timestamps) > self.max_urls:
+                    self._timestamps.popitem(last=False)
+            return timestamp
+
+        timestamp, _ = self._single_flight.do('timestamp:' + url, load)
+        return timestamp
+
+    def clear(self):
+        with self._lock:
+            self._urls.clear()
+            self._timestamps.clear()
+
+    def _load_url(self, key: str, get_url: Callable[[], str]) -> str:
+        def load():
+            url = get_url()
+            with self._lock:
+                self._urls[key] = url, time.monotonic()
+            return url
+
+        url, _ = self._single_flight.do('url:' + key, load)
+        return url
+
+    def _refresh_in_background(self, key: str, url: str, get_url: Callable[[], str],
+                               get_timestamp: Callable[[str], int]):
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def refresh():
+            current_url = url
+            try:
+                # the new script is only used once its timestamp is known
+                new_url = get_url()
+                self.get_timestamp(new_url, get_timestamp)
+                current_url = new_url
+            except Exception:
+                pass  # keep the current script until the next lookup is due
+            finally:
+                with self._lock:
+                    self._urls[key] = current_url, time.monotonic()
+                    self._refreshing.discard(key)
+
+        threading.Thread(target=refresh, name='ytmusicapi-signature-refresh',
+                         daemon=True).start()
+
+
+#: Cache used by instances created without a `signature_cache`
+DEFAULT_SIGNATURE_CACHE = SignatureTimestampCache()
@@ -0,0 +1,88 @@
+import sys
+import threading
+from typing import Any, Callable, Dict, Tuple
+
+from ytmusicapi import greenlets
+
+
+class _Flight:
+    def __init__(self):
+        self.done = threading.Event()
+        self.thread = threading.get_ident()
+        self.greenlet = greenlets.current()
+        self.futures = []
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Runs a function once for concurrent callers asking for the same key.
+    Callers arriving while the function runs wait for it and receive the same result,
+    or the same exception. Safe to use from multiple threads.
+
+    Calls of :class:`AsyncYTMusic` wait for the result without blocking the event loop,
+    so coroutines on the same loop share results as well.
+    """
+    def __init__(self):
+        self._flights: Dict[str, _Flight] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: str, func: Callable[[], Any]) -> Tuple[Any, bool]:
+        """
+        Calls `func` unless a call for `key` is in flight, in which case its result is awaited.
+
+        :return: The result and whether it was shared with another caller
+        """
+        future = None
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+            elif greenlets.in_call() and greenlets.current() is not flight.greenlet:
+                import asyncio
+
+                future = asyncio.get_running_loop().create_future()
+                flight.futures.append(future)
+
+        if not leader:
+            if future is None and flight.thread == threading.get_ident():
+                # called again from within func, where waiting would deadlock
+                return func(), False
+            if future is not None:
+                greenlets.wait(future)
+            else:
+                flight.done.wait()
+            if _was_cancelled(flight):
+                # the task of the caller running func was cancelled, not this one
+                return self.do(key, func)
+            if flight.error is not None:
+                raise flight.error
+            return flight.result, True
+
+        try:
+            flight.result = func()
+            return flight.result, False
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+            for future in flight.futures:
+                future.get_loop().call_soon_threadsafe(_resolve, future)
+
+    def __len__(self):
+        return len(self._flights)
+
+
+def _resolve(future):
+    if not future.cancelled():
+        future.set_result(None)
+
+
+def _was_cancelled(flight: _Flight) -> bool:
+    asyncio = sys.modules.get('asyncio')
+    return asyncio is not None and isinstance(flight.error, asyncio.CancelledError)
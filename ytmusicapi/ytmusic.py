@@ -1,12 +1,23 @@
 import requests
-import gettext
 import os
+import threading
+import time
+from requests.adapters import HTTPAdapter
 from requests.structures import CaseInsensitiveDict
 from functools import partial
 from contextlib import suppress
-from typing import Dict
+from typing import Callable, Dict, List, Union
 from ytmusicapi.helpers import *
-from ytmusicapi.parsers import browsing
+from ytmusicapi.bootstrap import BootstrapCache, DEFAULT_BOOTSTRAP_CACHE, is_rejected
+from ytmusicapi.signature import SignatureTimestampCache, DEFAULT_SIGNATURE_CACHE
+from ytmusicapi.cache import ResponseCache, get_cache_kind, get_cache_key
+from ytmusicapi.decoder import get_decoder
+from ytmusicapi.exceptions import get_http_error
+from ytmusicapi.instrumentation import RequestEvent, get_current_call, observed
+from ytmusicapi.ratelimit import RateLimiter
+from ytmusicapi.retry import RetryPolicy, get_retry_after
+from ytmusicapi.singleflight import SingleFlight
+from ytmusicapi.languages import get_parser, get_supported_languages, is_supported_language
 from ytmusicapi.setup import setup
 from ytmusicapi.mixins.browsing import BrowsingMixin
 from ytmusicapi.mixins.search import SearchMixin
@@ -24,13 +35,35 @@ class YTMusic(BrowsingMixin, SearchMixin, WatchMixin, ExploreMixin, LibraryMixin
     Allows automated interactions with YouTube Music by emulating the YouTube web client's requests.
     Permits both authenticated and non-authenticated requests.
     Authentication header data must be provided on initialization.
+
+    An instance can be shared by multiple threads. Requests are built without modifying
+    the instance, and connections are pooled; set `pool_maxsize` to the number of threads.
     """
     def __init__(self,
                  auth: str = None,
                  user: str = None,
                  requests_session=True,
                  proxies: dict = None,
-                 language: str = 'en'):
+                 language: str = 'en',
+                 compress_requests: bool = True,
+                 compression_threshold: int = 512,
+                 cache: ResponseCache = None,
+                 base_url: str = YTM_DOMAIN,
+                 observers: List[Callable] = None,
+                 json_decoder: Union[str, Callable] = None,
+                 pool_maxsize: int = 10,
+                 pool_connections: int = 10,
+                 connect_timeout: float = 30,
+                 read_timeout: float = 30,
+                 keep_alive: bool = True,
+                 retry_policy: RetryPolicy = None,
+                 rate_limiter: RateLimiter = None,
+                 coalesce_requests: bool = True,
+                 prefetch_continuations: bool = False,
+                 visitor_id: str = None,
+                 lazy: bool = False,
+                 bootstrap_cache: BootstrapCache = None,
+                 signature_cache: SignatureTimestampCache = None):
         """
         Create a new instance to interact with YouTube Music.
 
@@ -45,8 +78,9 @@ class YTMusic(BrowsingMixin, SearchMixin, WatchMixin, ExploreMixin, LibraryMixin
           by going to https://myaccount.google.com/brandaccounts and selecting your brand account.
           The user ID will be in the URL: https://myaccount.google.com/b/user_id/
         :param requests_session: A Requests session object or a truthy value to create one.
-          Default sessions have a request timeout of 30s, which produces a requests.exceptions.ReadTimeout.
-          The timeout can be changed by passing your own Session object::
+          Default sessions are configured by `pool_maxsize`, `pool_connections`,
+          `connect_timeout`, `read_timeout` and `keep_alive`.
+          Other settings can be changed by passing your own Session object::
 
             s = requests.Session()
             s.request = functools.partial(s.request, timeout=3)
@@ -63,19 +97,98 @@ class YTMusic(BrowsingMixin, SearchMixin, WatchMixin, ExploreMixin, LibraryMixin
         :param language: Optional. Can be used to change the language of returned data.
             English will be used by default. Available languages can be checked in
             the ytmusicapi/locales directory.
+        :param compress_requests: Optional. Whether to gzip-compress request bodies
+            which are larger than `compression_threshold`. Default: True
+        :param compression_threshold: Optional. Minimum size in bytes of the JSON request body
+            for it to be compressed. Default: 512
+        :param cache: Optional. A :py:class:`ResponseCache` such as :py:class:`MemoryCache`
+            or :py:class:`SQLiteCache` to store responses of read-only requests like
+            :py:func:`get_album`, :py:func:`get_artist` or :py:func:`get_playlist`.
+            Default: No caching
+        :param base_url: Optional. URL of the YouTube Music server. Can be pointed at a local
+            stand-in such as ``benchmarks/replay_server.py`` for testing.
+            Default: https://music.youtube.com
+        :param observers: Optional. Functions called with a :py:class:`RequestEvent` for each
+            request and a :py:class:`CallEvent` for each method call. See :py:func:`add_observer`
+        :param json_decoder: Optional. JSON decoder for responses: ``orjson``, ``simdjson``,
+            ``json`` or a function parsing bytes. Responses are parsed from bytes
+            without decoding them to text first.
+            Default: ``orjson`` or ``simdjson`` if installed, else the standard library
+        :param pool_maxsize: Optional. Maximum number of connections per host kept open by the
+            session created by this instance. Should be at least the number of threads sharing
+            the instance, so they don't wait for or reopen connections. Default: 10
+        :param pool_connections: Optional. Number of hosts to keep connection pools for.
+            Default: 10
+        :param connect_timeout: Optional. Seconds to wait for a connection to be established,
+            after which a requests.exceptions.ConnectTimeout is raised. Default: 30
+        :param read_timeout: Optional. Seconds to wait for the server to send data,
+            after which a requests.exceptions.ReadTimeout is raised. Default: 30
+        :param keep_alive: Optional. Whether to keep connections open for reuse by later
+            requests, which avoids a new TLS handshake per request. Default: True
+        :param retry_policy: Optional. A :py:class:`RetryPolicy` deciding which failed requests
+            are sent again and when. Pass ``RetryPolicy(max_attempts=1)`` to disable retries.
+            Default: Read-only requests failing with status 429 or 5xx or a connection error
+            are sent up to 3 times, waiting for the delay given in a Retry-After header
+            or a jittered exponential backoff
+        :param rate_limiter: Optional. A :py:class:`RateLimiter` which delays requests to stay
+            within a number of requests per second for each kind of endpoint.
+            Time spent waiting is included in the ``wait_time`` reported to observers.
+            Default: No limit
+        :param coalesce_requests: Optional. Whether identical read-only requests sent at the same
+            time by multiple threads, or by coroutines of :py:class:`AsyncYTMusic`, share a single
+            round trip. Each caller receives its own copy of the response. Default: True
+        :param prefetch_continuations: Optional. Whether to request the next page of long
+            results such as playlists, library contents and search results in the background
+            while the current page is parsed, which overlaps network and parsing time.
+            When a `limit` is reached, one page may have been requested in vain. Default: False
+        :param visitor_id: Optional. Visitor id sent with unauthenticated requests, for example
+            a previous value of :py:attr:`visitor_id`. Saves loading the YouTube Music start page,
+            which is otherwise cached by a :py:class:`SQLiteCache`.
+            Default: Read from the start page
+        :param lazy: Optional. Whether to defer loading the visitor id, setting the locale and
+            loading translations until the first request, so that creating an instance
+            is fast and does not send requests. Default: False
+        :param bootstrap_cache: Optional. A :py:class:`BootstrapCache` storing the visitor id
+            and client version read from the YouTube Music start page, which is only loaded
+            again once they are older than its `max_age` or the server rejects them.
+            Pass one with a `path` to share them between processes.
+            Default: A cache shared by all instances in the process
+        :param signature_cache: Optional. A :py:class:`SignatureTimestampCache` storing the
+            signatureTimestamp used by :py:func:`get_song`, so that the multi-megabyte player
+            script is only fetched when a new one is released.
+            Default: A cache shared by all instances in the process
         """
+        self._observers = list(observers or [])
         self.auth = auth
 
-        if isinstance(requests_session, requests.Session):
+        if isinstance(requests_session, requests.Session) or hasattr(requests_session, 'request'):
             self._session = requests_session
         else:
             if requests_session:  # Build a new session.
                 self._session = requests.Session()
-                self._session.request = partial(self._session.request, timeout=30)
+                self._session.request = partial(self._session.request,
+                                                timeout=(connect_timeout, read_timeout))
+                adapter = HTTPAdapter(pool_connections=pool_connections,
+                                      pool_maxsize=pool_maxsize)
+                self._session.mount('https://', adapter)
+                self._session.mount('http://', adapter)
+                if not keep_alive:
+                    self._session.headers['Connection'] = 'close'
             else:  # Use the Requests API module as a "session".
                 self._session = requests.api
 
         self.proxies = proxies
+        self.compression_threshold = compression_threshold if compress_requests else None
+        self.cache = cache
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.rate_limiter = rate_limiter
+        self._single_flight = SingleFlight() if coalesce_requests else None
+        self.prefetch_continuations = prefetch_continuations
+        self.bootstrap_cache = bootstrap_cache or DEFAULT_BOOTSTRAP_CACHE
+        self._bootstrap = None
+        self.signature_cache = signature_cache or DEFAULT_SIGNATURE_CACHE
+        self.base_url = base_url.rstrip('/')
+        self._json_decoder = get_decoder(json_decoder)
         self.cookies = {'CONSENT': 'YES+1'}
 
         # prepare headers
@@ -94,65 +207,327 @@ class YTMusic(BrowsingMixin, SearchMixin, WatchMixin, ExploreMixin, LibraryMixin
                     "Reason: " + str(e))
 
         else:  # no authentication
-            self.headers = initialize_headers()
+            self.headers = CaseInsensitiveDict(initialize_headers())
 
-        if 'x-goog-visitor-id' not in self.headers:
-            self.headers.update(get_visitor_id(self._send_get_request))
+        # verify authentication credentials work
+        if auth:
+            try:
+                cookie = self.headers.get('cookie')
+                self.sapisid = sapisid_from_cookie(cookie)
+            except KeyError:
+                raise Exception("Your cookie is missing the required value __Secure-3PAPISID")
+
+        if visitor_id:
+            self.headers['X-Goog-Visitor-Id'] = visitor_id
 
         # prepare context
         self.context = initialize_context()
         self.context['context']['client']['hl'] = language
-        locale_dir = os.path.abspath(os.path.dirname(__file__)) + os.sep + 'locales'
-        supported_languages = [f for f in next(os.walk(locale_dir))[1]]
-        if language not in supported_languages:
+        if not is_supported_language(language):
             raise Exception("Language not supported. Supported languages are " +
-                            (', '.join(supported_languages)) + ".")
+                            (', '.join(get_supported_languages())) + ".")
         self.language = language
-        try:
-            locale.setlocale(locale.LC_ALL, self.language)
-        except locale.Error:
-            with suppress(locale.Error):
-                locale.setlocale(locale.LC_ALL, 'en_US.UTF-8')
-        self.lang = gettext.translation('base', localedir=locale_dir, languages=[language])
-        self.parser = browsing.Parser(self.lang)
 
         if user:
             self.context['context']['user']['onBehalfOfUser'] = user
 
-        # verify authentication credentials work
-        if auth:
+        self._initialized = False
+        self._initialize_lock = threading.Lock()
+        if not lazy:
+            self._initialize()
+
+    def _initialize(self):
+        """Loads the visitor id, locale and translations. Called by the first request if lazy."""
+        with self._initialize_lock:
+            if self._initialized:
+                return
+            if 'x-goog-visitor-id' not in self.headers:
+                self._apply_bootstrap(
+                    self.bootstrap_cache.get(self._get_bootstrap_key(), self._load_bootstrap))
             try:
-                cookie = self.headers.get('cookie')
-                self.sapisid = sapisid_from_cookie(cookie)
-            except KeyError:
-                raise Exception("Your cookie is missing the required value __Secure-3PAPISID")
+                locale.setlocale(locale.LC_ALL, self.language)
+            except locale.Error:
+                with suppress(locale.Error):
+                    locale.setlocale(locale.LC_ALL, 'en_US.UTF-8')
+            self.parser = get_parser(self.language)
+            self.lang = self.parser.lang
+            self._initialized = True
 
-    def _send_request(self, endpoint: str, body: Dict, additionalParams: str = "") -> Dict:
-        body.update(self.context)
+    def _get_bootstrap_key(self) -> str:
         if self.auth:
-            origin = self.headers.get('origin', self.headers.get('x-origin'))
-            self.headers["Authorization"] = get_authorization(self.sapisid + ' ' + origin)
-        response = self._session.post(YTM_BASE_API + endpoint + YTM_PARAMS + additionalParams,
-                                      json=body,
-                                      headers=self.headers,
-                                      proxies=self.proxies,
-                                      cookies=self.cookies)
-        response_text = json.loads(response.text)
+            return self.base_url + ':' + sha1(self.sapisid.encode('utf-8')).hexdigest()
+        return self.base_url
+
+    def _load_bootstrap(self) -> Dict:
+        ytcfg = get_ytcfg(self._send_get_request)
+        return {
+            'visitor_id': ytcfg.get('VISITOR_DATA', ""),
+            'client_version': ytcfg.get('INNERTUBE_CLIENT_VERSION')
+        }
+
+    def _apply_bootstrap(self, bootstrap: Dict):
+        self.headers['X-Goog-Visitor-Id'] = bootstrap['visitor_id']
+        if bootstrap['client_version']:
+            # replaced rather than changed, as requests in other threads may be reading it
+            client = dict(self.context['context']['client'],
+                          clientVersion=bootstrap['client_version'])
+            self.context = {'context': dict(self.context['context'], client=client)}
+        self._bootstrap = bootstrap
+
+    def _refresh_bootstrap(self, rejected: bool = False) -> bool:
+        """
+        Loads the visitor id and client version again if they expired or were rejected.
+
+        :return: Whether they changed
+        """
+        key = self._get_bootstrap_key()
+        if rejected:
+            bootstrap = self.bootstrap_cache.refresh(key, self._load_bootstrap, self._bootstrap)
+        else:
+            bootstrap = self.bootstrap_cache.get(key, self._load_bootstrap)
+        if bootstrap is None or bootstrap is self._bootstrap:
+            return False
+        self._apply_bootstrap(bootstrap)
+        return True
+
+    @property
+    def visitor_id(self) -> str:
+        """Visitor id sent with requests. Can be passed to new instances to skip loading it."""
+        if not self._initialized:
+            self._initialize()
+        return self.headers.get('x-goog-visitor-id')
+
+    def _send_request(self,
+                      endpoint: str,
+                      body: Dict,
+                      additionalParams: str = "",
+                      resend_if_rejected: bool = True) -> Dict:
+        if not self._initialized:
+            self._initialize()
+        if self._bootstrap is not None and self.bootstrap_cache.is_expired(self._bootstrap):
+            self._refresh_bootstrap()
+        body = dict(body, **self.context)
+        event = None
+        if self._observers:
+            event = self._create_event('POST', endpoint, body, additionalParams)
+        ttl = None
+        if self.cache is not None:
+            kind = get_cache_kind(endpoint, body, bool(self.auth))
+            ttl = self.cache.get_ttl(kind) if kind else None
+        if ttl:
+            key = get_cache_key(endpoint, body, additionalParams,
+                                self.sapisid if self.auth else None)
+            content = self.cache.get(key)
+            if content is not None:
+                response_json = self._decode(content, event)
+                if event is not None:
+                    event.cached = True
+                    event.bytes_in = len(content)
+                    self._emit(event)
+                return response_json
+
+        data, compressed = encode_body(body, self.compression_threshold)
+        headers = self._prepare_headers()
+        headers['content-type'] = 'application/json'
+        if compressed:
+            headers['content-encoding'] = 'gzip'
+        else:
+            headers.pop('content-encoding', None)
+        url = self.base_url + YTM_API_PATH + endpoint + YTM_PARAMS + additionalParams
+        idempotent = self.retry_policy.is_idempotent(endpoint)
+        send = partial(self._send_with_retry,
+                       partial(self._session.post,
+                               url,
+                               data=data,
+                               headers=headers,
+                               proxies=self.proxies,
+                               cookies=self.cookies), idempotent, event, endpoint)
+        if self._single_flight is not None and idempotent:
+            # concurrent callers share the raw response and decode it separately
+            if not ttl:
+                key = get_cache_key(endpoint, body, additionalParams,
+                                    self.sapisid if self.auth else None)
+            start = time.perf_counter()
+            response, shared = self._single_flight.do(key, send)
+            if shared and event is not None:
+                event.coalesced = True
+                event.record_response(response, time.perf_counter() - start)
+        else:
+            response = send()
+        if event is not None:
+            event.bytes_out = len(data)
         if response.status_code >= 400:
-            message = "Server returned HTTP " + str(
-                response.status_code) + ": " + response.reason + ".\n"
-            error = response_text.get('error', {}).get('message')
-            raise Exception(message + error)
+            if event is not None:
+                self._emit(event)
+            # sent once more if the visitor id or client version it was sent with are outdated
+            if (resend_if_rejected and self._bootstrap is not None
+                    and (idempotent or not self.retry_policy.idempotent_only)
+                    and is_rejected(response.status_code, self._get_error(response))
+                    and self._refresh_bootstrap(rejected=True)):
+                return self._send_request(endpoint,
+                                          body,
+                                          additionalParams,
+                                          resend_if_rejected=False)
+            self._raise_for_status(response)
+        response_text = self._decode(response.content, event)
+        if event is not None:
+            self._emit(event)
+        if ttl:
+            self.cache.set(key, response.content, ttl)
         return response_text
 
     def _send_get_request(self, url: str, params: Dict = None):
-        response = self._session.get(url,
-                                     params=params,
-                                     headers=self.headers,
-                                     proxies=self.proxies,
-                                     cookies=self.cookies)
+        event = None
+        if self._observers:
+            event = self._create_event('GET', url, params or {})
+        ttl = None
+        if self.cache is not None:
+            kind = get_cache_kind(url, params, bool(self.auth))
+            ttl = self.cache.get_ttl(kind) if kind else None
+        if ttl:
+            key = get_cache_key(url, params or {}, identity=self.sapisid if self.auth else None)
+            content = self.cache.get(key)
+            if content is not None:
+                if event is not None:
+                    event.cached = True
+                    event.bytes_in = len(content)
+                    self._emit(event)
+                return content.decode('utf-8')
+
+        if url.startswith(YTM_DOMAIN):
+            url = self.base_url + url[len(YTM_DOMAIN):]
+        response = self._send_with_retry(
+            partial(self._session.get,
+                    url,
+                    params=params,
+                    headers=self.headers,
+                    proxies=self.proxies,
+                    cookies=self.cookies), True, event)
+        if event is not None:
+            self._emit(event)
+        if ttl and response.status_code == 200:
+            self.cache.set(key, response.content, ttl)
         return response.text
 
+    def _send_with_retry(self,
+                         send: Callable,
+                         idempotent: bool,
+                         event: RequestEvent = None,
+                         endpoint: str = None) -> requests.Response:
+        """
+        Calls `send` until it returns a response which the retry policy accepts.
+        API requests to `endpoint` wait for the rate limiter before each attempt.
+        """
+        attempt = 1
+        while True:
+            if endpoint is not None and self.rate_limiter is not None:
+                wait_time = self.rate_limiter.reserve(endpoint)
+                if wait_time:
+                    self._sleep(wait_time)
+                if event is not None:
+                    event.wait_time += wait_time
+            start = time.perf_counter()
+            try:
+                response = send()
+            except self.retry_policy.exceptions:
+                delay = self.retry_policy.get_delay(attempt, idempotent)
+                if delay is None:
+                    raise
+            else:
+                if event is not None:
+                    event.record_response(response, time.perf_counter() - start)
+                if response.status_code < 400:
+                    return response
+                delay = self.retry_policy.get_delay(attempt, idempotent, response)
+                if delay is None:
+                    return response
+            if event is not None:
+                event.retries += 1
+                event.wait_time += delay
+            self._sleep(delay)
+            attempt += 1
+
+    def _sleep(self, seconds: float):
+        """Waits between attempts and for the rate limiter. Overridden by AsyncYTMusic."""
+        time.sleep(seconds)
+
+    def _get_error(self, response: requests.Response) -> Dict:
+        """Returns the ``error`` object of an error response, or an empty dict if it has none."""
+        try:
+            error = self._json_decoder(response.content).get('error', {})
+        except (ValueError, AttributeError):
+            return {}
+        return error if isinstance(error, dict) else {}
+
+    def _raise_for_status(self, response: requests.Response):
+        raise get_http_error(response.status_code, response.reason,
+                             self._get_error(response).get('message'),
+                             get_retry_after(response))
+
+    def _prepare_headers(self) -> CaseInsensitiveDict:
+        """Returns a copy of the headers for a single request, including its authorization."""
+        headers = self.headers.copy()
+        if self.auth:
+            origin = headers.get('origin', headers.get('x-origin'))
+            headers["Authorization"] = get_authorization(self.sapisid + ' ' + origin)
+        return headers
+
+    def _decode(self, content: bytes, event: RequestEvent = None) -> Dict:
+        start = time.perf_counter()
+        response = self._json_decoder(content)
+        if event is not None:
+            event.decode_time = time.perf_counter() - start
+        return response
+
+    def _create_event(self, method: str, endpoint: str, body: Dict,
+                      additionalParams: str = "") -> RequestEvent:
+        call = get_current_call(self)
+        page = 0
+        if additionalParams:
+            page = None
+            if call is not None:
+                page = call.add_page()
+        return RequestEvent(method, endpoint, body.get('browseId'),
+                            get_cache_kind(endpoint, body, bool(self.auth)),
+                            call.name if call is not None else None, page)
+
+    def _emit(self, event: RequestEvent):
+        call = get_current_call(self)
+        if call is not None:
+            call.add(event)
+        self._notify(event)
+
+    def _notify(self, event):
+        for observer in self._observers:
+            observer(event)
+
+    def add_observer(self, observer: Callable):
+        """
+        Register a function to be called with an event for each request and method call,
+        for example to export timings and sizes to a metrics system.
+
+        A :py:class:`RequestEvent` describes a request: endpoint, browseId and kind, status,
+        bytes sent and received, time to first byte, total and JSON decode time, and the
+        continuation page. A :py:class:`CallEvent` is emitted when a method such as
+        :py:func:`get_playlist` returns, with the time spent parsing. Both have an ``as_dict``
+        method. Observers are called on the thread which sent the request.
+
+        Example::
+
+            ytmusic.add_observer(lambda event: print(event.as_dict()))
+
+        :param observer: Function taking a single event argument
+        """
+        self._observers.append(observer)
+
+    def remove_observer(self, observer: Callable):
+        """
+        Unregister a function registered with :py:func:`add_observer`.
+
+        :param observer: The registered function
+        """
+        self._observers.remove(observer)
+
     def _check_auth(self):
         if not self.auth:
             raise Exception("Please provide authentication before using this function")
@@ -175,3 +550,11 @@ class YTMusic(BrowsingMixin, SearchMixin, WatchMixin, ExploreMixin, LibraryMixin
 
     def __exit__(self, execType=None, execValue=None, trackback=None):
         pass
+
+
+# emit a CallEvent for every public method returning a result
+for _name in dir(YTMusic):
+    if not _name.startswith(('_', 'iter_')) and _name not in [
+            'setup', 'add_observer', 'remove_observer'
+    ] and callable(getattr(YTMusic, _name)):
+        setattr(YTMusic, _name, observed(getattr(YTMusic, _name)))